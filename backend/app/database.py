@@ -1,42 +1,70 @@
 """Database configuration and session management."""
 
 import os
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
-from sqlalchemy import text
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import event
+from sqlmodel import Session, create_engine
 
 DB_DIR = Path(os.getenv("DB_PATH", str(Path(__file__).resolve().parent.parent.parent / "data")))
 DB_DIR.mkdir(parents=True, exist_ok=True)
 sqlite_file = DB_DIR / "devquest.db"
 sqlite_url = f"sqlite:///{sqlite_file}"
 
-connect_args = {"check_same_thread": False}
+STARTUP_LOCK_TIMEOUT_SECONDS = 120.0
+
+# `timeout` is SQLite's busy timeout: with several worker processes a writer
+# waits for the lock instead of failing with "database is locked".
+connect_args = {"check_same_thread": False, "timeout": 15}
 engine = create_engine(sqlite_url, connect_args=connect_args)
 
 
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection, _connection_record):
+    # WAL lets readers in every worker proceed while one process writes.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+@contextmanager
+def startup_lock() -> Iterator[None]:
+    """Serialize boot-time work (migrations, seeding) across worker processes.
+
+    Holds an exclusive lock on a small side file, so with N workers the first
+    one migrates and seeds while the rest wait and then find nothing to do.
+    """
+    connection = sqlite3.connect(DB_DIR / "startup.lock", timeout=STARTUP_LOCK_TIMEOUT_SECONDS, isolation_level=None)
+    try:
+        connection.execute("BEGIN EXCLUSIVE")
+        try:
+            yield
+        finally:
+            connection.execute("ROLLBACK")
+    finally:
+        connection.close()
+
+
 def create_db_and_tables():
-    from app.models import Achievement, ActivityLog, BlogPost, ChatMessage, CVAnalysis, PlayerProfile, Skill  # noqa: F401
-
-    SQLModel.metadata.create_all(engine)
-    _ensure_chatmessage_session_schema()
-
-
-def _ensure_chatmessage_session_schema() -> None:
-    """Add ChatMessage.session_id column/index for existing SQLite databases."""
-    with engine.begin() as connection:
-        rows = connection.execute(text("PRAGMA table_info(chatmessage)")).fetchall()
-        existing_columns = {str(row[1]) for row in rows}
-        if "session_id" not in existing_columns:
-            connection.execute(
-                text("ALTER TABLE chatmessage ADD COLUMN session_id TEXT NOT NULL DEFAULT ''")
-            )
-        connection.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS ix_chatmessage_session_id "
-                "ON chatmessage (session_id)"
-            )
+    """Bring the schema to the latest migration version.
+
+    A database that is already current costs one version lookup. With
+    DB_MIGRATE_ON_STARTUP=false, pending migrations fail the boot instead so
+    they can be applied out of band (`python -m app.migrations`).
+    """
+    from app.migrations import LATEST_VERSION, current_version, migrate
+
+    if current_version(engine) >= LATEST_VERSION:
+        return
+    if os.getenv("DB_MIGRATE_ON_STARTUP", "true").strip().lower() not in {"1", "true", "yes", "on"}:
+        raise RuntimeError(
+            f"database schema is behind (latest={LATEST_VERSION}); run `python -m app.migrations`"
         )
+    migrate(engine)
 
 
 def get_session():
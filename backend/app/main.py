@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 import time
@@ -10,10 +11,18 @@ from fastapi.responses import JSONResponse
 from sqlmodel import Session
 from starlette.middleware.sessions import SessionMiddleware
 
-from app.database import create_db_and_tables, engine
-from app.routers import blog, cv, gamification, github, oracle
+from app.database import create_db_and_tables, engine, startup_lock
+from app.routers import blog, cv, gamification, github, oracle, search
+from app.routers.cv import MAX_UPLOAD_BYTES
+from app.services.blog_posts import ensure_posts_rendered
+from app.services.compression import DEFAULT_MINIMUM_SIZE, CompressionMiddleware
+from app.services.conditional_get import ConditionalGetMiddleware
+from app.services.cv_upload import MULTIPART_OVERHEAD_BYTES, CVUploadLimitMiddleware
 from app.services.log_safety import install_redaction_filter
-from app.seed import ensure_achievements, seed_initial_data
+from app.services.players import InvalidPlayerIdError, PlayerNotFoundError
+from app.services.response_envelope import FastJSONResponse, failure_response, request_id_from_request
+from app.services.warmup import preload_heavy_modules
+from app.seed import seed_database
 
 
 def _configure_logging() -> None:
@@ -41,16 +50,37 @@ def _env_bool(name: str, default: bool) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_db_and_tables()
-    with Session(engine) as session:
-        seed_initial_data(session)
-        ensure_achievements(session)
+    with startup_lock():
+        create_db_and_tables()
+        with Session(engine) as session:
+            seed_database(session)
+        ensure_posts_rendered(engine)
+
+    # Runs while uvicorn binds the port and starts serving; requests never wait on it.
+    warmup = None
+    if _env_bool("STARTUP_WARMUP", True):
+        warmup = asyncio.create_task(asyncio.to_thread(preload_heavy_modules))
     yield
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
 
 
-app = FastAPI(title="DevQuest API", version="0.1.0", lifespan=lifespan)
+app = FastAPI(
+    title="DevQuest API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")
 session_secret_key = os.getenv("SESSION_SECRET_KEY", "devquest-local-session-secret")
@@ -58,6 +88,15 @@ session_cookie_name = os.getenv("SESSION_COOKIE_NAME", "devquest_session")
 session_https_only = _env_bool("SESSION_HTTPS_ONLY", False)
 session_same_site = os.getenv("SESSION_SAME_SITE", "lax").strip().lower() or "lax"
 
+# Innermost, so an early 413 still passes through CORS and gets its headers.
+app.add_middleware(
+    CVUploadLimitMiddleware,
+    path="/api/cv/upload",
+    max_body_bytes=MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+)
+
+app.add_middleware(ConditionalGetMiddleware)
+
 app.add_middleware(
     SessionMiddleware,
     secret_key=session_secret_key,
@@ -67,6 +106,11 @@ app.add_middleware(
     max_age=None,  # Browser session cookie: resets when browser closes.
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=max(0, _env_int("COMPRESSION_MIN_BYTES", DEFAULT_MINIMUM_SIZE)),
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[frontend_url, "http://localhost:5173", "http://localhost:3000"],
@@ -109,6 +153,30 @@ async def request_id_middleware(request: Request, call_next):
     return response
 
 
+@app.exception_handler(InvalidPlayerIdError)
+async def invalid_player_id_handler(request: Request, exc: InvalidPlayerIdError):
+    return failure_response(
+        flow="player",
+        request_id=request_id_from_request(request),
+        code="VALIDATION_ERROR",
+        message=str(exc),
+        retryable=False,
+        status_code=400,
+    )
+
+
+@app.exception_handler(PlayerNotFoundError)
+async def player_not_found_handler(request: Request, exc: PlayerNotFoundError):
+    return failure_response(
+        flow="player",
+        request_id=request_id_from_request(request),
+        code="NOT_FOUND",
+        message=str(exc),
+        retryable=False,
+        status_code=404,
+    )
+
+
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
     request_id = (
@@ -139,6 +207,7 @@ app.include_router(cv.router, prefix="/api")
 app.include_router(oracle.router, prefix="/api")
 app.include_router(gamification.router, prefix="/api")
 app.include_router(blog.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
 
 
 @app.get("/api/health")
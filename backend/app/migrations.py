@@ -0,0 +1,431 @@
+"""Versioned schema migrations for the SQLite database.
+
+Each migration has an integer version and a list of idempotent steps. Applied
+versions are recorded in `schema_version`, so a warm boot costs a single
+`SELECT max(version)`; nothing introspects tables unless a migration is pending.
+
+Steps run in their own transactions so that long work (index builds, batched
+backfills) never holds one giant write lock, and re-running a half-applied
+migration is safe because every step is written to be repeatable.
+
+Apply pending migrations ahead of a deploy with:
+
+    python -m app.migrations            # apply
+    python -m app.migrations --status   # show current/latest version
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import Engine, text
+from sqlmodel import SQLModel
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_ROWS = 5_000
+
+Step = Callable[[Engine], None]
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    steps: list[Step] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Step helpers
+# ---------------------------------------------------------------------------
+
+
+def sql(statement: str) -> Step:
+    """A step that executes one SQL statement in its own transaction."""
+
+    def run(engine: Engine) -> None:
+        with engine.begin() as connection:
+            connection.execute(text(statement))
+
+    return run
+
+
+def create_index(name: str, table: str, columns: tuple[str, ...]) -> Step:
+    return sql(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+
+
+def drop_index(name: str) -> Step:
+    return sql(f"DROP INDEX IF EXISTS {name}")
+
+
+def add_column(table: str, column: str, ddl: str) -> Step:
+    """Add `column` unless a fresh `create_all` already created it."""
+
+    def run(engine: Engine) -> None:
+        with engine.begin() as connection:
+            rows = connection.execute(text(f"PRAGMA table_info({table})")).fetchall()
+            if column not in {str(row[1]) for row in rows}:
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+
+    return run
+
+
+def create_table(name: str) -> Step:
+    """Create one model table (and its declared indexes) if it does not exist."""
+
+    def run(engine: Engine) -> None:
+        _import_models()
+        SQLModel.metadata.tables[name].create(engine, checkfirst=True)
+
+    return run
+
+
+def backfill(table: str, *, set_clause: str, where: str, batch_rows: int = BACKFILL_BATCH_ROWS) -> Step:
+    """UPDATE `table` in rowid batches, one short transaction per batch.
+
+    `where` must stop matching a row once it has been updated, otherwise the
+    loop would never finish.
+    """
+
+    def run(engine: Engine) -> None:
+        statement = text(
+            f"UPDATE {table} SET {set_clause} "
+            f"WHERE rowid IN (SELECT rowid FROM {table} WHERE {where} LIMIT :batch)"
+        )
+        total = 0
+        while True:
+            with engine.begin() as connection:
+                updated = connection.execute(statement, {"batch": batch_rows}).rowcount
+            total += updated
+            if updated < batch_rows:
+                break
+        if total:
+            logger.info("db_backfill table=%s rows=%s", table, total)
+
+    return run
+
+
+def _import_models() -> None:
+    import app.models  # noqa: F401  (registers every table on SQLModel.metadata)
+
+
+def _create_all(engine: Engine) -> None:
+    _import_models()
+    SQLModel.metadata.create_all(engine)
+
+
+_CV_JSON_COLUMNS = ("strengths", "weaknesses", "tips", "sections")
+
+# Tables that gained an owning player in the player_scoping migration.
+_PLAYER_TABLES = ("skill", "achievement", "blogpost", "cvanalysis", "chatmessage", "activitylog")
+
+
+def _player_scoping_steps() -> list[Step]:
+    # Rows written before multi-profile support belong to the original (lowest id) player.
+    steps: list[Step] = []
+    for table in _PLAYER_TABLES:
+        steps.append(add_column(table, "player_id", "INTEGER NOT NULL DEFAULT 0"))
+        steps.append(
+            backfill(
+                table,
+                set_clause="player_id = COALESCE((SELECT min(id) FROM playerprofile), 1)",
+                where="player_id = 0",
+            )
+        )
+    return steps
+
+
+def per_dialect(**steps: list[Step]) -> Step:
+    """Run the steps listed for the engine's dialect (`sqlite=[...]`, `postgresql=[...]`)."""
+
+    def run(engine: Engine) -> None:
+        for step in steps.get(engine.dialect.name, []):
+            step(engine)
+
+    return run
+
+
+# Full-text search. SQLite keeps an FTS5 index per table, fed by triggers. The
+# index reads its text from a `*_search_src` view whose `scope` column is a
+# token naming the owner ("p<player_id>", or "p<player_id>s<session_id>" for
+# chat). A search matches the scope and the terms together, so only the
+# caller's rows are ever ranked.
+_FTS_TABLES = {
+    # table: (scope expression, indexed text columns, bm25 weights for scope + columns)
+    "blogpost": ("'p' || {row}.player_id", ("title", "content", "tags"), "0.0, 4.0, 1.0, 2.0"),
+    "chatmessage": ("'p' || {row}.player_id || 's' || {row}.session_id", ("text",), "0.0, 1.0"),
+}
+
+
+def _sqlite_fts_steps() -> list[Step]:
+    steps: list[Step] = []
+    for table, (scope, columns, weights) in _FTS_TABLES.items():
+        fts, source = f"{table}_fts", f"{table}_search_src"
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{column}" for column in columns)
+        old_values = ", ".join(f"old.{column}" for column in columns)
+        new_scope, old_scope = scope.format(row="new"), scope.format(row="old")
+        delete_old = (
+            f"INSERT INTO {fts} ({fts}, rowid, scope, {column_list}) VALUES ('delete', old.id, {old_scope}, {old_values});"
+        )
+        insert_new = f"INSERT INTO {fts} (rowid, scope, {column_list}) VALUES (new.id, {new_scope}, {new_values});"
+        steps += [
+            sql(
+                f"CREATE VIEW IF NOT EXISTS {source} AS "
+                f"SELECT id, {scope.format(row=table)} AS scope, {column_list} FROM {table}"
+            ),
+            sql(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                f"scope, {column_list}, content='{source}', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            ),
+            sql(f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN {insert_new} END"),
+            sql(f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN {delete_old} END"),
+            sql(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE ON {table} BEGIN "
+                f"{delete_old} {insert_new} END"
+            ),
+            sql(f"INSERT INTO {fts} ({fts}, rank) VALUES ('rank', 'bm25({weights})')"),
+            sql(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')"),
+        ]
+    return steps
+
+
+# Migration 8's excerpt and tag rules, copied from `app.services.blog_posts` as
+# they were when it shipped, so later changes there cannot alter the migration.
+_V8_MAX_TAGS, _V8_MAX_TAG_CHARS, _V8_EXCERPT_CHARS = 20, 40, 200
+_V8_MARKDOWN_NOISE = [
+    (re.compile(r"```.*?```", re.DOTALL), " "),
+    (re.compile(r"!\[([^\]]*)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"\[([^\]]*)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"^\s{0,3}(#{1,6}|>|[-*+]|\d+\.)\s+", re.MULTILINE), ""),
+    (re.compile(r"[*_`~]+"), ""),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def _v8_tags(tags: str) -> list[str]:
+    seen: dict[str, None] = {}
+    for raw in tags.split(","):
+        tag = raw.strip().lower()[:_V8_MAX_TAG_CHARS]
+        if tag:
+            seen.setdefault(tag, None)
+    return list(seen)[:_V8_MAX_TAGS]
+
+
+def _v8_excerpt(content: str) -> str:
+    plain = content
+    for pattern, replacement in _V8_MARKDOWN_NOISE:
+        plain = pattern.sub(replacement, plain)
+    plain = plain.strip()
+    if len(plain) <= _V8_EXCERPT_CHARS:
+        return plain
+    cut = plain[:_V8_EXCERPT_CHARS].rsplit(" ", 1)[0] or plain[:_V8_EXCERPT_CHARS]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def _backfill_blog_listing(engine: Engine, batch_rows: int = BACKFILL_BATCH_ROWS) -> None:
+    """Write excerpts and `posttag` rows for posts created before the blog_listing migration."""
+    select_batch = text("SELECT id, player_id, content, tags FROM blogpost WHERE id > :after ORDER BY id LIMIT :batch")
+    update_post = text("UPDATE blogpost SET excerpt = :excerpt, tags = :tags WHERE id = :id")
+    insert_tag = text(
+        "INSERT INTO posttag (post_id, tag, player_id) VALUES (:post_id, :tag, :player_id) ON CONFLICT DO NOTHING"
+    )
+    after, total = 0, 0
+    while True:
+        with engine.begin() as connection:
+            rows = connection.execute(select_batch, {"after": after, "batch": batch_rows}).fetchall()
+            if not rows:
+                break
+            posts, tags = [], []
+            for post_id, player_id, content, raw_tags in rows:
+                normalized = _v8_tags(raw_tags or "")
+                posts.append({"id": post_id, "excerpt": _v8_excerpt(content or ""), "tags": ",".join(normalized)})
+                tags += [{"post_id": post_id, "tag": tag, "player_id": player_id} for tag in normalized]
+            connection.execute(update_post, posts)
+            if tags:
+                connection.execute(insert_tag, tags)
+        after, total = rows[-1][0], total + len(rows)
+    if total:
+        logger.info("db_backfill table=blogpost rows=%s", total)
+
+
+# ---------------------------------------------------------------------------
+# Migrations (append only; never edit a released version)
+# ---------------------------------------------------------------------------
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "initial_schema", [_create_all]),
+    Migration(
+        2,
+        "chatmessage_session_id",
+        [add_column("chatmessage", "session_id", "TEXT NOT NULL DEFAULT ''")],
+    ),
+    Migration(
+        3,
+        "query_indexes",
+        [
+            # /oracle/history keyset pages and session counts: (created_at, id) within a session
+            create_index("ix_chatmessage_session_created_id", "chatmessage", ("session_id", "created_at", "id")),
+            # /oracle/stats: distinct oracle topics per session (covering)
+            create_index("ix_chatmessage_session_role_topic", "chatmessage", ("session_id", "role", "context_topic")),
+            # /gamification/weekly-summary: created_at range scans
+            create_index("ix_activitylog_created_at", "activitylog", ("created_at",)),
+            # Superseded by the composites above.
+            drop_index("ix_chatmessage_session_id"),
+            drop_index("ix_chatmessage_session_id_id"),
+        ],
+    ),
+    Migration(
+        4,
+        "cvanalysis_json_columns",
+        [
+            # The list columns used to hold json.dumps() text, with "" for empty. SQLite
+            # stores JSON as text, so only the non-JSON placeholders need rewriting.
+            per_dialect(
+                sqlite=[
+                    backfill(
+                        "cvanalysis",
+                        set_clause=", ".join(
+                            f"{column} = CASE WHEN json_valid({column}) THEN {column} ELSE '[]' END"
+                            for column in _CV_JSON_COLUMNS
+                        ),
+                        where=" OR ".join(f"NOT json_valid({column})" for column in _CV_JSON_COLUMNS),
+                    ),
+                ]
+            ),
+        ],
+    ),
+    Migration(5, "state_versions", [create_table("stateversion")]),
+    Migration(
+        6,
+        "player_scoping",
+        [
+            *_player_scoping_steps(),
+            # Every per-player query leads with player_id, so its cost follows one player's rows.
+            create_index(
+                "ix_chatmessage_player_session_created_id",
+                "chatmessage",
+                ("player_id", "session_id", "created_at", "id"),
+            ),
+            create_index(
+                "ix_chatmessage_player_session_role_topic",
+                "chatmessage",
+                ("player_id", "session_id", "role", "context_topic"),
+            ),
+            # Achievement checks and stats: user-message counts per player (covering)
+            create_index("ix_chatmessage_player_role", "chatmessage", ("player_id", "role")),
+            create_index("ix_activitylog_player_created_at", "activitylog", ("player_id", "created_at")),
+            create_index("ix_activitylog_player_action", "activitylog", ("player_id", "action")),
+            create_index("ix_cvanalysis_player_id", "cvanalysis", ("player_id", "id")),
+            create_index("ix_blogpost_player_pinned_created", "blogpost", ("player_id", "pinned", "created_at")),
+            create_index("ix_skill_player_category_name", "skill", ("player_id", "category", "name")),
+            create_index("ix_achievement_player_name", "achievement", ("player_id", "name")),
+            drop_index("ix_chatmessage_session_created_id"),
+            drop_index("ix_chatmessage_session_role_topic"),
+            drop_index("ix_activitylog_created_at"),
+            drop_index("ix_skill_skill_id"),
+        ],
+    ),
+    Migration(
+        7,
+        "full_text_search",
+        [per_dialect(sqlite=_sqlite_fts_steps())],
+    ),
+    Migration(
+        8,
+        "blog_listing",
+        [
+            add_column("blogpost", "excerpt", "TEXT NOT NULL DEFAULT ''"),
+            create_table("posttag"),
+            _backfill_blog_listing,
+            # Board pages: keyset over (pinned, created_at, id), optionally within a category.
+            create_index(
+                "ix_blogpost_player_pinned_created_id", "blogpost", ("player_id", "pinned", "created_at", "id")
+            ),
+            create_index(
+                "ix_blogpost_player_category_pinned_created_id",
+                "blogpost",
+                ("player_id", "category", "pinned", "created_at", "id"),
+            ),
+            # Tag filters and the tag cloud (covering).
+            create_index("ix_posttag_player_tag_post", "posttag", ("player_id", "tag", "post_id")),
+            drop_index("ix_blogpost_player_pinned_created"),
+        ],
+    ),
+    Migration(
+        9,
+        "blog_render_cache",
+        [
+            add_column("blogpost", "content_html", "TEXT NOT NULL DEFAULT ''"),
+            add_column("blogpost", "content_hash", "TEXT NOT NULL DEFAULT ''"),
+            # Rendering existing posts needs the live renderer, so it is not a migration
+            # step: `blog_posts.ensure_posts_rendered` runs at startup instead.
+        ],
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def current_version(engine: Engine) -> int:
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS schema_version ("
+                "version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at TEXT NOT NULL)"
+            )
+        )
+        version = connection.execute(text("SELECT max(version) FROM schema_version")).scalar()
+    return int(version or 0)
+
+
+def pending_migrations(engine: Engine) -> list[Migration]:
+    version = current_version(engine)
+    return [migration for migration in MIGRATIONS if migration.version > version]
+
+
+def migrate(engine: Engine) -> int:
+    """Apply pending migrations in order and return the resulting version."""
+    pending = pending_migrations(engine)
+    for migration in pending:
+        logger.info("db_migration_start version=%s name=%s", migration.version, migration.name)
+        for step in migration.steps:
+            step(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                text("INSERT OR IGNORE INTO schema_version (version, name, applied_at) VALUES (:v, :n, :t)"),
+                {"v": migration.version, "n": migration.name, "t": datetime.now(timezone.utc).isoformat()},
+            )
+        logger.info("db_migration_done version=%s name=%s", migration.version, migration.name)
+    return pending[-1].version if pending else current_version(engine)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="DevQuest schema migrations")
+    parser.add_argument("--status", action="store_true", help="Print the current and latest version only.")
+    args = parser.parse_args(argv)
+
+    from app.database import engine
+
+    if args.status:
+        print(f"current={current_version(engine)} latest={LATEST_VERSION}")
+        return 0
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    print(f"schema_version={migrate(engine)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
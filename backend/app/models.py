@@ -1,10 +1,21 @@
 """SQLModel database models for DevQuest gamification system."""
 
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy import JSON, Column
 from sqlmodel import Field, SQLModel
 
 
+def _json_column() -> Any:
+    """JSON column for list/dict fields (stored as JSON text by SQLite)."""
+    return Field(default_factory=list, sa_column=Column(JSON(), nullable=False))
+
+
+def _player_fk() -> Any:
+    """Owning player; composite indexes that lead with it live in app.migrations."""
+    return Field(foreign_key="playerprofile.id")
+
+
 class PlayerProfile(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = "Renan Carvalho"
@@ -22,7 +33,8 @@ class PlayerProfile(SQLModel, table=True):
 
 class Skill(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    skill_id: str = Field(index=True)
+    player_id: int = _player_fk()
+    skill_id: str
     name: str
     category: str  # "frontend", "backend", "data"
     category_name: str  # "Frontend Arcana", etc.
@@ -36,6 +48,7 @@ class Skill(SQLModel, table=True):
 
 class Achievement(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
+    player_id: int = _player_fk()
     name: str
     description: str = ""
     icon: str = "trophy"
@@ -47,31 +60,43 @@ class Achievement(SQLModel, table=True):
 
 class BlogPost(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
+    player_id: int = _player_fk()
     title: str
     content: str  # markdown content
     category: str = "update"  # update, project, achievement, thought
-    tags: str = ""  # comma-separated
+    tags: str = ""  # comma-separated; normalized copy in PostTag
     color: str = "#8b5cf6"
     pinned: bool = False
+    excerpt: str = ""  # plain-text preview for list views (app.services.blog_posts)
+    content_html: str = ""  # sanitized rendering of `content` (app.services.markdown_render)
+    content_hash: str = ""  # content_hash() of the source `content_html`/`excerpt` were built from
     created_at: str  # ISO date string
     updated_at: str  # ISO date string
 
 
+class PostTag(SQLModel, table=True):
+    post_id: int = Field(foreign_key="blogpost.id", primary_key=True)
+    tag: str = Field(primary_key=True)
+    player_id: int = _player_fk()
+
+
 class CVAnalysis(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
+    player_id: int = _player_fk()
     filename: str
     file_size: int
     score: int
-    strengths: str = ""  # JSON-serialized list
-    weaknesses: str = ""  # JSON-serialized list
-    tips: str = ""  # JSON-serialized list
-    sections: str = ""  # JSON-serialized list of {name, score, feedback}
+    strengths: list[str] = _json_column()
+    weaknesses: list[str] = _json_column()
+    tips: list[str] = _json_column()
+    sections: list[dict] = _json_column()  # list of {name, score, feedback}
     created_at: str  # ISO date string
 
 
 class ChatMessage(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    session_id: str = Field(default="", index=True)
+    player_id: int = _player_fk()
+    session_id: str = ""  # indexed via app.migrations (query_indexes)
     role: str  # "user" or "oracle"
     text: str
     context_topic: str = ""  # matched keyword, for analytics
@@ -80,7 +105,13 @@ class ChatMessage(SQLModel, table=True):
 
 class ActivityLog(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
+    player_id: int = _player_fk()
     action: str  # "oracle_chat", "cv_upload", "blog_create"
     xp_gained: int = 0
     description: str = ""
     created_at: str  # ISO date string
+
+
+class StateVersion(SQLModel, table=True):
+    scope: str = Field(primary_key=True)  # see app.services.state_version
+    version: int = 0
@@ -6,11 +6,27 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, SQLModel, select
 
 from app.database import get_session
-from app.models import BlogPost
+from app.models import BlogPost, PlayerProfile
+from app.services.blog_posts import (
+    FULL_COLUMNS,
+    delete_post_tags,
+    fetch_posts_page,
+    prepare_post,
+    replace_post_tags,
+    tag_counts,
+)
+from app.services.conditional_get import conditional_get
 from app.services.gamification_engine import award_xp
+from app.services.pagination import InvalidCursorError
+from app.services.players import get_current_player
+from app.services.response_envelope import FastJSONResponse
+from app.services.state_version import blog_scope, bump_version
 
 router = APIRouter(tags=["blog"])
 
+DEFAULT_POSTS_PAGE = 20
+MAX_POSTS_PAGE = 100
+
 
 class BlogPostCreate(SQLModel):
     title: str
@@ -21,26 +37,76 @@ class BlogPostCreate(SQLModel):
     pinned: bool = False
 
 
-@router.get("/blog/posts")
-def list_posts(session: Session = Depends(get_session)):
-    posts = session.exec(
-        select(BlogPost).order_by(BlogPost.pinned.desc(), BlogPost.created_at.desc())  # type: ignore[union-attr]
-    ).all()
-    return {"posts": posts, "total": len(posts)}
+@router.get("/blog/posts", dependencies=[Depends(conditional_get("blog-posts", blog_scope))])
+def list_posts(
+    limit: int = DEFAULT_POSTS_PAGE,
+    cursor: str | None = None,
+    category: str | None = None,
+    tag: str | None = None,
+    view: str = "summary",
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Return a cursor-paginated page of posts, pinned first then newest.
+
+    `view=summary` (default) sends each post's `excerpt` instead of its markdown
+    `content`; `view=full` includes it. `total` is only counted for the first page.
+    """
+    if limit < 1 or limit > MAX_POSTS_PAGE or view not in {"summary", "full"}:
+        raise HTTPException(status_code=400, detail="invalid_pagination")
+    try:
+        page = fetch_posts_page(
+            session,
+            player_id=player.id,
+            limit=limit,
+            cursor=cursor,
+            category=category,
+            tag=tag,
+            full=view == "full",
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="invalid_cursor") from None
+    return FastJSONResponse(
+        {"posts": page.posts, "total": page.total, "next_cursor": page.next_cursor, "has_more": page.has_more}
+    )
+
 
+@router.get("/blog/tags", dependencies=[Depends(conditional_get("blog-tags", blog_scope))])
+def list_tags(session: Session = Depends(get_session), player: PlayerProfile = Depends(get_current_player)):
+    return FastJSONResponse({"tags": tag_counts(session, player.id)})
 
-@router.get("/blog/posts/{post_id}")
-def get_post(post_id: int, session: Session = Depends(get_session)):
+
+def _get_player_post(session: Session, post_id: int, player_id: int) -> BlogPost:
     post = session.get(BlogPost, post_id)
-    if not post:
+    if not post or post.player_id != player_id:
         raise HTTPException(status_code=404, detail="Post not found")
     return post
 
 
+@router.get("/blog/posts/{post_id}")
+def get_post(
+    post_id: int,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    # Plain columns rendered as-is: no ORM instance, no response-model validation.
+    row = session.exec(
+        select(*FULL_COLUMNS).where(BlogPost.id == post_id, BlogPost.player_id == player.id)
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+    return FastJSONResponse(row._asdict())
+
+
 @router.post("/blog/posts")
-def create_post(data: BlogPostCreate, session: Session = Depends(get_session)):
+def create_post(
+    data: BlogPostCreate,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
     now = datetime.now().isoformat()
     post = BlogPost(
+        player_id=player.id,
         title=data.title,
         content=data.content,
         category=data.category,
@@ -50,21 +116,30 @@ def create_post(data: BlogPostCreate, session: Session = Depends(get_session)):
         created_at=now,
         updated_at=now,
     )
+    tags = prepare_post(post)
     session.add(post)
+    session.flush()
+    replace_post_tags(session, post_id=post.id, player_id=player.id, tags=tags)
+    bump_version(session, blog_scope(player.id))
     session.commit()
     session.refresh(post)
+    # award_xp commits again, which expires `post`; keep its fields first.
+    post_data = post.model_dump()
 
     # Award XP for creating a blog post
-    gamification = award_xp(session, "blog_create", f"Published: {post.title}", 75)
+    gamification = award_xp(session, "blog_create", f"Published: {post.title}", 75, player_id=player.id)
 
-    return {**post.model_dump(), "gamification": gamification}
+    return {**post_data, "gamification": gamification}
 
 
 @router.put("/blog/posts/{post_id}")
-def update_post(post_id: int, data: BlogPostCreate, session: Session = Depends(get_session)):
-    post = session.get(BlogPost, post_id)
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
+def update_post(
+    post_id: int,
+    data: BlogPostCreate,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    post = _get_player_post(session, post_id, player.id)
     post.title = data.title
     post.content = data.content
     post.category = data.category
@@ -72,17 +147,24 @@ def update_post(post_id: int, data: BlogPostCreate, session: Session = Depends(g
     post.color = data.color
     post.pinned = data.pinned
     post.updated_at = datetime.now().isoformat()
+    tags = prepare_post(post)
     session.add(post)
+    replace_post_tags(session, post_id=post.id, player_id=player.id, tags=tags)
+    bump_version(session, blog_scope(player.id))
     session.commit()
     session.refresh(post)
     return post
 
 
 @router.delete("/blog/posts/{post_id}")
-def delete_post(post_id: int, session: Session = Depends(get_session)):
-    post = session.get(BlogPost, post_id)
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
+def delete_post(
+    post_id: int,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    post = _get_player_post(session, post_id, player.id)
+    delete_post_tags(session, post.id)
     session.delete(post)
+    bump_version(session, blog_scope(player.id))
     session.commit()
     return {"success": True}
@@ -2,52 +2,82 @@
 
 from __future__ import annotations
 
-import io
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
-from fastapi.responses import StreamingResponse
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import text
+from sqlmodel import Session, col, func, select
 
 from app.database import get_session
-from app.models import CVAnalysis
+from app.models import CVAnalysis, PlayerProfile
+from app.services.conditional_get import conditional_get
+from app.services.cv_bulk_export import MAX_BULK_PROFILES, plan_bulk_export, stream_bulk_export
 from app.services.cv_export_service import (
     CVExportError,
     CVExportNotFoundError,
-    generate_rpg_cv_pdf,
+    get_rpg_cv_async,
+    player_version,
+    rpg_cv_etag,
 )
+from app.services.cv_export_templates import EXPORT_FORMATS
 from app.services.cv_service import analyze_uploaded_cv
+from app.services.cv_upload import CVUploadRejected, inspect_upload
 from app.services.gamification_engine import award_xp
+from app.services.http_cache import etag_matches
+from app.services.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.services.players import PLAYER_HEADER, get_current_player
 from app.services.response_envelope import failure_response, request_id_from_request, success
+from app.services.state_version import bump_version, cv_scope
 
 router = APIRouter(prefix="/cv", tags=["cv"])
 
 MAX_UPLOAD_BYTES = 5 * 1024 * 1024
 ALLOWED_CV_EXTENSIONS = {".pdf", ".doc", ".docx"}
+DEFAULT_ANALYSES_PAGE = 20
+MAX_ANALYSES_PAGE = 100
 
 
 def _format_analysis(record: CVAnalysis) -> dict:
-    """Deserialize JSON fields from a CVAnalysis row."""
+    """Shape a CVAnalysis row for the API (JSON columns are already lists)."""
     return {
         "id": record.id,
         "filename": record.filename,
         "size": record.file_size,
         "score": record.score,
-        "sections": json.loads(record.sections) if record.sections else [],
-        "strengths": json.loads(record.strengths) if record.strengths else [],
-        "weaknesses": json.loads(record.weaknesses) if record.weaknesses else [],
-        "tips": json.loads(record.tips) if record.tips else [],
+        "sections": record.sections or [],
+        "strengths": record.strengths or [],
+        "weaknesses": record.weaknesses or [],
+        "tips": record.tips or [],
         "created_at": record.created_at,
     }
 
 
+def _section_score_averages(session: Session, player_id: int) -> list[dict]:
+    """Average score per section name across a player's analyses, computed in SQL."""
+    rows = session.connection().execute(
+        text(
+            "SELECT json_extract(section.value, '$.name') AS name, "
+            "avg(json_extract(section.value, '$.score')) AS avg_score, count(*) AS analyses "
+            "FROM cvanalysis, json_each(cvanalysis.sections) AS section "
+            "WHERE cvanalysis.player_id = :player_id GROUP BY 1 ORDER BY 1"
+        ),
+        {"player_id": player_id},
+    ).all()
+    return [
+        {"name": row_name, "avg_score": round(float(avg_score), 1), "analyses": int(analyses)}
+        for row_name, avg_score, analyses in rows
+        if row_name is not None
+    ]
+
+
 @router.post("/upload")
 async def upload_cv(
     request: Request,
     file: UploadFile = File(...),
     session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
 ):
     """Accept file upload, run structured analysis, persist to DB."""
     request_id = request_id_from_request(request)
@@ -63,47 +93,41 @@ async def upload_cv(
             status_code=400,
         )
 
-    contents = await file.read()
-    file_size = len(contents)
-    if file_size <= 0:
-        return failure_response(
-            flow="cv",
-            request_id=request_id,
-            code="VALIDATION_ERROR",
-            message="empty_file",
-            retryable=False,
-            status_code=400,
-        )
-    if file_size > MAX_UPLOAD_BYTES:
+    try:
+        upload = await inspect_upload(file, extension=extension, max_bytes=MAX_UPLOAD_BYTES)
+    except CVUploadRejected as exc:
         return failure_response(
             flow="cv",
             request_id=request_id,
             code="VALIDATION_ERROR",
-            message="file_too_large",
+            message=str(exc),
             retryable=False,
             status_code=400,
         )
+    file_size = upload.size
 
     try:
-        service_result = await analyze_uploaded_cv(filename=filename, file_size=file_size, contents=contents)
+        service_result = await analyze_uploaded_cv(filename=filename, file_size=file_size, contents=upload.stream)
         result = service_result.analysis.model_dump()
 
         record = CVAnalysis(
+            player_id=player.id,
             filename=filename,
             file_size=file_size,
             score=result["score"],
-            strengths=json.dumps(result["strengths"]),
-            weaknesses=json.dumps(result["weaknesses"]),
-            tips=json.dumps(result["tips"]),
-            sections=json.dumps(result["sections"]),
+            strengths=result["strengths"],
+            weaknesses=result["weaknesses"],
+            tips=result["tips"],
+            sections=result["sections"],
             created_at=datetime.now(timezone.utc).isoformat(),
         )
         session.add(record)
+        bump_version(session, cv_scope(player.id))
         session.commit()
         session.refresh(record)
 
         # Award XP for CV analysis
-        gamification = award_xp(session, "cv_upload", f"Analyzed CV: {filename}", 100)
+        gamification = award_xp(session, "cv_upload", f"Analyzed CV: {filename}", 100, player_id=player.id)
 
         result_data = _format_analysis(record)
         result_data["gamification"] = gamification
@@ -126,12 +150,21 @@ async def upload_cv(
         )
 
 
-@router.get("/analysis")
-async def get_analysis(request: Request, session: Session = Depends(get_session)):
-    """Return the most recent CV analysis."""
+@router.get("/analysis", dependencies=[Depends(conditional_get("cv-analysis", cv_scope))])
+async def get_analysis(
+    request: Request,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Return the player's most recent CV analysis."""
     request_id = request_id_from_request(request)
     try:
-        statement = select(CVAnalysis).order_by(CVAnalysis.id.desc()).limit(1)  # type: ignore[union-attr]
+        statement = (
+            select(CVAnalysis)
+            .where(CVAnalysis.player_id == player.id)
+            .order_by(CVAnalysis.id.desc())  # type: ignore[union-attr]
+            .limit(1)
+        )
         record = session.exec(statement).first()
         if record is None:
             return success(
@@ -159,17 +192,74 @@ async def get_analysis(request: Request, session: Session = Depends(get_session)
 
 
 @router.get("/analyses")
-async def get_analyses(request: Request, session: Session = Depends(get_session)):
-    """Return all CV analyses, newest first."""
+async def get_analyses(
+    request: Request,
+    limit: int = DEFAULT_ANALYSES_PAGE,
+    cursor: str | None = None,
+    view: str = "summary",
+    include_total: bool = False,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Return a cursor-paginated page of CV analyses, newest first.
+
+    `view=summary` (default) loads only id/filename/score/created_at; `view=full`
+    includes sections and feedback lists. Use `/analyses/{id}` for one record.
+    `include_total=true` also counts all of the player's analyses.
+    """
     request_id = request_id_from_request(request)
+    if limit < 1 or limit > MAX_ANALYSES_PAGE or view not in {"summary", "full"}:
+        return failure_response(
+            flow="cv",
+            request_id=request_id,
+            code="VALIDATION_ERROR",
+            message="invalid_pagination",
+            retryable=False,
+            status_code=400,
+        )
+
     try:
-        statement = select(CVAnalysis).order_by(CVAnalysis.id.desc())  # type: ignore[union-attr]
-        records = session.exec(statement).all()
+        if view == "summary":
+            statement = select(CVAnalysis.id, CVAnalysis.filename, CVAnalysis.score, CVAnalysis.created_at)
+        else:
+            statement = select(CVAnalysis)
+        statement = statement.where(CVAnalysis.player_id == player.id)
+        if cursor:
+            (before_id,) = decode_cursor(cursor, int)
+            statement = statement.where(CVAnalysis.id < before_id)
+        rows = session.exec(statement.order_by(col(CVAnalysis.id).desc()).limit(limit + 1)).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if view == "summary":
+            analyses = [
+                {"id": row_id, "filename": filename, "score": score, "created_at": created_at}
+                for row_id, filename, score, created_at in rows
+            ]
+        else:
+            analyses = [_format_analysis(record) for record in rows]
+        total = None
+        if include_total:
+            total = session.exec(select(func.count(CVAnalysis.id)).where(CVAnalysis.player_id == player.id)).one()
         return success(
             flow="cv",
             request_id=request_id,
             source="db",
-            data={"analyses": [_format_analysis(r) for r in records]},
+            data={
+                "analyses": analyses,
+                "next_cursor": encode_cursor(analyses[-1]["id"]) if has_more and analyses else None,
+                "has_more": has_more,
+                "total": total,
+            },
+        )
+    except InvalidCursorError:
+        return failure_response(
+            flow="cv",
+            request_id=request_id,
+            code="VALIDATION_ERROR",
+            message="invalid_cursor",
+            retryable=False,
+            status_code=400,
         )
     except Exception as exc:  # noqa: BLE001
         return failure_response(
@@ -183,18 +273,137 @@ async def get_analyses(request: Request, session: Session = Depends(get_session)
         )
 
 
+@router.get("/analyses/{analysis_id}")
+async def get_analysis_detail(
+    analysis_id: int,
+    request: Request,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Return one of the player's CV analyses with all of its fields."""
+    request_id = request_id_from_request(request)
+    try:
+        record = session.get(CVAnalysis, analysis_id)
+        if record is None or record.player_id != player.id:
+            return failure_response(
+                flow="cv",
+                request_id=request_id,
+                code="NOT_FOUND",
+                message="cv_analysis_not_found",
+                retryable=False,
+                status_code=404,
+            )
+        return success(
+            flow="cv",
+            request_id=request_id,
+            source="db",
+            data=_format_analysis(record),
+        )
+    except Exception as exc:  # noqa: BLE001
+        return failure_response(
+            flow="cv",
+            request_id=request_id,
+            code="DB_ERROR",
+            message="cv_analysis_fetch_failed",
+            retryable=True,
+            status_code=500,
+            details={"error_type": exc.__class__.__name__},
+        )
+
+
+@router.get("/section-scores")
+async def get_section_scores(
+    request: Request,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Return the average score of each CV section across the player's analyses."""
+    request_id = request_id_from_request(request)
+    try:
+        return success(
+            flow="cv",
+            request_id=request_id,
+            source="db",
+            data={"sections": _section_score_averages(session, player.id)},
+        )
+    except Exception as exc:  # noqa: BLE001
+        return failure_response(
+            flow="cv",
+            request_id=request_id,
+            code="DB_ERROR",
+            message="cv_section_scores_fetch_failed",
+            retryable=True,
+            status_code=500,
+            details={"error_type": exc.__class__.__name__},
+        )
+
+
 @router.get("/download-rpg")
-async def download_rpg_cv(session: Session = Depends(get_session)):
-    """Generate and download RPG CV as a PDF document."""
+async def download_rpg_cv(
+    request: Request,
+    format: str = "pdf",
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Download the player's RPG CV (pdf, html or markdown), re-rendered only when their data changed."""
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="unsupported_export_format")
     try:
-        pdf_bytes, filename = generate_rpg_cv_pdf(session)
+        version = player_version(session, player.id)
+        etag = rpg_cv_etag(player.id, version, format)
+        cache_headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": PLAYER_HEADER}
+        if etag_matches(request.headers.get("if-none-match", ""), etag):
+            return Response(status_code=304, headers=cache_headers)
+        # Rendering is CPU-bound ReportLab work: keep it off the event loop.
+        rendered = await get_rpg_cv_async(session, player_id=player.id, version=version, fmt=format)
     except CVExportNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except CVExportError as exc:
         raise HTTPException(status_code=500, detail="cv_export_failed") from exc
 
+    # The finished file is already in memory (and cached), so send it in one body
+    # with a Content-Length rather than through a StreamingResponse wrapper.
+    return Response(
+        content=rendered.content,
+        media_type=rendered.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{rendered.filename}"', **cache_headers},
+    )
+
+
+@router.get("/export/bulk")
+async def export_bulk(
+    profile_id: list[int] = Query(default=[]),
+    format: list[str] = Query(default=["pdf"]),
+    include_analysis: bool = True,
+    session: Session = Depends(get_session),
+):
+    """Stream a ZIP of RPG CVs for several profiles plus the latest CV analysis and a manifest."""
+    formats = list(dict.fromkeys(format))
+    if not formats or any(fmt not in EXPORT_FORMATS for fmt in formats):
+        raise HTTPException(status_code=400, detail="unsupported_export_format")
+    if len(profile_id) > MAX_BULK_PROFILES:
+        raise HTTPException(status_code=400, detail="too_many_profiles")
+    try:
+        jobs = plan_bulk_export(session, profile_ids=profile_id, formats=formats)
+    except CVExportNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    analysis_reports: dict[int, dict] = {}
+    if include_analysis:
+        for player_id in dict.fromkeys(job.profile_id for job in jobs):
+            latest = session.exec(
+                select(CVAnalysis)
+                .where(CVAnalysis.player_id == player_id)
+                .order_by(col(CVAnalysis.id).desc())
+                .limit(1)
+            ).first()
+            if latest:
+                analysis_reports[player_id] = _format_analysis(latest)
+
+    # Everything the workers need is loaded; the archive itself is built while it streams.
+    filename = f"devquest-cv-export-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.zip"
     return StreamingResponse(
-        io.BytesIO(pdf_bytes),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        stream_bulk_export(jobs, analysis_reports=analysis_reports),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "Cache-Control": "no-store"},
     )
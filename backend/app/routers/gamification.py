@@ -2,22 +2,58 @@
 
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, col, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlmodel import Session, SQLModel, col, func, select
 
 from app.database import get_session
 from app.models import Achievement, ActivityLog, PlayerProfile, Skill
+from app.services.admin_auth import require_admin
+from app.services.compression import negotiate_encoding
+from app.services.conditional_get import conditional_get
+from app.services.http_cache import etag_matches
 from app.services.mock_ai import weekly_summary
+from app.services.players import create_player, get_current_player
+from app.services.response_envelope import failure_response, request_id_from_request
+from app.services.state_version import player_scope
+from app.services.timeline import TIMELINE_CACHE_CONTROL, TimelineError, current_timeline, reload_timeline
 
 router = APIRouter(prefix="/gamification", tags=["gamification"])
 
 
-@router.get("/profile")
-async def get_profile(session: Session = Depends(get_session)):
+class PlayerCreate(SQLModel):
+    name: str
+    title: str = "Apprentice"
+    dev_class: str = "Apprentice"
+    avatar_initials: str = ""
+
+
+def _initials(name: str) -> str:
+    return "".join(part[0] for part in name.split()[:2]).upper() or "?"
+
+
+@router.get("/players")
+async def list_players(session: Session = Depends(get_session)):
+    """List the players hosted by this deployment."""
+    players = session.exec(select(PlayerProfile).order_by(col(PlayerProfile.id))).all()
+    return {"players": [{"id": p.id, "name": p.name, "title": p.title, "level": p.level} for p in players]}
+
+
+@router.post("/players")
+def add_player(data: PlayerCreate, session: Session = Depends(get_session)):
+    """Create a new level-1 player; pass its id as X-Player-Id to act as it."""
+    profile = create_player(
+        session,
+        name=data.name,
+        title=data.title,
+        dev_class=data.dev_class,
+        avatar_initials=data.avatar_initials or _initials(data.name),
+    )
+    return {"id": profile.id, "name": profile.name, "title": profile.title, "level": profile.level}
+
+
+@router.get("/profile", dependencies=[Depends(conditional_get("profile", player_scope))])
+async def get_profile(profile: PlayerProfile = Depends(get_current_player)):
     """Get player profile with RPG stats."""
-    profile = session.exec(select(PlayerProfile)).first()
-    if not profile:
-        return {"error": "No profile found"}
     return {
         "name": profile.name,
         "title": profile.title,
@@ -35,10 +71,13 @@ async def get_profile(session: Session = Depends(get_session)):
     }
 
 
-@router.get("/achievements")
-async def get_achievements(session: Session = Depends(get_session)):
-    """Get all achievements with unlock status."""
-    achievements = session.exec(select(Achievement)).all()
+@router.get("/achievements", dependencies=[Depends(conditional_get("achievements", player_scope))])
+async def get_achievements(
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Get the player's achievements with unlock status."""
+    achievements = session.exec(select(Achievement).where(Achievement.player_id == player.id)).all()
     return {
         "achievements": [
             {
@@ -55,10 +94,13 @@ async def get_achievements(session: Session = Depends(get_session)):
     }
 
 
-@router.get("/skills")
-async def get_skills(session: Session = Depends(get_session)):
-    """Get all skills grouped by category (matches frontend BRANCHES format)."""
-    skills = session.exec(select(Skill)).all()
+@router.get("/skills", dependencies=[Depends(conditional_get("skills", player_scope))])
+async def get_skills(
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Get the player's skills grouped by category (matches frontend BRANCHES format)."""
+    skills = session.exec(select(Skill).where(Skill.player_id == player.id)).all()
     branches: dict[str, dict] = {}
     for skill in skills:
         cat = skill.category
@@ -82,203 +124,52 @@ async def get_skills(session: Session = Depends(get_session)):
 
 
 @router.get("/timeline")
-async def get_timeline():
-    """Real career timeline from CV data."""
-    return {
-        "entries": [
-            # ── Experience ──────────────────────────────────────
-            {
-                "id": "exp-senai",
-                "category": "experience",
-                "year": "2025",
-                "yearEnd": None,
-                "title": "Residente em Inteligência Artificial",
-                "place": "SENAI/SC",
-                "description": "Residência em IA aplicada: Machine Learning, Deep Learning, Computer Vision, IA Generativa, Otimização e IA Embarcada. Desenvolvimento de soluções end-to-end com deploy em produção.",
-                "skills": ["Python", "Machine Learning", "Deep Learning", "Computer Vision", "Generative AI", "FastAPI"],
-                "color": "#f0c040",
-                "icon": "brain",
-            },
-            {
-                "id": "exp-paradigma-n2",
-                "category": "experience",
-                "year": "2024",
-                "yearEnd": "2025",
-                "title": "Analista de Suporte N2",
-                "place": "ParadigmaBS",
-                "description": "Suporte nível 2 com foco em resolução avançada: T-SQL, triggers, procedures, integração XML/SOAP, correção de bugs, melhoria de processos e documentação técnica.",
-                "skills": ["T-SQL", "XML", "SOAP", "Bug Fixing", "Documentation"],
-                "color": "#8b5cf6",
-                "icon": "terminal",
-            },
-            {
-                "id": "exp-paradigma-n1",
-                "category": "experience",
-                "year": "2022",
-                "yearEnd": "2024",
-                "title": "Analista de Suporte",
-                "place": "ParadigmaBS",
-                "description": "Análise e resolução de chamados técnicos, consultas em banco de dados, pull requests, suporte ao cliente com integração T-SQL, XML e SOAP.",
-                "skills": ["T-SQL", "XML", "SOAP", "API Analysis", "SQL"],
-                "color": "#8b5cf6",
-                "icon": "headset",
-            },
-            {
-                "id": "exp-paradigma-intern",
-                "category": "experience",
-                "year": "2022",
-                "yearEnd": None,
-                "title": "Estagiário",
-                "place": "ParadigmaBS",
-                "description": "Estágio em suporte técnico: diagnósticos, consultas SQL, correção de bugs e atendimento ao cliente.",
-                "skills": ["T-SQL", "SQL", "Diagnostics"],
-                "color": "#3b82f6",
-                "icon": "code",
-            },
-            {
-                "id": "exp-softplan-fin",
-                "category": "experience",
-                "year": "2020",
-                "yearEnd": "2021",
-                "title": "Assistente Financeiro",
-                "place": "Softplan",
-                "description": "Operações financeiras e controle administrativo em empresa de tecnologia jurídica.",
-                "skills": ["Finance", "Administration"],
-                "color": "#3b82f6",
-                "icon": "briefcase",
-            },
-            {
-                "id": "exp-softplan-apprentice",
-                "category": "experience",
-                "year": "2018",
-                "yearEnd": "2020",
-                "title": "Jovem Aprendiz",
-                "place": "Softplan",
-                "description": "Programa de aprendizagem em empresa de tecnologia, com exposição a processos corporativos e desenvolvimento profissional.",
-                "skills": ["Teamwork", "Professional Development"],
-                "color": "#22c55e",
-                "icon": "seedling",
-            },
-            # ── Education ───────────────────────────────────────
-            {
-                "id": "edu-senai",
-                "category": "education",
-                "year": "2025",
-                "yearEnd": "2026",
-                "title": "Pós-graduação em IA Aplicada",
-                "place": "SENAI/SC",
-                "description": "Especialização em Inteligência Artificial aplicada à indústria, com foco em visão computacional, deep learning e deploy de modelos.",
-                "skills": ["AI", "Deep Learning", "Computer Vision", "MLOps"],
-                "color": "#f0c040",
-                "icon": "graduation",
-            },
-            {
-                "id": "edu-estacio",
-                "category": "education",
-                "year": "2020",
-                "yearEnd": "2024",
-                "title": "Bacharel em Sistemas de Informação",
-                "place": "Estácio de Sá — Florianópolis",
-                "description": "Bacharelado em Sistemas de Informação com ênfase em desenvolvimento de software, banco de dados e engenharia de sistemas.",
-                "skills": ["Software Engineering", "Databases", "Systems Analysis"],
-                "color": "#22c55e",
-                "icon": "book",
-            },
-            # ── Awards ──────────────────────────────────────────
-            {
-                "id": "award-actinspace",
-                "category": "awards",
-                "year": "2026",
-                "yearEnd": None,
-                "title": "Hackathon ActInSpace — 1º Lugar",
-                "place": "Representando o Brasil na França",
-                "description": "Primeiro lugar no hackathon internacional ActInSpace, representando o Brasil na competição final na França com solução inovadora baseada em tecnologia espacial.",
-                "skills": ["Innovation", "Space Tech", "Teamwork", "Pitch"],
-                "color": "#f0c040",
-                "icon": "trophy",
-            },
-            {
-                "id": "award-akcit",
-                "category": "awards",
-                "year": "2025",
-                "yearEnd": None,
-                "title": "Hackathon AKCIT — 2º Lugar",
-                "place": "Projeto com IA Generativa",
-                "description": "Segundo lugar no hackathon AKCIT com projeto utilizando Inteligência Artificial Generativa para solução de problemas reais.",
-                "skills": ["Generative AI", "Hackathon", "Rapid Prototyping"],
-                "color": "#8b5cf6",
-                "icon": "medal",
-            },
-            # ── Certifications ──────────────────────────────────
-            {
-                "id": "cert-mobile",
-                "category": "certifications",
-                "year": "2023",
-                "yearEnd": None,
-                "title": "Programação para Dispositivos Móveis",
-                "place": "Certificação Profissional",
-                "description": "Desenvolvimento de aplicações móveis multiplataforma.",
-                "skills": ["Mobile Development"],
-                "color": "#3b82f6",
-                "icon": "smartphone",
-            },
-            {
-                "id": "cert-web",
-                "category": "certifications",
-                "year": "2023",
-                "yearEnd": None,
-                "title": "Programação para Internet",
-                "place": "Certificação Profissional",
-                "description": "Desenvolvimento web front-end e back-end.",
-                "skills": ["Web Development"],
-                "color": "#3b82f6",
-                "icon": "globe",
-            },
-            {
-                "id": "cert-governance",
-                "category": "certifications",
-                "year": "2022",
-                "yearEnd": None,
-                "title": "Implantação de Governança de T.I.",
-                "place": "Certificação Profissional",
-                "description": "Frameworks e práticas de governança em tecnologia da informação.",
-                "skills": ["IT Governance", "ITIL"],
-                "color": "#8b5cf6",
-                "icon": "shield",
-            },
-            {
-                "id": "cert-git",
-                "category": "certifications",
-                "year": "2022",
-                "yearEnd": None,
-                "title": "O Básico de Git e GitHub",
-                "place": "Certificação Profissional",
-                "description": "Controle de versão com Git e colaboração via GitHub.",
-                "skills": ["Git", "GitHub"],
-                "color": "#22c55e",
-                "icon": "git",
-            },
-            {
-                "id": "cert-bigdata",
-                "category": "certifications",
-                "year": "2023",
-                "yearEnd": None,
-                "title": "Soluções de Big Data Analytics",
-                "place": "Certificação Profissional",
-                "description": "Desenvolvimento de soluções analíticas com Big Data.",
-                "skills": ["Big Data", "Analytics", "Power BI"],
-                "color": "#22c55e",
-                "icon": "database",
-            },
-        ]
-    }
+async def get_timeline(request: Request):
+    """Real career timeline from CV data, served as pre-rendered bytes."""
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    try:
+        document = current_timeline()
+    except TimelineError as exc:
+        # Only the first load can fail here; later bad edits keep serving the last good file.
+        return failure_response(
+            flow="timeline",
+            request_id=request_id_from_request(request),
+            code="UNAVAILABLE",
+            message=str(exc),
+            retryable=True,
+            status_code=503,
+        )
+    body, etag = document.variant(encoding)
+    headers = {"ETag": etag, "Cache-Control": TIMELINE_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding in document.encoded:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.post("/timeline/reload", dependencies=[Depends(require_admin)])
+async def reload_timeline_document():
+    """Re-read the timeline file (admin only); a bad file leaves the current one in place."""
+    try:
+        document = reload_timeline()
+    except TimelineError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return {"etag": document.etag, "entries": document.entries}
 
 
 @router.get("/activity-log")
-async def get_activity_log(limit: int = 20, session: Session = Depends(get_session)):
-    """Recent XP events from activity log."""
+async def get_activity_log(
+    limit: int = 20,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Recent XP events from the player's activity log."""
     logs = session.exec(
-        select(ActivityLog).order_by(col(ActivityLog.id).desc()).limit(limit)
+        select(ActivityLog)
+        .where(ActivityLog.player_id == player.id)
+        .order_by(col(ActivityLog.created_at).desc(), col(ActivityLog.id).desc())
+        .limit(limit)
     ).all()
     return {
         "activities": [
@@ -289,22 +180,20 @@ async def get_activity_log(limit: int = 20, session: Session = Depends(get_sessi
 
 
 @router.get("/weekly-summary")
-async def get_weekly_summary(session: Session = Depends(get_session)):
-    """Weekly summary computed from real activity log + mock narrative."""
+async def get_weekly_summary(
+    session: Session = Depends(get_session),
+    profile: PlayerProfile = Depends(get_current_player),
+):
+    """Weekly summary computed from the player's activity log + mock narrative."""
     one_week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
-    recent = session.exec(
-        select(ActivityLog).where(ActivityLog.created_at >= one_week_ago)
-    ).all()
-
-    total_xp = sum(a.xp_gained for a in recent)
-    profile = session.exec(select(PlayerProfile)).first()
-    p_dict = {
-        "level": profile.level, "wisdom": profile.wisdom,
-    } if profile else None
+    activity_count, total_xp = session.exec(
+        select(func.count(ActivityLog.id), func.coalesce(func.sum(ActivityLog.xp_gained), 0))
+        .where(ActivityLog.player_id == profile.id, ActivityLog.created_at >= one_week_ago)
+    ).one()
 
-    summary = weekly_summary(profile=p_dict)
+    summary = weekly_summary(profile={"level": profile.level, "wisdom": profile.wisdom})
     # Override with real data when available
     if total_xp > 0:
         summary["xp_gained"] = total_xp
-    summary["total_activities"] = len(recent)
+    summary["total_activities"] = activity_count
     return summary
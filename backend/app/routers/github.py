@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime, timedelta, timezone
 
 import httpx
@@ -12,7 +13,7 @@ from app.services.response_envelope import failure_response, request_id_from_req
 
 router = APIRouter(prefix="/github", tags=["github"])
 GITHUB_USER = "HiRenan"
-GITHUB_API = "https://api.github.com"
+GITHUB_API = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
 ACTIVE_REPO_WINDOW_DAYS = 180
 
 # Fallback repos matching QuestLog.tsx QUESTS when API is unavailable
@@ -11,9 +11,15 @@ from sqlmodel import Session, col, func, select
 
 from app.database import get_session
 from app.models import ChatMessage, PlayerProfile, Skill
+from app.services.conditional_get import conditional_get
+from app.services.gamification_engine import record_event
 from app.services.mock_ai import weekly_summary
+from app.services.oracle_history import count_session_messages, fetch_history_page, note_messages_added
 from app.services.oracle_service import generate_oracle_reply
+from app.services.pagination import InvalidCursorError
+from app.services.players import get_current_player
 from app.services.response_envelope import failure_response, request_id_from_request, success
+from app.services.state_version import bump_version, oracle_scope, player_scope
 
 router = APIRouter(prefix="/oracle", tags=["oracle"])
 
@@ -32,10 +38,7 @@ def _get_oracle_session_id(request: Request) -> str:
     return session_id
 
 
-def _get_profile_dict(session: Session) -> dict | None:
-    profile = session.exec(select(PlayerProfile)).first()
-    if not profile:
-        return None
+def _get_profile_dict(profile: PlayerProfile) -> dict:
     return {
         "name": profile.name,
         "title": profile.title,
@@ -49,19 +52,19 @@ def _get_profile_dict(session: Session) -> dict | None:
     }
 
 
-def _get_skills_list(session: Session) -> list[dict]:
-    skills = session.exec(select(Skill)).all()
+def _get_skills_list(session: Session, player_id: int) -> list[dict]:
+    skills = session.exec(select(Skill).where(Skill.player_id == player_id)).all()
     return [
         {"name": s.name, "level": s.level, "max_level": s.max_level, "unlocked": s.unlocked}
         for s in skills
     ]
 
 
-def _get_recent_history(session: Session, session_id: str, limit: int = 10) -> list[dict]:
+def _get_recent_history(session: Session, player_id: int, session_id: str, limit: int = 10) -> list[dict]:
     messages = session.exec(
         select(ChatMessage)
-        .where(ChatMessage.session_id == session_id)
-        .order_by(col(ChatMessage.id).desc())
+        .where(ChatMessage.player_id == player_id, ChatMessage.session_id == session_id)
+        .order_by(col(ChatMessage.created_at).desc(), col(ChatMessage.id).desc())
         .limit(limit)
     ).all()
     recent = list(reversed(messages))
@@ -73,6 +76,7 @@ async def chat(
     req: ChatRequest,
     request: Request,
     session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
 ):
     """Process chat message with LLM-backed Oracle and persist both sides."""
     request_id = request_id_from_request(request)
@@ -89,21 +93,11 @@ async def chat(
                 retryable=False,
                 status_code=400,
             )
-        recent_history = _get_recent_history(session, session_id=session_id, limit=10)
-
-        # Persist user message
-        user_msg = ChatMessage(
-            session_id=session_id,
-            role="user",
-            text=user_message,
-            context_topic="",
-            created_at=now,
-        )
-        session.add(user_msg)
+        recent_history = _get_recent_history(session, player.id, session_id=session_id, limit=10)
 
         # Get context from DB for richer responses
-        profile = _get_profile_dict(session)
-        skills = _get_skills_list(session)
+        profile = _get_profile_dict(player)
+        skills = _get_skills_list(session, player.id)
 
         # Generate Oracle response with graceful fallback inside service.
         result = await generate_oracle_reply(
@@ -113,8 +107,18 @@ async def chat(
             recent_history=recent_history,
         )
 
-        # Persist Oracle response
+        # Persist both sides after the LLM call so no SQLite write lock is held while awaiting it
+        user_msg = ChatMessage(
+            player_id=player.id,
+            session_id=session_id,
+            role="user",
+            text=user_message,
+            context_topic="",
+            created_at=now,
+        )
+        session.add(user_msg)
         oracle_msg = ChatMessage(
+            player_id=player.id,
             session_id=session_id,
             role="oracle",
             text=result.text,
@@ -122,7 +126,10 @@ async def chat(
             created_at=now,
         )
         session.add(oracle_msg)
+        gamification = record_event(session, "oracle_chat", player_id=player.id)
+        bump_version(session, oracle_scope(player.id))
         session.commit()
+        note_messages_added(player.id, session_id)
 
         return success(
             flow="oracle",
@@ -133,7 +140,7 @@ async def chat(
                 "role": "oracle",
                 "text": result.text,
                 "topic": result.topic,
-                "gamification": None,
+                "gamification": gamification,
             },
         )
     except Exception as exc:  # noqa: BLE001
@@ -152,12 +159,14 @@ async def chat(
 async def get_history(
     request: Request,
     limit: int = 50,
-    offset: int = 0,
+    cursor: str | None = None,
+    include_total: bool = False,
     session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
 ):
-    """Return paginated chat history for current browser session."""
+    """Return cursor-paginated chat history for current browser session."""
     request_id = request_id_from_request(request)
-    if limit < 1 or limit > 200 or offset < 0:
+    if limit < 1 or limit > 200:
         return failure_response(
             flow="oracle",
             request_id=request_id,
@@ -169,31 +178,29 @@ async def get_history(
 
     try:
         session_id = _get_oracle_session_id(request)
-        total = session.exec(
-            select(func.count(ChatMessage.id)).where(ChatMessage.session_id == session_id)
-        ).one()
-
-        messages = session.exec(
-            select(ChatMessage)
-            .where(ChatMessage.session_id == session_id)
-            .order_by(col(ChatMessage.id).asc())
-            .offset(offset)
-            .limit(limit)
-        ).all()
+        page = fetch_history_page(session, player_id=player.id, session_id=session_id, limit=limit, cursor=cursor)
+        total = count_session_messages(session, player.id, session_id) if include_total else None
 
         return success(
             flow="oracle",
             request_id=request_id,
             source="db",
             data={
-                "messages": [
-                    {"id": m.id, "role": m.role, "text": m.text, "created_at": m.created_at}
-                    for m in messages
-                ],
+                "messages": page.messages,
+                "next_cursor": page.next_cursor,
+                "has_more": page.has_more,
                 "total": total,
-                "has_more": offset + limit < total,
             },
         )
+    except InvalidCursorError:
+        return failure_response(
+            flow="oracle",
+            request_id=request_id,
+            code="VALIDATION_ERROR",
+            message="invalid_cursor",
+            retryable=False,
+            status_code=400,
+        )
     except Exception as exc:  # noqa: BLE001
         return failure_response(
             flow="oracle",
@@ -206,24 +213,32 @@ async def get_history(
         )
 
 
-@router.get("/stats")
-async def get_stats(request: Request, session: Session = Depends(get_session)):
+@router.get(
+    "/stats",
+    # Wisdom comes from the profile, topics from this browser session's messages.
+    dependencies=[
+        Depends(conditional_get("oracle-stats", player_scope, oracle_scope, session_id=_get_oracle_session_id))
+    ],
+)
+async def get_stats(
+    request: Request,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
     """Oracle stats for current browser session."""
     request_id = request_id_from_request(request)
     try:
         session_id = _get_oracle_session_id(request)
         # Unique topics explored
-        topics = session.exec(
-            select(ChatMessage.context_topic)
+        unique_topics = session.exec(
+            select(func.count(func.distinct(ChatMessage.context_topic)))
+            .where(ChatMessage.player_id == player.id)
             .where(ChatMessage.session_id == session_id)
             .where(ChatMessage.role == "oracle")
             .where(ChatMessage.context_topic != "")
-        ).all()
-        unique_topics = len(set(topics))
+        ).one()
 
-        # Wisdom from profile
-        profile = session.exec(select(PlayerProfile)).first()
-        wisdom_score = profile.wisdom if profile else 70
+        wisdom_score = player.wisdom
 
         return success(
             flow="oracle",
@@ -247,18 +262,18 @@ async def get_stats(request: Request, session: Session = Depends(get_session)):
 
 
 @router.get("/weekly-summary")
-async def get_weekly(request: Request, session: Session = Depends(get_session)):
+async def get_weekly(
+    request: Request,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
     """Structured weekly summary with Oracle insights."""
     request_id = request_id_from_request(request)
     try:
         session_id = _get_oracle_session_id(request)
-        profile = _get_profile_dict(session)
-        summary = weekly_summary(profile=profile)
+        summary = weekly_summary(profile=_get_profile_dict(player))
 
-        total = session.exec(
-            select(func.count(ChatMessage.id)).where(ChatMessage.session_id == session_id)
-        ).one()
-        summary["total_messages"] = total
+        summary["total_messages"] = count_session_messages(session, player.id, session_id)
         return success(
             flow="oracle",
             request_id=request_id,
@@ -0,0 +1,91 @@
+"""Search endpoint - ranked full-text search across Tavern Board posts and Oracle history."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from sqlmodel import Session
+
+from app.database import get_session
+from app.models import PlayerProfile
+from app.routers.oracle import _get_oracle_session_id
+from app.services.pagination import InvalidCursorError
+from app.services.players import get_current_player
+from app.services.response_envelope import failure_response, request_id_from_request, success
+from app.services.search import SEARCH_KINDS, InvalidSearchQueryError, search
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+MAX_SEARCH_PAGE = 50
+
+
+@router.get("")
+async def search_content(
+    request: Request,
+    q: str = "",
+    type: str = "all",
+    limit: int = 20,
+    cursor: str | None = None,
+    session: Session = Depends(get_session),
+    player: PlayerProfile = Depends(get_current_player),
+):
+    """Return a relevance-ranked page of matching posts and Oracle messages with highlighted snippets.
+
+    `type` is `all`, `blog` or `oracle`. Oracle results come from the current
+    browser session only, like `/oracle/history`.
+    """
+    request_id = request_id_from_request(request)
+    kinds = SEARCH_KINDS if type == "all" else (type,)
+    if limit < 1 or limit > MAX_SEARCH_PAGE or not set(kinds) <= set(SEARCH_KINDS):
+        return failure_response(
+            flow="search",
+            request_id=request_id,
+            code="VALIDATION_ERROR",
+            message="invalid_pagination",
+            retryable=False,
+            status_code=400,
+        )
+
+    try:
+        page = search(
+            session,
+            player_id=player.id,
+            session_id=_get_oracle_session_id(request),
+            query=q,
+            kinds=kinds,
+            limit=limit,
+            cursor=cursor,
+        )
+        return success(
+            flow="search",
+            request_id=request_id,
+            source="db",
+            data={"results": page.results, "next_cursor": page.next_cursor, "has_more": page.has_more},
+        )
+    except InvalidSearchQueryError:
+        return failure_response(
+            flow="search",
+            request_id=request_id,
+            code="VALIDATION_ERROR",
+            message="invalid_query",
+            retryable=False,
+            status_code=400,
+        )
+    except InvalidCursorError:
+        return failure_response(
+            flow="search",
+            request_id=request_id,
+            code="VALIDATION_ERROR",
+            message="invalid_cursor",
+            retryable=False,
+            status_code=400,
+        )
+    except Exception as exc:  # noqa: BLE001
+        return failure_response(
+            flow="search",
+            request_id=request_id,
+            code="DB_ERROR",
+            message="search_failed",
+            retryable=True,
+            status_code=500,
+            details={"error_type": exc.__class__.__name__},
+        )
@@ -1,8 +1,79 @@
-"""Seed initial data matching frontend hardcoded values."""
+"""Seed initial data matching frontend hardcoded values.
 
+Startup calls `seed_database`, which compares a stamp in `stateversion` with
+`SEED_VERSION` and returns after that one-row read when they match. Bump
+`SEED_VERSION` whenever the seed data or the achievement catalog changes so
+the next boot applies it.
+"""
+
+from sqlalchemy import text
 from sqlmodel import Session, select
 
 from app.models import Achievement, BlogPost, ChatMessage, PlayerProfile, Skill
+from app.services.blog_posts import prepare_post, replace_post_tags
+from app.services.state_version import PLAYER_SCOPE, bump_version, get_version, player_scope, set_version
+
+SEED_SCOPE = "seed"
+SEED_VERSION = 1
+
+
+# Skills — matches SkillTree.tsx BRANCHES (3 branches x 5 skills)
+_SKILLS = [
+    # Frontend Arcana
+    ("react", "React", "frontend", "Frontend Arcana", 4, 5, True, "Component-based UI library with hooks, context, and state management patterns.", "#8b5cf6", "DevQuest,Dashboard UI"),
+    ("typescript", "TypeScript", "frontend", "Frontend Arcana", 4, 5, True, "Strongly typed JavaScript for safer, more maintainable code.", "#8b5cf6", "DevQuest,ML Pipeline"),
+    ("tailwind", "Tailwind CSS", "frontend", "Frontend Arcana", 3, 5, True, "Utility-first CSS framework for rapid UI development.", "#8b5cf6", "DevQuest"),
+    ("threejs", "Three.js", "frontend", "Frontend Arcana", 2, 5, True, "3D graphics library for immersive web experiences.", "#8b5cf6", "DevQuest"),
+    ("nextjs", "Next.js", "frontend", "Frontend Arcana", 0, 5, False, "React framework for production — SSR, routing, and optimization.", "#8b5cf6", ""),
+    # Backend Warfare
+    ("python", "Python", "backend", "Backend Warfare", 4, 5, True, "Versatile language for backend, data science, and scripting.", "#3b82f6", "ML Pipeline,DevQuest API"),
+    ("fastapi", "FastAPI", "backend", "Backend Warfare", 3, 5, True, "Modern, high-performance Python web framework with auto docs.", "#3b82f6", "DevQuest API"),
+    ("nodejs", "Node.js", "backend", "Backend Warfare", 3, 5, True, "JavaScript runtime for server-side applications.", "#3b82f6", "Chat API"),
+    ("sql", "SQL", "backend", "Backend Warfare", 3, 5, True, "Database querying and management across multiple engines.", "#3b82f6", "ML Pipeline,DevQuest"),
+    ("docker", "Docker", "backend", "Backend Warfare", 0, 5, False, "Container orchestration for reproducible deployments.", "#3b82f6", ""),
+    # Data Sorcery
+    ("pandas", "Pandas", "data", "Data Sorcery", 3, 5, True, "Data manipulation and analysis library for Python.", "#22c55e", "ML Pipeline"),
+    ("postgresql", "PostgreSQL", "data", "Data Sorcery", 3, 5, True, "Advanced open-source relational database system.", "#22c55e", "ML Pipeline"),
+    ("etl", "ETL Pipelines", "data", "Data Sorcery", 2, 5, True, "Extract, Transform, Load workflows for data processing.", "#22c55e", "ML Pipeline"),
+    ("analytics", "Analytics", "data", "Data Sorcery", 2, 5, True, "Data visualization and business intelligence insights.", "#22c55e", "ML Pipeline"),
+    ("ml", "Machine Learning", "data", "Data Sorcery", 0, 5, False, "Predictive models and intelligent systems. Requires Level 18.", "#22c55e", ""),
+]
+
+# Achievements — matches Hero.tsx BADGES + GuildHall.tsx TITLES
+_ACHIEVEMENTS = [
+    ("First Commit", "Made your first repository contribution", "git-branch", "coding", "#22c55e", True, "2024-01-15"),
+    ("Polyglot", "Proficient in 3+ programming languages", "code", "skills", "#3b82f6", True, "2024-03-20"),
+    ("Star Collector", "Earned 10+ stars across repositories", "star", "social", "#f0c040", True, "2024-06-10"),
+    ("Quest Master", "Completed 5+ major projects", "trophy", "quests", "#8b5cf6", True, "2024-09-01"),
+    ("Bug Hunter", "Fixed 50+ bugs across projects", "flame", "coding", "#ef4444", True, "2024-05-12"),
+    ("Code Wizard", "Wrote 10,000+ lines of clean code", "code", "coding", "#8b5cf6", True, "2024-07-22"),
+    ("Shield Bearer", "Maintained 90%+ test coverage", "shield", "quality", "#3b82f6", True, "2024-08-15"),
+    ("Quest Champion", "Delivered a project ahead of deadline", "trophy", "quests", "#f0c040", True, "2024-11-30"),
+    # Lockable achievements — unlocked dynamically by gamification engine
+    ("Oracle Initiate", "Consulted the Oracle for the first time", "sparkles", "oracle", "#8b5cf6", False, None),
+    ("Oracle Sage", "Sent 20+ messages to the Oracle", "brain", "oracle", "#8b5cf6", False, None),
+    ("Scroll Keeper", "Wrote 3 or more tavern posts", "scroll", "writing", "#22c55e", False, None),
+    ("CV Master", "Uploaded and analyzed your CV", "file-text", "career", "#3b82f6", False, None),
+]
+
+
+def seed_player_state(session: Session, player_id: int, *, fresh: bool = False) -> None:
+    """Add the skill tree and achievements for one player.
+
+    `fresh` players start with every skill at level 0 and every achievement locked.
+    """
+    for skill_id, name, cat, cat_name, level, max_lvl, unlocked, desc, color, projects in _SKILLS:
+        session.add(Skill(
+            player_id=player_id, skill_id=skill_id, name=name, category=cat, category_name=cat_name,
+            level=0 if fresh else level, max_level=max_lvl, unlocked=False if fresh else unlocked,
+            description=desc, color=color, projects="" if fresh else projects,
+        ))
+
+    for name, desc, icon, cat, color, unlocked, date in _ACHIEVEMENTS:
+        session.add(Achievement(
+            player_id=player_id, name=name, description=desc, icon=icon, category=cat,
+            color=color, unlocked=False if fresh else unlocked, unlock_date=None if fresh else date,
+        ))
 
 
 def seed_initial_data(session: Session) -> None:
@@ -25,63 +96,14 @@ def seed_initial_data(session: Session) -> None:
         wisdom=70,
     )
     session.add(profile)
-
-    # Skills — matches SkillTree.tsx BRANCHES (3 branches x 5 skills)
-    skills_data = [
-        # Frontend Arcana
-        ("react", "React", "frontend", "Frontend Arcana", 4, 5, True, "Component-based UI library with hooks, context, and state management patterns.", "#8b5cf6", "DevQuest,Dashboard UI"),
-        ("typescript", "TypeScript", "frontend", "Frontend Arcana", 4, 5, True, "Strongly typed JavaScript for safer, more maintainable code.", "#8b5cf6", "DevQuest,ML Pipeline"),
-        ("tailwind", "Tailwind CSS", "frontend", "Frontend Arcana", 3, 5, True, "Utility-first CSS framework for rapid UI development.", "#8b5cf6", "DevQuest"),
-        ("threejs", "Three.js", "frontend", "Frontend Arcana", 2, 5, True, "3D graphics library for immersive web experiences.", "#8b5cf6", "DevQuest"),
-        ("nextjs", "Next.js", "frontend", "Frontend Arcana", 0, 5, False, "React framework for production — SSR, routing, and optimization.", "#8b5cf6", ""),
-        # Backend Warfare
-        ("python", "Python", "backend", "Backend Warfare", 4, 5, True, "Versatile language for backend, data science, and scripting.", "#3b82f6", "ML Pipeline,DevQuest API"),
-        ("fastapi", "FastAPI", "backend", "Backend Warfare", 3, 5, True, "Modern, high-performance Python web framework with auto docs.", "#3b82f6", "DevQuest API"),
-        ("nodejs", "Node.js", "backend", "Backend Warfare", 3, 5, True, "JavaScript runtime for server-side applications.", "#3b82f6", "Chat API"),
-        ("sql", "SQL", "backend", "Backend Warfare", 3, 5, True, "Database querying and management across multiple engines.", "#3b82f6", "ML Pipeline,DevQuest"),
-        ("docker", "Docker", "backend", "Backend Warfare", 0, 5, False, "Container orchestration for reproducible deployments.", "#3b82f6", ""),
-        # Data Sorcery
-        ("pandas", "Pandas", "data", "Data Sorcery", 3, 5, True, "Data manipulation and analysis library for Python.", "#22c55e", "ML Pipeline"),
-        ("postgresql", "PostgreSQL", "data", "Data Sorcery", 3, 5, True, "Advanced open-source relational database system.", "#22c55e", "ML Pipeline"),
-        ("etl", "ETL Pipelines", "data", "Data Sorcery", 2, 5, True, "Extract, Transform, Load workflows for data processing.", "#22c55e", "ML Pipeline"),
-        ("analytics", "Analytics", "data", "Data Sorcery", 2, 5, True, "Data visualization and business intelligence insights.", "#22c55e", "ML Pipeline"),
-        ("ml", "Machine Learning", "data", "Data Sorcery", 0, 5, False, "Predictive models and intelligent systems. Requires Level 18.", "#22c55e", ""),
-    ]
-
-    for skill_id, name, cat, cat_name, level, max_lvl, unlocked, desc, color, projects in skills_data:
-        session.add(Skill(
-            skill_id=skill_id, name=name, category=cat, category_name=cat_name,
-            level=level, max_level=max_lvl, unlocked=unlocked,
-            description=desc, color=color, projects=projects,
-        ))
-
-    # Achievements — matches Hero.tsx BADGES + GuildHall.tsx TITLES
-    achievements_data = [
-        ("First Commit", "Made your first repository contribution", "git-branch", "coding", "#22c55e", True, "2024-01-15"),
-        ("Polyglot", "Proficient in 3+ programming languages", "code", "skills", "#3b82f6", True, "2024-03-20"),
-        ("Star Collector", "Earned 10+ stars across repositories", "star", "social", "#f0c040", True, "2024-06-10"),
-        ("Quest Master", "Completed 5+ major projects", "trophy", "quests", "#8b5cf6", True, "2024-09-01"),
-        ("Bug Hunter", "Fixed 50+ bugs across projects", "flame", "coding", "#ef4444", True, "2024-05-12"),
-        ("Code Wizard", "Wrote 10,000+ lines of clean code", "code", "coding", "#8b5cf6", True, "2024-07-22"),
-        ("Shield Bearer", "Maintained 90%+ test coverage", "shield", "quality", "#3b82f6", True, "2024-08-15"),
-        ("Quest Champion", "Delivered a project ahead of deadline", "trophy", "quests", "#f0c040", True, "2024-11-30"),
-        # Lockable achievements — unlocked dynamically by gamification engine
-        ("Oracle Initiate", "Consulted the Oracle for the first time", "sparkles", "oracle", "#8b5cf6", False, None),
-        ("Oracle Sage", "Sent 20+ messages to the Oracle", "brain", "oracle", "#8b5cf6", False, None),
-        ("Scroll Keeper", "Wrote 3 or more tavern posts", "scroll", "writing", "#22c55e", False, None),
-        ("CV Master", "Uploaded and analyzed your CV", "file-text", "career", "#3b82f6", False, None),
-    ]
-
-    for name, desc, icon, cat, color, unlocked, date in achievements_data:
-        session.add(Achievement(
-            name=name, description=desc, icon=icon, category=cat,
-            color=color, unlocked=unlocked, unlock_date=date,
-        ))
+    session.flush()
+    seed_player_state(session, profile.id)
 
     # Blog posts — seed only if none exist
     if not session.exec(select(BlogPost)).first():
         blog_posts = [
             BlogPost(
+                player_id=profile.id,
                 title="Won ActInSpace Hackathon — 1st Place!",
                 content="## Representing Brazil on the World Stage\n\nOur team competed in the **ActInSpace international hackathon** in France, tackling real challenges from the European Space Agency.\n\nWe developed an innovative solution combining satellite data with AI-powered analytics, and the judges awarded us **1st place** out of teams from over 20 countries.\n\n### Key Takeaways\n- Cross-cultural collaboration is a superpower\n- Space tech is more accessible than ever\n- 48-hour sprints teach you more than months of comfortable coding\n\nThis was a career-defining moment. Grateful for the team and the opportunity.",
                 category="achievement",
@@ -92,6 +114,7 @@ def seed_initial_data(session: Session) -> None:
                 updated_at="2026-01-20T10:00:00",
             ),
             BlogPost(
+                player_id=profile.id,
                 title="Started AI Residency at SENAI/SC",
                 content="## A New Chapter Begins\n\nExcited to announce that I've started my **AI Residency** at SENAI/SC, one of Brazil's premier technology institutions.\n\nThe program covers:\n- **Machine Learning** & Deep Learning fundamentals\n- **Computer Vision** applications for industry\n- **Generative AI** and LLM fine-tuning\n- **Embedded AI** for IoT devices\n- MLOps and production deployment\n\nLooking forward to bridging the gap between theoretical AI and real-world industrial applications.",
                 category="update",
@@ -102,6 +125,7 @@ def seed_initial_data(session: Session) -> None:
                 updated_at="2025-03-15T09:00:00",
             ),
             BlogPost(
+                player_id=profile.id,
                 title="DevQuest: Building My Career as an RPG",
                 content="## Why Gamify a Portfolio?\n\nTraditional portfolios are static and boring. I wanted something that tells a **story** — my story as a developer, gamified.\n\n**DevQuest** transforms my career into an RPG adventure:\n- **Skill Tree** with real technologies I've mastered\n- **Quest Log** tracking GitHub projects as quests\n- **Chronicle** as an interactive timeline\n- **Oracle** — an AI advisor (mock, for now)\n\n### Tech Stack\n- React 19 + TypeScript + Vite\n- FastAPI + SQLModel + SQLite\n- Tailwind CSS v4 + Framer Motion\n- Three.js for particle effects\n\nBuilding this project taught me more about frontend architecture than any course ever could.",
                 category="project",
@@ -112,6 +136,7 @@ def seed_initial_data(session: Session) -> None:
                 updated_at="2025-06-10T14:00:00",
             ),
             BlogPost(
+                player_id=profile.id,
                 title="2nd Place at AKCIT Hackathon",
                 content="## 48 Hours of Pure Innovation\n\nOur team secured **2nd place** at the AKCIT Hackathon with a Generative AI solution for automated document analysis.\n\nWe built a pipeline that:\n1. Ingests unstructured documents\n2. Extracts key entities using NLP\n3. Generates structured summaries with an LLM\n4. Presents results in an interactive dashboard\n\n### Lessons Learned\n- Rapid prototyping > perfect architecture\n- Team communication is the real bottleneck\n- Demo polish matters as much as technical depth\n\nAlready looking forward to the next hackathon challenge!",
                 category="achievement",
@@ -123,11 +148,15 @@ def seed_initial_data(session: Session) -> None:
             ),
         ]
         for post in blog_posts:
+            tags = prepare_post(post)
             session.add(post)
+            session.flush()
+            replace_post_tags(session, post_id=post.id, player_id=profile.id, tags=tags)
 
     # Seed Oracle greeting if no messages exist
     if not session.exec(select(ChatMessage)).first():
         session.add(ChatMessage(
+            player_id=profile.id,
             role="oracle",
             text="Greetings, adventurer! I am the Oracle of DevQuest, keeper of ancient coding wisdom. "
                  "Ask me about your skills, career path, projects, or how to level up your developer profile.",
@@ -135,6 +164,7 @@ def seed_initial_data(session: Session) -> None:
             created_at="2025-01-01T00:00:00",
         ))
 
+    bump_version(session, player_scope(profile.id))
     session.commit()
 
 
@@ -146,14 +176,52 @@ _LOCKABLE_ACHIEVEMENTS = [
     ("CV Master", "Uploaded and analyzed your CV", "file-text", "career", "#3b82f6"),
 ]
 
+# One statement per catalog entry covers every player, so the number of
+# round trips follows the catalog size rather than the number of rows.
+_INSERT_MISSING_ACHIEVEMENT = text(
+    "INSERT INTO achievement (player_id, name, description, icon, category, color, unlocked, unlock_date) "
+    "SELECT p.id, :name, :description, :icon, :category, :color, false, NULL FROM playerprofile p "
+    "WHERE NOT EXISTS (SELECT 1 FROM achievement a WHERE a.player_id = p.id AND a.name = :name)"
+)
+_UPDATE_ACHIEVEMENT_METADATA = text(
+    "UPDATE achievement SET description = :description, icon = :icon, category = :category, color = :color "
+    "WHERE name = :name AND NOT (description = :description AND icon = :icon "
+    "AND category = :category AND color = :color)"
+)
+
+# Any player's achievements may have changed, so every player's cached views are stale.
+_BUMP_EVERY_PLAYER = text(
+    f"INSERT INTO stateversion (scope, version) SELECT '{PLAYER_SCOPE}:' || id, 1 FROM playerprofile WHERE true "
+    "ON CONFLICT(scope) DO UPDATE SET version = version + 1"
+)
+
 
 def ensure_achievements(session: Session) -> None:
-    """Insert lockable achievements if they don't exist yet (for existing DBs)."""
-    for name, desc, icon, cat, color in _LOCKABLE_ACHIEVEMENTS:
-        exists = session.exec(select(Achievement).where(Achievement.name == name)).first()
-        if not exists:
-            session.add(Achievement(
-                name=name, description=desc, icon=icon, category=cat,
-                color=color, unlocked=False, unlock_date=None,
-            ))
+    """Upsert the lockable achievement catalog for every player.
+
+    Missing achievements are added locked; existing ones keep their unlock
+    state and only pick up catalog metadata changes.
+    """
+    params = [
+        {"name": name, "description": desc, "icon": icon, "category": cat, "color": color}
+        for name, desc, icon, cat, color in _LOCKABLE_ACHIEVEMENTS
+    ]
+    connection = session.connection()
+    connection.execute(_UPDATE_ACHIEVEMENT_METADATA, params)
+    connection.execute(_INSERT_MISSING_ACHIEVEMENT, params)
+    connection.execute(_BUMP_EVERY_PLAYER)
+    session.commit()
+
+
+def seed_database(session: Session) -> bool:
+    """Apply seed data and catalog changes unless the stored stamp is current.
+
+    Returns whether any work was done.
+    """
+    if get_version(session, SEED_SCOPE) >= SEED_VERSION:
+        return False
+    seed_initial_data(session)
+    ensure_achievements(session)
+    set_version(session, SEED_SCOPE, SEED_VERSION)
     session.commit()
+    return True
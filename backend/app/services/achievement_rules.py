@@ -0,0 +1,118 @@
+"""Declarative achievement rules, evaluated per event.
+
+A rule unlocks an achievement when a counter reaches a threshold, and each
+counter names the events that can change it. The rule table is indexed by
+event once at import. An event therefore only looks at the rules it can
+affect, and an event with no rules costs nothing.
+
+Evaluating an event costs a fixed number of statements, however many rules
+exist:
+- one lookup of the player's still-locked achievements among those rules;
+- one COUNT per distinct counter involved (usually one);
+- one UPDATE for everything that unlocked.
+
+Achievement names match the catalog seeded by `app.seed`; add the catalog entry
+and the rule together.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Select, update
+from sqlmodel import Session, col, func, select
+
+from app.models import Achievement, BlogPost, ChatMessage, CVAnalysis
+
+
+@dataclass(frozen=True)
+class Counter:
+    events: frozenset[str]  # actions that can change the count
+    statement: Callable[[int], Select]  # the player's current count
+
+
+@dataclass(frozen=True)
+class AchievementRule:
+    achievement: str
+    counter: str
+    threshold: int
+
+
+COUNTERS: dict[str, Counter] = {
+    "oracle_messages": Counter(
+        frozenset({"oracle_chat"}),
+        lambda player_id: select(func.count(ChatMessage.id)).where(
+            ChatMessage.player_id == player_id, ChatMessage.role == "user"
+        ),
+    ),
+    "blog_posts": Counter(
+        frozenset({"blog_create"}),
+        lambda player_id: select(func.count(BlogPost.id)).where(BlogPost.player_id == player_id),
+    ),
+    "cv_analyses": Counter(
+        frozenset({"cv_upload"}),
+        lambda player_id: select(func.count(CVAnalysis.id)).where(CVAnalysis.player_id == player_id),
+    ),
+}
+
+RULES: tuple[AchievementRule, ...] = (
+    AchievementRule("Oracle Initiate", "oracle_messages", 1),
+    AchievementRule("Oracle Sage", "oracle_messages", 20),
+    AchievementRule("Scroll Keeper", "blog_posts", 3),
+    AchievementRule("CV Master", "cv_analyses", 1),
+)
+
+
+def index_rules(
+    rules: tuple[AchievementRule, ...], counters: dict[str, Counter]
+) -> dict[str, dict[str, AchievementRule]]:
+    """Map each event to the rules (by achievement name) whose counter it can change."""
+    by_event: dict[str, dict[str, AchievementRule]] = {}
+    for rule in rules:
+        for event in counters[rule.counter].events:
+            by_event.setdefault(event, {})[rule.achievement] = rule
+    return by_event
+
+
+_RULES_BY_EVENT = index_rules(RULES, COUNTERS)
+
+
+def evaluate_event(session: Session, player_id: int, event: str) -> list[dict[str, Any]]:
+    """Unlock the player's achievements that `event` completed, in the session's transaction.
+
+    Returns the newly unlocked achievements for the frontend toast system.
+    """
+    rules = _RULES_BY_EVENT.get(event)
+    if not rules:
+        return []
+
+    locked = session.exec(
+        select(Achievement.id, Achievement.name, Achievement.description, Achievement.icon, Achievement.color).where(
+            Achievement.player_id == player_id,
+            Achievement.unlocked == False,  # noqa: E712
+            col(Achievement.name).in_(list(rules)),
+        )
+    ).all()
+    if not locked:
+        return []
+
+    counts: dict[str, int] = {}
+    for counter in {rules[row.name].counter for row in locked}:
+        counts[counter] = session.exec(COUNTERS[counter].statement(player_id)).one() or 0
+
+    earned = [row for row in locked if counts[rules[row.name].counter] >= rules[row.name].threshold]
+    if not earned:
+        return []
+    # ORM-enabled bulk UPDATE: Achievement objects already loaded in this session
+    # are updated in place too, without another round trip.
+    session.exec(
+        update(Achievement)
+        .where(col(Achievement.id).in_([row.id for row in earned]))
+        .values(unlocked=True, unlock_date=datetime.now(timezone.utc).strftime("%Y-%m-%d"))
+    )
+    return [
+        {"name": row.name, "description": row.description, "icon": row.icon, "color": row.color} for row in earned
+    ]
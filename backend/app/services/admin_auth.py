@@ -0,0 +1,24 @@
+"""Shared-secret guard for operator endpoints.
+
+Admin routes are disabled (404) unless `ADMIN_TOKEN` is set; callers send the
+token in the `X-Admin-Token` header.
+"""
+
+from __future__ import annotations
+
+import hmac
+import os
+
+from fastapi import HTTPException, Request
+
+ADMIN_HEADER = "X-Admin-Token"
+
+
+def require_admin(request: Request) -> None:
+    """FastAPI dependency: reject the request unless it carries the admin token."""
+    expected = os.getenv("ADMIN_TOKEN", "").strip()
+    if not expected:
+        raise HTTPException(status_code=404, detail="Not Found")
+    provided = request.headers.get(ADMIN_HEADER, "")
+    if not hmac.compare_digest(provided.encode("utf-8"), expected.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="admin_token_invalid")
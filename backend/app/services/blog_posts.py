@@ -0,0 +1,247 @@
+"""Tavern Board listing: normalized tags, stored excerpts and keyset pages.
+
+Each post stores its rendered HTML and a plain-text `excerpt` next to the
+markdown. Both are built when the content is written, and only if its
+`content_hash` changed, so reads never render and list pages never read or
+ship the full body. Tags are also stored one row
+per tag in `posttag`. A tag filter is then an index lookup instead of a scan
+of comma-separated strings. Pages are ordered by `(pinned, created_at, id)`,
+newest first, and continue from an opaque cursor. A page therefore costs one
+index range scan however many posts the player has.
+
+Startup re-renders stored posts once per `RENDERER_VERSION` (see
+`ensure_posts_rendered`). Run the same pass by hand, e.g. after a restore, with:
+
+    python -m app.services.blog_posts --render
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Boolean, Engine, bindparam, delete, insert, literal, tuple_, update
+from sqlmodel import Session, col, func, select
+
+from app.models import BlogPost, PostTag
+from app.services.markdown_render import RENDERER_VERSION, content_hash, render_markdown
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.state_version import blog_scope, bump_version, get_version, set_version
+
+logger = logging.getLogger(__name__)
+
+EXCERPT_CHARS = 200
+MAX_TAGS_PER_POST = 20
+MAX_TAG_CHARS = 40
+RENDER_BATCH_ROWS = 500
+# Stamp in `stateversion`: the renderer version all stored posts were last checked against.
+RENDER_SCOPE = "renderer"
+
+# Everything but the body; list views read the excerpt instead.
+SUMMARY_COLUMNS = tuple(
+    column for column in BlogPost.__table__.columns if column.name not in {"content", "content_html"}
+)
+FULL_COLUMNS = tuple(BlogPost.__table__.columns)
+
+_MARKDOWN_NOISE = [
+    (re.compile(r"```.*?```", re.DOTALL), " "),  # fenced code
+    (re.compile(r"!\[([^\]]*)\]\([^)]*\)"), r"\1"),  # images -> alt text
+    (re.compile(r"\[([^\]]*)\]\([^)]*\)"), r"\1"),  # links -> label
+    (re.compile(r"^\s{0,3}(#{1,6}|>|[-*+]|\d+\.)\s+", re.MULTILINE), ""),  # headings, quotes, list markers
+    (re.compile(r"[*_`~]+"), ""),  # emphasis and inline code
+    (re.compile(r"\s+"), " "),
+]
+
+
+@dataclass(frozen=True)
+class BlogPage:
+    posts: list[dict[str, Any]]
+    total: int | None
+    next_cursor: str | None
+    has_more: bool
+
+
+def normalize_tags(tags: str) -> list[str]:
+    """Lower-cased, de-duplicated tags from a comma-separated string, in their original order."""
+    seen: dict[str, None] = {}
+    for raw in tags.split(","):
+        tag = raw.strip().lower()[:MAX_TAG_CHARS]
+        if tag:
+            seen.setdefault(tag, None)
+    return list(seen)[:MAX_TAGS_PER_POST]
+
+
+def make_excerpt(content: str, limit: int = EXCERPT_CHARS) -> str:
+    """Plain-text preview of markdown `content`, cut at a word boundary."""
+    text = content
+    for pattern, replacement in _MARKDOWN_NOISE:
+        text = pattern.sub(replacement, text)
+    text = text.strip()
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(" ", 1)[0] or text[:limit]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def rendered_fields(content: str) -> dict[str, str]:
+    """The stored renderings of `content`: HTML, excerpt and the hash they are keyed by."""
+    return {
+        "content_html": render_markdown(content),
+        "excerpt": make_excerpt(content),
+        "content_hash": content_hash(content),
+    }
+
+
+def prepare_post(post: BlogPost) -> list[str]:
+    """Normalize `post.tags` and re-render its content if it changed; returns the tags for `replace_post_tags`."""
+    tags = normalize_tags(post.tags)
+    post.tags = ",".join(tags)
+    if post.content_hash != content_hash(post.content):
+        for name, value in rendered_fields(post.content).items():
+            setattr(post, name, value)
+    return tags
+
+
+def render_stale_posts(engine: Engine, batch_rows: int = RENDER_BATCH_ROWS) -> int:
+    """Re-render posts whose stored HTML is missing or from an older renderer; returns how many.
+
+    Each batch commits on its own, so an interrupted pass can simply be re-run.
+    """
+    select_batch = (
+        select(BlogPost.id, BlogPost.player_id, BlogPost.content, BlogPost.content_hash)
+        .where(BlogPost.id > bindparam("after"))
+        .order_by(col(BlogPost.id))
+        .limit(batch_rows)
+    )
+    # SET columns come from each parameter dict: content_html, excerpt, content_hash.
+    update_post = update(BlogPost.__table__).where(BlogPost.id == bindparam("post_id"))
+    after, total = 0, 0
+    while True:
+        with Session(engine) as session:
+            rows = session.connection().execute(select_batch, {"after": after}).fetchall()
+            if not rows:
+                break
+            stale = [row for row in rows if row.content_hash != content_hash(row.content or "")]
+            if stale:
+                session.connection().execute(
+                    update_post, [{"post_id": row.id, **rendered_fields(row.content or "")} for row in stale]
+                )
+                # Board responses embed the HTML, so their cached copies are stale too.
+                for player_id in {row.player_id for row in stale}:
+                    bump_version(session, blog_scope(player_id))
+                session.commit()
+        after, total = rows[-1].id, total + len(stale)
+    if total:
+        logger.info("blog_render posts=%s renderer_version=%s", total, RENDERER_VERSION)
+    return total
+
+
+def ensure_posts_rendered(engine: Engine) -> bool:
+    """Run `render_stale_posts` unless it already ran for this `RENDERER_VERSION`.
+
+    Returns whether a pass ran; otherwise this costs a single stamp read.
+    """
+    with Session(engine) as session:
+        if get_version(session, RENDER_SCOPE) >= RENDERER_VERSION:
+            return False
+    render_stale_posts(engine)
+    with Session(engine) as session:
+        set_version(session, RENDER_SCOPE, RENDERER_VERSION)
+        session.commit()
+    return True
+
+
+def replace_post_tags(session: Session, *, post_id: int, player_id: int, tags: list[str]) -> None:
+    """Make `posttag` hold exactly `tags` for the post, in the session's transaction."""
+    delete_post_tags(session, post_id)
+    if tags:
+        session.connection().execute(
+            insert(PostTag), [{"post_id": post_id, "tag": tag, "player_id": player_id} for tag in tags]
+        )
+
+
+def delete_post_tags(session: Session, post_id: int) -> None:
+    session.connection().execute(delete(PostTag).where(PostTag.post_id == post_id))
+
+
+def encode_post_cursor(pinned: bool, created_at: str, post_id: int) -> str:
+    return encode_cursor(int(pinned), created_at, post_id)
+
+
+def fetch_posts_page(
+    session: Session,
+    *,
+    player_id: int,
+    limit: int,
+    cursor: str | None = None,
+    category: str | None = None,
+    tag: str | None = None,
+    full: bool = False,
+) -> BlogPage:
+    """One page of a player's posts, pinned first then newest; `total` is counted on the first page only."""
+    filters = [BlogPost.player_id == player_id]
+    if category:
+        filters.append(BlogPost.category == category)
+    if tag:
+        tagged = select(PostTag.post_id).where(PostTag.player_id == player_id, PostTag.tag == tag.strip().lower())
+        filters.append(col(BlogPost.id).in_(tagged))
+
+    statement = select(*(FULL_COLUMNS if full else SUMMARY_COLUMNS)).where(*filters)
+    if cursor:
+        pinned, created_at, post_id = decode_cursor(cursor, int, str, int)
+        # Bound as a boolean: Postgres will not compare a boolean column with an integer.
+        after = tuple_(literal(bool(pinned), Boolean()), created_at, post_id)
+        statement = statement.where(tuple_(BlogPost.pinned, BlogPost.created_at, BlogPost.id) < after)
+    rows = session.exec(
+        statement.order_by(
+            col(BlogPost.pinned).desc(), col(BlogPost.created_at).desc(), col(BlogPost.id).desc()
+        ).limit(limit + 1)
+    ).all()
+
+    has_more = len(rows) > limit
+    posts = [row._asdict() for row in rows[:limit]]
+    total = None
+    if cursor is None:
+        # A first page that holds everything is its own count.
+        total = len(posts)
+        if has_more:
+            total = session.exec(select(func.count()).select_from(BlogPost).where(*filters)).one()
+    next_cursor = None
+    if has_more and posts:
+        last = posts[-1]
+        next_cursor = encode_post_cursor(last["pinned"], last["created_at"], last["id"])
+    return BlogPage(posts=posts, total=total, next_cursor=next_cursor, has_more=has_more)
+
+
+def tag_counts(session: Session, player_id: int) -> list[dict[str, Any]]:
+    """How many of the player's posts carry each tag, most used first."""
+    uses = func.count().label("uses")
+    rows = session.exec(
+        select(PostTag.tag, uses)
+        .where(PostTag.player_id == player_id)
+        .group_by(PostTag.tag)
+        .order_by(uses.desc(), PostTag.tag)
+    ).all()
+    return [{"tag": tag, "count": count} for tag, count in rows]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="DevQuest Tavern Board posts")
+    parser.add_argument("--render", action="store_true", help="Re-render posts whose stored HTML is stale.")
+    args = parser.parse_args(argv)
+    if not args.render:
+        parser.print_help()
+        return 1
+
+    from app.database import engine
+
+    print(f"posts_rendered={render_stale_posts(engine)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Conditional GET for read-mostly endpoints, driven by `stateversion` counters.
+
+A route opts in with `dependencies=[Depends(conditional_get("profile", player_scope))]`.
+The dependency reads the listed version scopes for the current player in one
+query and derives a weak ETag from them. If the request's If-None-Match
+matches, it raises a 304 before the endpoint runs, so neither the endpoint's
+queries nor its serialization happen. Otherwise it leaves the validator
+headers in `request.state`, and `ConditionalGetMiddleware` adds them to the
+200 response.
+
+Writers bump the matching scopes in the same transaction as their change
+(`award_xp`, blog CRUD, CV upload, Oracle chat), so a tag can only match data
+that has not changed since.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+
+from fastapi import Depends, HTTPException, Request
+from sqlmodel import Session
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database import get_session
+from app.models import PlayerProfile
+from app.services.http_cache import etag_matches
+from app.services.players import PLAYER_HEADER, get_current_player
+from app.services.state_version import get_versions
+
+# Shared caches (the edge proxy) may store these, but must revalidate each
+# time; a revalidation is a 304 from the version lookup above.
+SHARED_CACHE_CONTROL = "public, no-cache"
+# Responses that depend on the browser's session cookie stay out of shared caches.
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+_STATE_KEY = "conditional_get_headers"
+
+
+def conditional_get(
+    resource: str,
+    *scopes: Callable[[int], str],
+    session_id: Callable[[Request], str] | None = None,
+) -> Callable[..., None]:
+    """Build a dependency that answers 304 when `scopes` are unchanged for the player.
+
+    Resources that also depend on the browser session pass `session_id`; their
+    tag includes a hash of it and they are marked private.
+    """
+
+    def dependency(
+        request: Request,
+        session: Session = Depends(get_session),
+        player: PlayerProfile = Depends(get_current_player),
+    ) -> None:
+        versions = get_versions(session, [scope(player.id) for scope in scopes])
+        tag = f"{resource}-p{player.id}-v{'.'.join(str(version) for version in versions)}"
+        if session_id is not None:
+            tag += "-s" + hashlib.sha256(session_id(request).encode("utf-8")).hexdigest()[:12]
+        headers = {
+            "ETag": f'W/"{tag}"',
+            "Cache-Control": PRIVATE_CACHE_CONTROL if session_id else SHARED_CACHE_CONTROL,
+            "Vary": f"{PLAYER_HEADER}, Cookie" if session_id else PLAYER_HEADER,
+        }
+        if etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+            raise HTTPException(status_code=304, headers=headers)
+        setattr(request.state, _STATE_KEY, headers)
+
+    return dependency
+
+
+class ConditionalGetMiddleware:
+    """Copy validator headers left by `conditional_get` onto the 200 response."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        state = scope.setdefault("state", {})
+
+        async def send_with_validators(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = state.get(_STATE_KEY)
+                if headers:
+                    raw = list(message.get("headers", []))
+                    present = {name.lower() for name, _ in raw}
+                    raw.extend(
+                        (name.lower().encode("latin-1"), value.encode("latin-1"))
+                        for name, value in headers.items()
+                        if name.lower().encode("latin-1") not in present
+                    )
+                    message["headers"] = raw
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
@@ -0,0 +1,161 @@
+"""Bulk RPG CV export streamed as a ZIP archive.
+
+Each (profile, format) pair is rendered by `render_rpg_cv` on the shared render
+workers, and entries are written to the archive in completion order. The ZIP
+is produced on a non-seekable sink (sizes and CRCs go into data descriptors),
+so each entry's bytes can be sent as soon as it is finished and the archive is
+never held in memory as a whole. Each player's latest CV analysis goes next to
+their CVs, and `manifest.json` is written last.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import zipfile
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlmodel import Session, col, select
+
+from app.models import PlayerProfile
+from app.services.cv_export_service import (
+    CVExportNotFoundError,
+    _slugify,
+    load_rpg_cv_data,
+    render_rpg_cv,
+    run_render,
+)
+from app.services.cv_export_templates import EXPORT_FORMATS, CVExportData
+
+MAX_BULK_PROFILES = 50
+MANIFEST_NAME = "manifest.json"
+
+# PDFs are already deflated internally; compressing them again only costs CPU.
+_STORED_FORMATS = {"pdf"}
+
+
+@dataclass(frozen=True)
+class BulkExportJob:
+    profile_id: int
+    folder: str
+    fmt: str
+    data: CVExportData
+
+
+class _ZipSink(io.RawIOBase):
+    """Write-only, non-seekable buffer that hands back what was written since the last drain."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def plan_bulk_export(
+    session: Session,
+    *,
+    profile_ids: list[int] | None,
+    formats: list[str],
+) -> list[BulkExportJob]:
+    """Load export data for each profile (all profiles when `profile_ids` is empty).
+
+    Data is read here, on the request's session, so render workers only see
+    immutable `CVExportData` and never touch the database.
+    """
+    if not profile_ids:
+        statement = select(PlayerProfile.id).order_by(col(PlayerProfile.id)).limit(MAX_BULK_PROFILES)
+        profile_ids = [int(profile_id) for profile_id in session.exec(statement).all()]
+    if not profile_ids:
+        raise CVExportNotFoundError("player_profile_not_found")
+
+    jobs: list[BulkExportJob] = []
+    for profile_id in dict.fromkeys(profile_ids):
+        data = load_rpg_cv_data(session, profile_id)
+        folder = f"{_slugify(data.name)}-{profile_id}"
+        jobs.extend(BulkExportJob(profile_id=profile_id, folder=folder, fmt=fmt, data=data) for fmt in formats)
+    return jobs
+
+
+def _zip_info(name: str, *, compress: bool) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=datetime.now(timezone.utc).timetuple()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def _manifest_entry(name: str, content: bytes, **extra: Any) -> dict[str, Any]:
+    return {"path": name, "size": len(content), "sha256": hashlib.sha256(content).hexdigest(), **extra}
+
+
+async def _render_job(job: BulkExportJob) -> tuple[BulkExportJob, bytes, str]:
+    content, filename = await run_render(render_rpg_cv, job.data, job.fmt)
+    return job, content, filename
+
+
+async def stream_bulk_export(
+    jobs: list[BulkExportJob],
+    *,
+    analysis_reports: dict[int, dict[str, Any]] | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield the ZIP archive chunk by chunk, one chunk per finished entry."""
+    sink = _ZipSink()
+    archive = zipfile.ZipFile(sink, mode="w")
+    entries: list[dict[str, Any]] = []
+    tasks = [asyncio.ensure_future(_render_job(job)) for job in jobs]
+    try:
+        folders = {job.profile_id: job.folder for job in jobs}
+        for profile_id, report in (analysis_reports or {}).items():
+            name = f"{folders[profile_id]}/cv-analysis.json"
+            content = json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8")
+            archive.writestr(_zip_info(name, compress=True), content)
+            entries.append(
+                _manifest_entry(name, content, kind="cv_analysis", profile_id=profile_id, analysis_id=report.get("id"))
+            )
+            yield sink.drain()
+
+        for finished in asyncio.as_completed(tasks):
+            job, content, filename = await finished
+            name = f"{job.folder}/{filename}"
+            archive.writestr(_zip_info(name, compress=job.fmt not in _STORED_FORMATS), content)
+            entries.append(
+                _manifest_entry(
+                    name,
+                    content,
+                    kind="rpg_cv",
+                    profile_id=job.profile_id,
+                    format=job.fmt,
+                    media_type=EXPORT_FORMATS[job.fmt].media_type,
+                )
+            )
+            yield sink.drain()
+
+        manifest = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "profiles": sorted({job.profile_id for job in jobs}),
+            "formats": list(dict.fromkeys(job.fmt for job in jobs)),
+            "entries": entries,
+        }
+        archive.writestr(_zip_info(MANIFEST_NAME, compress=True), json.dumps(manifest, indent=2).encode("utf-8"))
+        archive.close()
+        yield sink.drain()
+    finally:
+        # A client disconnect closes the generator early; stop renders nobody will read.
+        for task in tasks:
+            task.cancel()
@@ -1,16 +1,33 @@
-"""RPG CV PDF export service for Guild Hall."""
+"""RPG CV export service for Guild Hall (PDF, HTML and Markdown)."""
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from io import BytesIO
-from textwrap import wrap
+from typing import TypeVar
 
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
+import anyio
 from sqlmodel import Session, select
 
 from app.models import Achievement, PlayerProfile, Skill
+from app.services.cv_export_templates import (
+    EXPORT_FORMATS,
+    CVExportData,
+    SkillBranch,
+    build_rpg_cv_document,
+)
+from app.services.shared_state import get_store
+from app.services.state_version import get_version, player_scope
+
+# Entries are keyed by player version, so a stale one is never served; the TTL
+# only bounds how long superseded renders linger in the shared store.
+RENDER_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+T = TypeVar("T")
 
 
 class CVExportError(Exception):
@@ -21,28 +38,20 @@ class CVExportNotFoundError(CVExportError):
     """Raised when required player data is missing."""
 
 
+@dataclass(frozen=True)
+class RenderedCV:
+    content: bytes
+    filename: str
+    media_type: str
+    etag: str
+
+
 def _slugify(text: str) -> str:
     clean = "".join(ch if ch.isalnum() else "-" for ch in text.lower())
     collapsed = "-".join(part for part in clean.split("-") if part)
     return collapsed or "player"
 
 
-def _draw_wrapped(
-    pdf: canvas.Canvas,
-    *,
-    text: str,
-    x: float,
-    y: float,
-    width_chars: int = 90,
-    line_height: float = 14,
-) -> float:
-    lines = wrap(text, width=width_chars) or [text]
-    for line in lines:
-        pdf.drawString(x, y, line)
-        y -= line_height
-    return y
-
-
 def _group_skills(skills: list[Skill]) -> dict[str, list[Skill]]:
     grouped: dict[str, list[Skill]] = {}
     for skill in skills:
@@ -51,146 +60,170 @@ def _group_skills(skills: list[Skill]) -> dict[str, list[Skill]]:
     return grouped
 
 
-def generate_rpg_cv_pdf(session: Session) -> tuple[bytes, str]:
-    """Generate RPG CV PDF bytes and suggested filename."""
-    profile = session.exec(select(PlayerProfile)).first()
+def load_rpg_cv_data(session: Session, player_id: int) -> CVExportData:
+    """Read everything one player's RPG CV shows into a render-ready data model."""
+    profile = session.get(PlayerProfile, player_id)
     if not profile:
         raise CVExportNotFoundError("player_profile_not_found")
 
-    skills = session.exec(select(Skill).order_by(Skill.category, Skill.name)).all()
+    skills = session.exec(
+        select(Skill).where(Skill.player_id == player_id).order_by(Skill.category, Skill.name)
+    ).all()
     achievements = session.exec(
-        select(Achievement).where(Achievement.unlocked.is_(True)).order_by(Achievement.name)
+        select(Achievement)
+        .where(Achievement.player_id == player_id, Achievement.unlocked.is_(True))
+        .order_by(Achievement.name)
     ).all()
 
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=A4)
-    page_width, page_height = A4
-
-    margin_x = 42
-    y = page_height - 48
-
-    def ensure_space(min_y: float = 90) -> None:
-        nonlocal y
-        if y > min_y:
-            return
-        pdf.showPage()
-        y = page_height - 48
-        pdf.setFont("Helvetica", 10)
-
-    pdf.setTitle(f"{profile.name} RPG CV")
-    pdf.setAuthor("DevQuest")
-
-    pdf.setFont("Helvetica-Bold", 20)
-    pdf.drawString(margin_x, y, "DevQuest RPG CV")
-    y -= 28
-
-    pdf.setFont("Helvetica", 11)
-    y = _draw_wrapped(
-        pdf,
-        text=f"{profile.name} - {profile.title} (Level {profile.level})",
-        x=margin_x,
-        y=y,
-        width_chars=80,
-    )
-    y = _draw_wrapped(
-        pdf,
-        text=f"XP: {profile.xp} / {profile.xp_next_level} | Class: {profile.dev_class}",
-        x=margin_x,
-        y=y,
-        width_chars=80,
-    )
-    y = _draw_wrapped(
-        pdf,
-        text=f"Generated at: {datetime.now(timezone.utc).isoformat()}",
-        x=margin_x,
-        y=y,
-        width_chars=90,
+    grouped_skills = _group_skills(skills)
+    branches = []
+    for branch_name in sorted(grouped_skills.keys()):
+        unlocked = [(s.name, s.level, s.max_level) for s in grouped_skills[branch_name] if s.unlocked]
+        if unlocked:
+            branches.append(SkillBranch(name=branch_name, skills=unlocked))
+
+    return CVExportData(
+        name=profile.name,
+        title=profile.title,
+        dev_class=profile.dev_class,
+        level=profile.level,
+        xp=profile.xp,
+        xp_next_level=profile.xp_next_level,
+        stats=[
+            ("STR", profile.strength, "Problem Solving"),
+            ("INT", profile.intelligence, "Technical Knowledge"),
+            ("DEX", profile.dexterity, "Adaptability"),
+            ("WIS", profile.wisdom, "Soft Skills"),
+        ],
+        branches=branches,
+        achievements=[(a.name, a.description) for a in achievements],
+        generated_at=datetime.now(timezone.utc).isoformat(),
     )
-    y -= 8
-
-    ensure_space()
-    pdf.setFont("Helvetica-Bold", 13)
-    pdf.drawString(margin_x, y, "Attributes")
-    y -= 18
-
-    pdf.setFont("Helvetica", 10)
-    stats = [
-        ("STR", profile.strength, "Problem Solving"),
-        ("INT", profile.intelligence, "Technical Knowledge"),
-        ("DEX", profile.dexterity, "Adaptability"),
-        ("WIS", profile.wisdom, "Soft Skills"),
-    ]
-    for code, value, label in stats:
-        y = _draw_wrapped(
-            pdf,
-            text=f"- {code}: {value}/100 ({label})",
-            x=margin_x,
-            y=y,
-            width_chars=90,
-        )
 
-    y -= 10
-    ensure_space()
-    pdf.setFont("Helvetica-Bold", 13)
-    pdf.drawString(margin_x, y, "Equipment Slots (Unlocked Skills)")
-    y -= 18
 
-    grouped_skills = _group_skills(skills)
-    pdf.setFont("Helvetica", 10)
-    for branch_name in sorted(grouped_skills.keys()):
-        branch_skills = [s for s in grouped_skills[branch_name] if s.unlocked]
-        if not branch_skills:
-            continue
-        ensure_space()
-        pdf.setFont("Helvetica-Bold", 11)
-        pdf.drawString(margin_x, y, branch_name)
-        y -= 14
-        pdf.setFont("Helvetica", 10)
-        for skill in branch_skills:
-            y = _draw_wrapped(
-                pdf,
-                text=f"- {skill.name}: Lv.{skill.level}/{skill.max_level}",
-                x=margin_x + 10,
-                y=y,
-                width_chars=88,
-            )
-            ensure_space()
-        y -= 6
-
-    ensure_space()
-    pdf.setFont("Helvetica-Bold", 13)
-    pdf.drawString(margin_x, y, "Earned Titles")
-    y -= 18
-
-    pdf.setFont("Helvetica", 10)
-    if achievements:
-        for achievement in achievements:
-            y = _draw_wrapped(
-                pdf,
-                text=f"- {achievement.name}: {achievement.description}",
-                x=margin_x,
-                y=y,
-                width_chars=92,
-            )
-            ensure_space()
-    else:
-        y = _draw_wrapped(
-            pdf,
-            text="- No unlocked achievements yet.",
-            x=margin_x,
-            y=y,
-            width_chars=92,
-        )
+def render_rpg_cv(data: CVExportData, fmt: str = "pdf") -> tuple[bytes, str]:
+    """Render export data in `fmt` (see EXPORT_FORMATS); returns (content, filename)."""
+    export_format = EXPORT_FORMATS.get(fmt)
+    if export_format is None:
+        raise CVExportError(f"unsupported_export_format:{fmt}")
+    blocks = build_rpg_cv_document(data)
+    content = export_format.render(blocks, title=f"{data.name} RPG CV")
+    return content, f"{_slugify(data.name)}-rpg-cv.{export_format.extension}"
 
-    y -= 10
-    ensure_space()
-    pdf.setFont("Helvetica-Oblique", 9)
-    pdf.drawString(margin_x, y, "Generated by DevQuest Guild Hall")
 
-    pdf.showPage()
-    pdf.save()
-    buffer.seek(0)
+def generate_rpg_cv(session: Session, player_id: int, fmt: str = "pdf") -> tuple[bytes, str]:
+    """Generate a player's RPG CV in `fmt` and a suggested filename."""
+    return render_rpg_cv(load_rpg_cv_data(session, player_id), fmt)
 
-    filename = f"{_slugify(profile.name)}-rpg-cv.pdf"
-    return buffer.read(), filename
 
+def generate_rpg_cv_pdf(session: Session, player_id: int) -> tuple[bytes, str]:
+    """Generate RPG CV PDF bytes and suggested filename."""
+    return generate_rpg_cv(session, player_id, "pdf")
+
+
+def player_version(session: Session, player_id: int) -> int:
+    return get_version(session, player_scope(player_id))
+
+
+def rpg_cv_etag(player_id: int, version: int, fmt: str = "pdf") -> str:
+    # Weak: equal versions render the same data, but not byte-identical files.
+    return f'W/"rpg-cv-{fmt}-p{player_id}-v{version}"'
+
+
+def _render_cache_key(player_id: int, version: int, fmt: str) -> str:
+    return f"rpg-cv:{player_id}:{version}:{fmt}"
+
+
+def _encode_rendered(rendered: RenderedCV) -> bytes:
+    header = {"filename": rendered.filename, "media_type": rendered.media_type, "etag": rendered.etag}
+    return json.dumps(header).encode("utf-8") + b"\n" + rendered.content
+
+
+def _decode_rendered(raw: bytes) -> RenderedCV:
+    header, _, content = raw.partition(b"\n")
+    return RenderedCV(content=content, **json.loads(header))
+
+
+def _cached_render(key: str) -> RenderedCV | None:
+    raw = get_store().get(key)
+    return _decode_rendered(raw) if raw is not None else None
+
+
+def _store_render(data: CVExportData, *, player_id: int, version: int, fmt: str) -> RenderedCV:
+    content, filename = render_rpg_cv(data, fmt)
+    rendered = RenderedCV(
+        content=content,
+        filename=filename,
+        media_type=EXPORT_FORMATS[fmt].media_type,
+        etag=rpg_cv_etag(player_id, version, fmt),
+    )
+    key = _render_cache_key(player_id, version, fmt)
+    get_store().set(key, _encode_rendered(rendered), ttl=RENDER_CACHE_TTL_SECONDS)
+    return rendered
+
+
+def get_rpg_cv(
+    session: Session, *, player_id: int, fmt: str = "pdf", version: int | None = None
+) -> RenderedCV:
+    """Return a player's RPG CV for their current version, rendering only on a miss.
+
+    Read `version` before the data: if a write lands in between, the newer
+    render is stored under the older stamp and simply replaced on the next miss.
+    """
+    if version is None:
+        version = player_version(session, player_id)
+    cached = _cached_render(_render_cache_key(player_id, version, fmt))
+    if cached is not None:
+        return cached
+    return _store_render(load_rpg_cv_data(session, player_id), player_id=player_id, version=version, fmt=fmt)
+
+
+def _render_concurrency() -> int:
+    try:
+        return max(1, int(os.getenv("CV_EXPORT_MAX_CONCURRENCY", "2")))
+    except ValueError:
+        return 2
+
+
+# Renders run on worker threads; this caps how many run at once so a burst of
+# exports cannot take every thread the event loop also needs for sync endpoints.
+render_limiter = anyio.CapacityLimiter(_render_concurrency())
+# Single-flight is per process: concurrent misses in one worker share a render,
+# while other workers may render the same version once each.
+_inflight: dict[str, asyncio.Task[RenderedCV]] = {}
+
+
+async def run_render(fn: Callable[..., T], *args: object) -> T:
+    """Run a blocking render callable on a worker thread under `render_limiter`."""
+    return await anyio.to_thread.run_sync(fn, *args, limiter=render_limiter)
+
+
+def _render_done(key: str, task: asyncio.Task[RenderedCV]) -> None:
+    _inflight.pop(key, None)
+    if not task.cancelled():
+        task.exception()  # retrieved here in case every waiter has gone
+
+
+async def get_rpg_cv_async(session: Session, *, player_id: int, version: int, fmt: str = "pdf") -> RenderedCV:
+    """`get_rpg_cv` for async handlers: hits are served on the loop, misses
+    render off it, and concurrent misses for one version share a single render.
+
+    The data is read here, on the request's session, so the worker thread only
+    sees immutable `CVExportData`. The render runs as its own task: a waiter
+    that is cancelled (client disconnect, timeout) stops waiting, but the render
+    still finishes for the others and lands in the cache.
+    """
+    key = _render_cache_key(player_id, version, fmt)
+    cached = _cached_render(key)
+    if cached is not None:
+        return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        data = load_rpg_cv_data(session, player_id)
+        task = asyncio.ensure_future(
+            run_render(lambda: _store_render(data, player_id=player_id, version=version, fmt=fmt))
+        )
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _render_done(key, done))
+    return await asyncio.shield(task)
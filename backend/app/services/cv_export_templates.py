@@ -0,0 +1,250 @@
+"""Layout templates and renderers for the RPG CV export.
+
+`build_rpg_cv_document` turns export data into a flat list of blocks (headings,
+lines, bullets, gaps); each renderer walks the same blocks. PDF text is wrapped
+by measured width using ReportLab's font metrics, and every style, page
+geometry and HTML template below is built once at import time. ReportLab
+itself is imported on the first PDF render, so it stays off the startup path.
+"""
+
+from __future__ import annotations
+
+import html
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from io import BytesIO
+from string import Template
+
+# reportlab.lib.pagesizes.A4, in points.
+A4 = (595.2755905511812, 841.8897637795277)
+
+# ---------------------------------------------------------------------------
+# Data and document model
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SkillBranch:
+    name: str
+    skills: list[tuple[str, int, int]]  # (name, level, max_level)
+
+
+@dataclass(frozen=True)
+class CVExportData:
+    name: str
+    title: str
+    dev_class: str
+    level: int
+    xp: int
+    xp_next_level: int
+    stats: list[tuple[str, int, str]]  # (code, value, label)
+    branches: list[SkillBranch]
+    achievements: list[tuple[str, str]]  # (name, description)
+    generated_at: str
+
+
+@dataclass(frozen=True)
+class Block:
+    kind: str  # "title" | "heading" | "subheading" | "line" | "bullet" | "gap" | "footer"
+    text: str = ""
+    indent: int = 0
+    space: float = 0
+
+
+def build_rpg_cv_document(data: CVExportData) -> list[Block]:
+    blocks = [
+        Block("title", "DevQuest RPG CV"),
+        Block("line", f"{data.name} - {data.title} (Level {data.level})"),
+        Block("line", f"XP: {data.xp} / {data.xp_next_level} | Class: {data.dev_class}"),
+        Block("line", f"Generated at: {data.generated_at}"),
+        Block("gap", space=8),
+        Block("heading", "Attributes"),
+    ]
+    blocks += [Block("bullet", f"{code}: {value}/100 ({label})") for code, value, label in data.stats]
+
+    blocks += [Block("gap", space=10), Block("heading", "Equipment Slots (Unlocked Skills)")]
+    for branch in data.branches:
+        blocks.append(Block("subheading", branch.name))
+        blocks += [
+            Block("bullet", f"{name}: Lv.{level}/{max_level}", indent=1) for name, level, max_level in branch.skills
+        ]
+        blocks.append(Block("gap", space=6))
+
+    blocks.append(Block("heading", "Earned Titles"))
+    if data.achievements:
+        blocks += [Block("bullet", f"{name}: {description}") for name, description in data.achievements]
+    else:
+        blocks.append(Block("bullet", "No unlocked achievements yet."))
+
+    blocks += [Block("gap", space=10), Block("footer", "Generated by DevQuest Guild Hall")]
+    return blocks
+
+
+# ---------------------------------------------------------------------------
+# PDF
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class TextStyle:
+    font: str
+    size: float
+    leading: float  # vertical advance after a line
+
+
+@dataclass(frozen=True)
+class PdfTemplate:
+    page_size: tuple[float, float] = A4
+    margin_x: float = 42
+    margin_top: float = 48
+    bottom_limit: float = 90  # start a new page once the cursor drops below this
+    indent_step: float = 10
+    bullet: str = "- "
+    styles: dict[str, TextStyle] = field(default_factory=dict)
+
+    @property
+    def text_width(self) -> float:
+        return self.page_size[0] - 2 * self.margin_x
+
+
+RPG_CV_PDF_TEMPLATE = PdfTemplate(
+    styles={
+        "title": TextStyle("Helvetica-Bold", 20, 28),
+        "heading": TextStyle("Helvetica-Bold", 13, 18),
+        "subheading": TextStyle("Helvetica-Bold", 11, 14),
+        "line": TextStyle("Helvetica", 11, 14),
+        "bullet": TextStyle("Helvetica", 10, 14),
+        "footer": TextStyle("Helvetica-Oblique", 9, 12),
+    }
+)
+
+
+def wrap_to_width(text: str, *, font: str, size: float, max_width: float) -> list[str]:
+    """Greedy word wrap measured with the font's glyph widths (not character counts)."""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    words = text.split()
+    if not words:
+        return [text]
+    space = stringWidth(" ", font, size)
+    lines: list[str] = []
+    current: list[str] = []
+    width = 0.0
+    for word in words:
+        word_width = stringWidth(word, font, size)
+        needed = word_width if not current else width + space + word_width
+        if current and needed > max_width:
+            lines.append(" ".join(current))
+            current, width = [word], word_width
+        else:
+            current.append(word)
+            width = needed
+    lines.append(" ".join(current))
+    return lines
+
+
+def render_pdf(blocks: list[Block], *, title: str, template: PdfTemplate = RPG_CV_PDF_TEMPLATE) -> bytes:
+    from reportlab.pdfgen import canvas
+
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=template.page_size)
+    pdf.setTitle(title)
+    pdf.setAuthor("DevQuest")
+    top = template.page_size[1] - template.margin_top
+    y = top
+    active_font: tuple[str, float] | None = None
+
+    for block in blocks:
+        if block.kind == "gap":
+            y -= block.space
+            continue
+        style = template.styles[block.kind]
+        x = template.margin_x + block.indent * template.indent_step
+        text = f"{template.bullet}{block.text}" if block.kind == "bullet" else block.text
+        max_width = template.text_width - (x - template.margin_x)
+        for line in wrap_to_width(text, font=style.font, size=style.size, max_width=max_width):
+            if y <= template.bottom_limit:
+                pdf.showPage()
+                y = top
+                active_font = None
+            if active_font != (style.font, style.size):
+                pdf.setFont(style.font, style.size)
+                active_font = (style.font, style.size)
+            pdf.drawString(x, y, line)
+            y -= style.leading
+
+    pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# HTML and Markdown
+# ---------------------------------------------------------------------------
+
+_HTML_PAGE = Template(
+    "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n<title>$title</title>\n"
+    "<style>body{font-family:Helvetica,Arial,sans-serif;max-width:46rem;margin:2rem auto;line-height:1.4}"
+    "ul{padding-left:1.2rem}footer{font-style:italic;font-size:.85rem;margin-top:1.5rem}</style>\n"
+    "</head>\n<body>\n$body</body>\n</html>\n"
+)
+_HTML_TAGS = {"title": "h1", "heading": "h2", "subheading": "h3", "line": "p"}
+
+
+def render_html(blocks: list[Block], *, title: str) -> bytes:
+    parts: list[str] = []
+    in_list = False
+    for block in blocks:
+        if block.kind == "bullet":
+            if not in_list:
+                parts.append("<ul>\n")
+                in_list = True
+            parts.append(f"<li>{html.escape(block.text)}</li>\n")
+            continue
+        if in_list:
+            parts.append("</ul>\n")
+            in_list = False
+        if block.kind == "footer":
+            parts.append(f"<footer>{html.escape(block.text)}</footer>\n")
+        elif block.kind in _HTML_TAGS:
+            tag = _HTML_TAGS[block.kind]
+            parts.append(f"<{tag}>{html.escape(block.text)}</{tag}>\n")
+    if in_list:
+        parts.append("</ul>\n")
+    return _HTML_PAGE.substitute(title=html.escape(title), body="".join(parts)).encode("utf-8")
+
+
+_MARKDOWN_PREFIX = {"title": "# ", "heading": "## ", "subheading": "### ", "line": "", "footer": "_"}
+
+
+def render_markdown(blocks: list[Block], *, title: str) -> bytes:
+    lines: list[str] = []
+    previous = ""
+    for block in blocks:
+        if block.kind == "gap":
+            continue
+        if block.kind == "bullet":
+            if previous != "bullet" and lines and lines[-1]:
+                lines.append("")
+            lines.append(f"{'  ' * block.indent}- {block.text}")
+        else:
+            if lines and lines[-1]:
+                lines.append("")
+            suffix = "_" if block.kind == "footer" else ""
+            lines.append(f"{_MARKDOWN_PREFIX[block.kind]}{block.text}{suffix}")
+        previous = block.kind
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    extension: str
+    media_type: str
+    render: Callable[..., bytes]
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    "pdf": ExportFormat("pdf", "application/pdf", render_pdf),
+    "html": ExportFormat("html", "text/html; charset=utf-8", render_html),
+    "markdown": ExportFormat("md", "text/markdown; charset=utf-8", render_markdown),
+}
@@ -7,13 +7,12 @@ import json
 import logging
 import os
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-import openai
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field, ValidationError
 
 from app.services.mock_ai import analyze_cv
@@ -25,6 +24,8 @@ _PROMPTS_DIR = _ROOT_DIR / "prompts"
 
 MAX_LIST_ITEMS = 5
 MAX_CV_TEXT_CHARS = 12000
+# Raw-decode fallbacks (legacy .doc) read at most this much of the upload.
+MAX_RAW_DECODE_BYTES = 1024 * 1024
 SECTION_FALLBACK_NAMES = ["Formatting", "Keywords", "Experience", "Skills", "Education"]
 
 
@@ -241,46 +242,112 @@ def _is_text_usable(text: str) -> bool:
     return len(words) >= 20 and len(text) >= 120
 
 
-def _extract_pdf_text(contents: bytes) -> tuple[str, str]:
+def _as_stream(contents: bytes | BinaryIO) -> BinaryIO:
+    if isinstance(contents, (bytes, bytearray, memoryview)):
+        return io.BytesIO(contents)
+    contents.seek(0)
+    return contents
+
+
+def _read_capped(contents: bytes | BinaryIO, limit: int) -> bytes:
+    if isinstance(contents, (bytes, bytearray, memoryview)):
+        return bytes(contents[:limit])
+    contents.seek(0)
+    return contents.read(limit)
+
+
+@dataclass(frozen=True)
+class CVTextExtraction:
+    text: str
+    source: str
+    units_processed: int = 0  # pages (PDF) or paragraphs (DOCX) actually parsed
+    truncated: bool = False  # stopped early once MAX_CV_TEXT_CHARS was reached
+
+
+def _collect_text(chunks: Iterator[str], *, source: str) -> CVTextExtraction:
+    """Join non-empty chunks until just past MAX_CV_TEXT_CHARS, then stop pulling.
+
+    Collecting one character past the budget keeps `_sanitize_cv_text` output
+    identical to extracting everything (including its truncation marker).
+    """
+    kept: list[str] = []
+    length = 0
+    processed = 0
+    for chunk in chunks:
+        processed += 1
+        text = chunk.strip()
+        if not text:
+            continue
+        kept.append(text)
+        length += len(text) + (1 if len(kept) > 1 else 0)
+        if length > MAX_CV_TEXT_CHARS:
+            return CVTextExtraction("\n".join(kept), source, processed, truncated=True)
+    return CVTextExtraction("\n".join(kept).strip(), source, processed)
+
+
+def _page_may_have_text(page: Any) -> bool:
+    """Cheap resource check: pages without fonts or form XObjects are image-only."""
+    resources = page.get("/Resources")
+    if resources is None:
+        return True  # unusual structure; let the parser decide
+    resources = resources.get_object()
+    if resources.get("/Font"):
+        return True
+    xobjects = resources.get("/XObject")
+    if not xobjects:
+        return False
+    xobjects = xobjects.get_object()
+    return any(xobjects[name].get_object().get("/Subtype") != "/Image" for name in xobjects)
+
+
+def _iter_pdf_pages(reader: Any) -> Iterator[str]:
+    for page in reader.pages:
+        yield (page.extract_text() or "") if _page_may_have_text(page) else ""
+
+
+def _extract_pdf_text(contents: bytes | BinaryIO) -> CVTextExtraction:
     try:
         from pypdf import PdfReader  # lazy import to avoid hard startup failure
     except Exception:
         logger.warning("pdf_parser_unavailable")
-        return "", "pdf_parser_unavailable"
+        return CVTextExtraction("", "pdf_parser_unavailable")
 
     try:
-        reader = PdfReader(io.BytesIO(contents))
-        chunks: list[str] = []
-        for page in reader.pages:
-            text = (page.extract_text() or "").strip()
-            if text:
-                chunks.append(text)
-        return "\n".join(chunks).strip(), "pdf_parser"
+        reader = PdfReader(_as_stream(contents))
+        return _collect_text(_iter_pdf_pages(reader), source="pdf_parser")
     except Exception as exc:  # noqa: BLE001
         logger.warning("pdf_extract_failed error=%s", exc.__class__.__name__)
-        return "", "pdf_extract_failed"
+        return CVTextExtraction("", "pdf_extract_failed")
+
 
+def _iter_docx_paragraphs(doc: Any) -> Iterator[str]:
+    from docx.text.paragraph import Paragraph
 
-def _extract_docx_text(contents: bytes) -> tuple[str, str]:
+    # Same body-level paragraphs as `doc.paragraphs`, without building the full list.
+    for element in doc.element.body.iterchildren("{*}p"):
+        yield Paragraph(element, doc).text
+
+
+def _extract_docx_text(contents: bytes | BinaryIO) -> CVTextExtraction:
     try:
         from docx import Document  # lazy import to avoid hard startup failure
     except Exception:
         logger.warning("docx_parser_unavailable")
-        return "", "docx_parser_unavailable"
+        return CVTextExtraction("", "docx_parser_unavailable")
 
     try:
-        doc = Document(io.BytesIO(contents))
-        chunks = [p.text.strip() for p in doc.paragraphs if p.text and p.text.strip()]
-        return "\n".join(chunks).strip(), "docx_parser"
+        doc = Document(_as_stream(contents))
+        return _collect_text(_iter_docx_paragraphs(doc), source="docx_parser")
     except Exception as exc:  # noqa: BLE001
         logger.warning("docx_extract_failed error=%s", exc.__class__.__name__)
-        return "", "docx_extract_failed"
+        return CVTextExtraction("", "docx_extract_failed")
 
 
-def _extract_legacy_doc_best_effort(contents: bytes) -> tuple[str, str]:
+def _extract_legacy_doc_best_effort(contents: bytes | BinaryIO) -> tuple[str, str]:
+    raw = _read_capped(contents, MAX_RAW_DECODE_BYTES)
     for encoding in ("utf-8", "latin-1", "cp1252"):
         try:
-            decoded = contents.decode(encoding, errors="ignore")
+            decoded = raw.decode(encoding, errors="ignore")
             decoded = " ".join(decoded.split())
             if len(decoded) >= 80:
                 return decoded, f"doc_best_effort:{encoding}"
@@ -289,25 +356,36 @@ def _extract_legacy_doc_best_effort(contents: bytes) -> tuple[str, str]:
     return "", "doc_best_effort_failed"
 
 
-def extract_cv_text(filename: str, contents: bytes) -> tuple[str, str]:
+def extract_cv_text_detailed(filename: str, contents: bytes | BinaryIO) -> CVTextExtraction:
+    """Extract CV text from raw bytes or a seekable binary stream (e.g. a spooled upload).
+
+    PDF pages and DOCX paragraphs are parsed lazily and parsing stops once the
+    text budget is filled, so long documents cost only what the prompt uses.
+    """
     ext = Path(filename).suffix.lower()
     if ext == ".pdf":
         return _extract_pdf_text(contents)
     if ext == ".docx":
         return _extract_docx_text(contents)
     if ext == ".doc":
-        return _extract_legacy_doc_best_effort(contents)
+        return CVTextExtraction(*_extract_legacy_doc_best_effort(contents))
 
     # best effort for unsupported types
+    raw = _read_capped(contents, MAX_RAW_DECODE_BYTES)
     for encoding in ("utf-8", "latin-1"):
         try:
-            decoded = contents.decode(encoding, errors="ignore")
+            decoded = raw.decode(encoding, errors="ignore")
             decoded = " ".join(decoded.split())
             if decoded:
-                return decoded, f"generic_decode:{encoding}"
+                return CVTextExtraction(decoded, f"generic_decode:{encoding}")
         except Exception:
             continue
-    return "", "unsupported_format"
+    return CVTextExtraction("", "unsupported_format")
+
+
+def extract_cv_text(filename: str, contents: bytes | BinaryIO) -> tuple[str, str]:
+    extraction = extract_cv_text_detailed(filename, contents)
+    return extraction.text, extraction.source
 
 
 def _mock_fallback(filename: str, file_size: int, reason: str) -> CVServiceResult:
@@ -382,7 +460,9 @@ async def _analyze_with_llm(
         "</cv_text>"
     )
 
-    client = AsyncOpenAI(
+    import openai  # lazy import keeps the SDK off the startup path
+
+    client = openai.AsyncOpenAI(
         api_key=api_key,
         timeout=timeout_seconds,
         max_retries=max_retries,
@@ -443,10 +523,18 @@ async def _analyze_with_llm(
         raise CVStructuredOutputError("cv_validation_error") from exc
 
 
-async def analyze_uploaded_cv(filename: str, file_size: int, contents: bytes) -> CVServiceResult:
+async def analyze_uploaded_cv(filename: str, file_size: int, contents: bytes | BinaryIO) -> CVServiceResult:
     """Main entrypoint for CV analysis with graceful fallback."""
-    text, extraction_source = extract_cv_text(filename, contents)
-    safe_text = _sanitize_cv_text(text)
+    extraction = extract_cv_text_detailed(filename, contents)
+    extraction_source = extraction.source
+    logger.info(
+        "cv_text_extracted source=%s units_processed=%s truncated=%s chars=%s",
+        extraction_source,
+        extraction.units_processed,
+        extraction.truncated,
+        len(extraction.text),
+    )
+    safe_text = _sanitize_cv_text(extraction.text)
 
     if not _is_text_usable(safe_text):
         return _mock_fallback(filename, file_size, reason=f"text_unusable:{extraction_source}")
@@ -0,0 +1,153 @@
+"""Bounded CV uploads: request-size guard and magic-byte validation.
+
+The multipart parser spools each file part to a `SpooledTemporaryFile` (in
+memory up to 1 MB, then on disk), so the upload handler never needs the whole
+file as `bytes`. `CVUploadLimitMiddleware` enforces the byte cap while the body
+is still streaming in, and `inspect_upload` checks the first bytes against the
+claimed extension before any parsing work is done.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Awaitable, Callable, MutableMapping
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+from fastapi import UploadFile
+
+from app.services.response_envelope import failure_response
+
+# Multipart boundaries and part headers on top of the file itself.
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+MAGIC_PROBE_BYTES = 8
+
+_PDF_MAGIC = b"%PDF-"
+_ZIP_MAGIC = b"PK\x03\x04"
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_RTF_MAGIC = b"{\\rtf"
+
+# Legacy .doc is also accepted as RTF, which Word happily saves under that name.
+_EXPECTED_MAGIC: dict[str, tuple[bytes, ...]] = {
+    ".pdf": (_PDF_MAGIC,),
+    ".docx": (_ZIP_MAGIC,),
+    ".doc": (_OLE_MAGIC, _RTF_MAGIC),
+}
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+class CVUploadRejected(Exception):
+    """Raised when an upload fails validation; `args[0]` is the error message code."""
+
+
+@dataclass(frozen=True)
+class InspectedUpload:
+    stream: BinaryIO
+    size: int
+
+
+def matches_extension(head: bytes, extension: str) -> bool:
+    """True when the file's leading bytes match what `extension` promises."""
+    return any(head.startswith(magic) for magic in _EXPECTED_MAGIC.get(extension, ()))
+
+
+async def inspect_upload(file: UploadFile, *, extension: str, max_bytes: int) -> InspectedUpload:
+    """Validate size and magic bytes, returning the spooled stream rewound to 0."""
+    head = await file.read(MAGIC_PROBE_BYTES)
+    if not head:
+        raise CVUploadRejected("empty_file")
+
+    size = file.size
+    if size is None:
+        file.file.seek(0, 2)
+        size = file.file.tell()
+    if size > max_bytes:
+        raise CVUploadRejected("file_too_large")
+    if not matches_extension(head, extension):
+        raise CVUploadRejected("content_type_mismatch")
+
+    await file.seek(0)
+    return InspectedUpload(stream=file.file, size=size)
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+class CVUploadLimitMiddleware:
+    """Reject CV upload bodies over the cap without reading them to the end.
+
+    A declared `Content-Length` over the limit is refused before the body is read;
+    otherwise bytes are counted as they arrive and the request is cut off as soon
+    as the running total passes the limit.
+    """
+
+    def __init__(self, app: ASGIApp, *, path: str, max_body_bytes: int) -> None:
+        self.app = app
+        self.path = path
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope["headers"]}
+        # request_id_middleware runs outside this one and leaves its id in the scope state.
+        request_id = (
+            str(scope.get("state", {}).get("request_id", "")).strip()
+            or headers.get("x-request-id", "").strip()
+            or str(uuid.uuid4())
+        )
+        declared = headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > self.max_body_bytes:
+            await self._reject(scope, receive, send, request_id)
+            return
+
+        received = 0
+        tripped = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, tripped
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    tripped = True
+                    raise _BodyTooLarge
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            # Once tripped, the app's own error response (e.g. a body parse error) is replaced.
+            if tripped:
+                return
+            response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _BodyTooLarge:
+            pass
+        if tripped and not response_started:
+            await self._reject(scope, receive, send, request_id)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, request_id: str) -> None:
+        # No body is read past this point, so the connection cannot be reused.
+        response = failure_response(
+            flow="cv",
+            request_id=request_id,
+            code="VALIDATION_ERROR",
+            message="file_too_large",
+            retryable=False,
+            status_code=413,
+        )
+        response.headers["Connection"] = "close"
+        await response(scope, receive, send)
@@ -13,14 +13,16 @@ from app.models import (
     PlayerProfile,
     Skill,
 )
+from app.services.achievement_rules import evaluate_event
+from app.services.state_version import bump_version, player_scope
 
 
-def award_xp(session: Session, action: str, description: str, xp_amount: int) -> dict:
-    """Award XP, handle level-ups, log activity, check achievements, recalc stats.
+def award_xp(session: Session, action: str, description: str, xp_amount: int, *, player_id: int) -> dict:
+    """Award XP to one player, handle level-ups, log activity, check achievements, recalc stats.
 
     Returns a gamification event dict for the frontend toast system.
     """
-    profile = session.exec(select(PlayerProfile)).first()
+    profile = session.get(PlayerProfile, player_id)
     if not profile:
         return _empty_event(xp_amount)
 
@@ -39,16 +41,17 @@ def award_xp(session: Session, action: str, description: str, xp_amount: int) ->
     # Log activity
     now = datetime.now(timezone.utc).isoformat()
     session.add(ActivityLog(
-        action=action, xp_gained=xp_amount, description=description, created_at=now,
+        player_id=player_id, action=action, xp_gained=xp_amount, description=description, created_at=now,
     ))
 
-    # Check achievements
-    new_achievements = check_achievements(session)
+    # Unlock achievements whose rules this action can complete
+    new_achievements = evaluate_event(session, player_id, action)
 
     # Recalculate stats
-    recalculate_stats(session)
+    recalculate_stats(session, player_id)
 
     session.add(profile)
+    bump_version(session, player_scope(player_id))
     session.commit()
     session.refresh(profile)
 
@@ -63,56 +66,23 @@ def award_xp(session: Session, action: str, description: str, xp_amount: int) ->
     }
 
 
-def check_achievements(session: Session) -> list[dict]:
-    """Check all lockable achievements and unlock those whose conditions are met."""
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    newly_unlocked: list[dict] = []
-
-    # Define conditions: (achievement_name, check_function)
-    conditions: list[tuple[str, callable]] = [
-        ("Oracle Initiate", lambda s: _count(s, ChatMessage, ChatMessage.role == "user") >= 1),
-        ("Oracle Sage", lambda s: _count(s, ChatMessage, ChatMessage.role == "user") >= 20),
-        ("Scroll Keeper", lambda s: _count(s, BlogPost) >= 3),
-        ("CV Master", lambda s: _count(s, CVAnalysis) >= 1),
-    ]
-
-    for name, check_fn in conditions:
-        ach = session.exec(
-            select(Achievement).where(Achievement.name == name)
-        ).first()
-        if not ach or ach.unlocked:
-            continue
-        if check_fn(session):
-            ach.unlocked = True
-            ach.unlock_date = now
-            session.add(ach)
-            newly_unlocked.append({
-                "name": ach.name,
-                "description": ach.description,
-                "icon": ach.icon,
-                "color": ach.color,
-            })
-
-    return newly_unlocked
-
-
-def recalculate_stats(session: Session) -> None:
-    """Recalculate STR/INT/DEX/WIS from actual data. Stats only go up, never down."""
-    profile = session.exec(select(PlayerProfile)).first()
+def recalculate_stats(session: Session, player_id: int) -> None:
+    """Recalculate a player's STR/INT/DEX/WIS from their data. Stats only go up, never down."""
+    profile = session.get(PlayerProfile, player_id)
     if not profile:
         return
 
     # Gather data
-    blog_count = _count(session, BlogPost)
-    achievement_count = _count(session, Achievement, Achievement.unlocked == True)  # noqa: E712
+    blog_count = _count(session, BlogPost, player_id)
+    achievement_count = _count(session, Achievement, player_id, Achievement.unlocked == True)  # noqa: E712
     total_skill_levels = session.exec(
-        select(func.sum(Skill.level)).where(Skill.unlocked == True)  # noqa: E712
+        select(func.sum(Skill.level)).where(Skill.player_id == player_id, Skill.unlocked == True)  # noqa: E712
     ).one() or 0
     distinct_actions = session.exec(
-        select(func.count(func.distinct(ActivityLog.action)))
+        select(func.count(func.distinct(ActivityLog.action))).where(ActivityLog.player_id == player_id)
     ).one() or 0
-    cv_count = _count(session, CVAnalysis)
-    oracle_msgs = _count(session, ChatMessage, ChatMessage.role == "user")
+    cv_count = _count(session, CVAnalysis, player_id)
+    oracle_msgs = _count(session, ChatMessage, player_id, ChatMessage.role == "user")
     oracle_level = min(1 + oracle_msgs // 5, 20)
 
     # Calculate (only increase, never decrease)
@@ -124,14 +94,38 @@ def recalculate_stats(session: Session) -> None:
     session.add(profile)
 
 
-def _count(session: Session, model, *filters) -> int:
-    """Count rows in a table with optional filters."""
-    stmt = select(func.count(model.id))
+def _count(session: Session, model, player_id: int, *filters) -> int:
+    """Count one player's rows in a table with optional filters."""
+    stmt = select(func.count(model.id)).where(model.player_id == player_id)
     for f in filters:
         stmt = stmt.where(f)
     return session.exec(stmt).one() or 0
 
 
+def record_event(session: Session, action: str, *, player_id: int) -> dict | None:
+    """Evaluate achievement rules for an action that awards no XP.
+
+    Returns a gamification event when something unlocked, otherwise None. The
+    caller commits.
+    """
+    new_achievements = evaluate_event(session, player_id, action)
+    if not new_achievements:
+        return None
+    # STR counts unlocked achievements.
+    recalculate_stats(session, player_id)
+    profile = session.get(PlayerProfile, player_id)
+    bump_version(session, player_scope(player_id))
+    return {
+        "xp_gained": 0,
+        "new_xp": profile.xp,
+        "new_level": profile.level,
+        "xp_next_level": profile.xp_next_level,
+        "leveled_up": False,
+        "old_level": profile.level,
+        "new_achievements": new_achievements,
+    }
+
+
 def _empty_event(xp_amount: int) -> dict:
     """Return a no-op event when profile is missing."""
     return {
@@ -10,10 +10,9 @@ import random
 import time
 from typing import TYPE_CHECKING, Any
 
-import openai
-from openai import AsyncOpenAI
-
 if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
     from app.services.llm_tools_oracle import OracleToolRuntime
 
 logger = logging.getLogger(__name__)
@@ -102,15 +101,19 @@ class LLMClient:
         self.max_total_chars = max(1000, _env_int("LLM_MAX_TOTAL_CHARS", 32000))
         self.oracle_tool_round_limit = max(1, _env_int("OPENAI_ORACLE_TOOL_ROUND_LIMIT", 3))
 
-        self._client = (
-            AsyncOpenAI(
+        self._client: AsyncOpenAI | None = None
+
+    def _provider_client(self) -> AsyncOpenAI | None:
+        # The SDK is imported on first use so it stays off the startup path.
+        if self._client is None and self.api_key:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
                 api_key=self.api_key,
                 timeout=self.timeout_seconds,
                 max_retries=self.max_retries,
             )
-            if self.api_key
-            else None
-        )
+        return self._client
 
     def _validate_request_limits(self, *, instructions: str, input_text: str) -> None:
         instructions_len = len(instructions or "")
@@ -260,13 +263,16 @@ class LLMClient:
         tool_runtime: OracleToolRuntime | None = None,
     ) -> str:
         """Generate Oracle response text from configured model."""
-        if not self._client:
+        client = self._provider_client()
+        if client is None:
             raise LLMConfigurationError("OPENAI_API_KEY is missing")
         self._validate_request_limits(instructions=instructions, input_text=input_text)
 
+        import openai
+
         started = time.perf_counter()
         max_attempts = 1 + self.oracle_app_retries
-        provider_client = self._client.with_options(max_retries=0)
+        provider_client = client.with_options(max_retries=0)
 
         for attempt in range(1, max_attempts + 1):
             try:
@@ -8,6 +8,9 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from app.services.oracle_history import paginate_messages
+from app.services.pagination import InvalidCursorError
+
 _ROOT_DIR = Path(__file__).resolve().parents[3]
 _TOOLS_DIR = _ROOT_DIR / "tools"
 
@@ -163,39 +166,31 @@ class OracleToolRuntime:
         return _tool_success(name, {"skills": values})
 
     def _get_oracle_history(self, *, name: str, args: dict[str, Any]) -> dict[str, Any]:
-        if not self._require_no_extra(args, allowed={"limit", "offset"}):
+        if not self._require_no_extra(args, allowed={"limit", "cursor"}):
             return _tool_error(name, code="VALIDATION_ERROR", message="unexpected_arguments")
-        if "limit" not in args or "offset" not in args:
+        if "limit" not in args or "cursor" not in args:
             return _tool_error(name, code="VALIDATION_ERROR", message="missing_required_arguments")
 
         try:
             limit = int(args.get("limit"))
-            offset = int(args.get("offset"))
         except (TypeError, ValueError):
             return _tool_error(name, code="VALIDATION_ERROR", message="invalid_argument_type")
+        cursor = args.get("cursor")
+        if cursor is not None and not isinstance(cursor, str):
+            return _tool_error(name, code="VALIDATION_ERROR", message="invalid_argument_type:cursor")
 
         if limit < 1 or limit > 200:
             return _tool_error(name, code="VALIDATION_ERROR", message="limit_out_of_range")
-        if offset < 0:
-            return _tool_error(name, code="VALIDATION_ERROR", message="offset_out_of_range")
-
-        total = len(self.history)
-        window = self.history[offset : offset + limit]
-        messages: list[dict[str, Any]] = []
-        for idx, message in enumerate(window, start=offset + 1):
-            messages.append(
-                {
-                    "id": idx,
-                    "role": str(message.get("role", "user")),
-                    "text": str(message.get("text", "")),
-                    "created_at": str(message.get("created_at", "")),
-                }
-            )
+
+        try:
+            page = paginate_messages(self.history, limit=limit, cursor=cursor or None)
+        except InvalidCursorError:
+            return _tool_error(name, code="VALIDATION_ERROR", message="invalid_cursor")
         return _tool_success(
             name,
             {
-                "messages": messages,
-                "total": total,
-                "has_more": offset + limit < total,
+                "messages": page.messages,
+                "next_cursor": page.next_cursor,
+                "has_more": page.has_more,
             },
         )
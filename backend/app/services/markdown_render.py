@@ -0,0 +1,140 @@
+"""Server-side markdown rendering for Tavern Board posts.
+
+Covers the subset the board uses: headings, paragraphs, bold/italic/strike,
+inline and fenced code, lists, blockquotes and links. It is sanitized by
+construction: every character of the source is HTML-escaped before any markup
+is added, and only the tags emitted here can appear in the output. Links keep
+http(s)/mailto/relative targets only; images render as their alt text, so a
+post never makes readers fetch third-party URLs.
+
+Bump `RENDERER_VERSION` whenever the output changes; it is part of
+`content_hash`, so posts rendered by an older version no longer match and are
+re-rendered on the next startup (see `app.services.blog_posts`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import re
+
+RENDERER_VERSION = 2
+
+_FENCE_RE = re.compile(r"^\s{0,3}(```|~~~)")
+_HEADING_RE = re.compile(r"^\s{0,3}(#{1,6})\s+(.+?)\s*#*\s*$")
+_BULLET_RE = re.compile(r"^\s{0,3}[-*+]\s+(.*)$")
+_ORDERED_RE = re.compile(r"^\s{0,3}\d{1,9}[.)]\s+(.*)$")
+_QUOTE_RE = re.compile(r"^\s{0,3}&gt;\s?(.*)$")  # matched after escaping
+_RULE_RE = re.compile(r"^\s{0,3}([-*_])(\s*\1){2,}\s*$")
+
+_CODE_SPAN_RE = re.compile(r"`([^`]+)`")
+_URL = r"((?:[^()\s]|\([^()\s]*\))*)"  # allows one level of balanced parentheses
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(" + _URL + r"\)")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(" + _URL + r"\)")
+_INLINE_RULES = [
+    (re.compile(r"\*\*(.+?)\*\*|__(.+?)__"), "strong"),
+    (re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?!\w)|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)"), "em"),
+    (re.compile(r"~~(.+?)~~"), "del"),
+]
+_SAFE_URL_RE = re.compile(r"^(https?://|mailto:|/(?![/\\])|#)", re.IGNORECASE)
+_PLACEHOLDER = "\x00{}\x00"
+
+
+def content_hash(content: str) -> str:
+    """Key of a stored rendering: the source text and the renderer version that produced it."""
+    return hashlib.sha256(f"{RENDERER_VERSION}\n{content}".encode("utf-8")).hexdigest()[:32]
+
+
+def _inline(text: str) -> str:
+    """Render inline markup in already-escaped `text`."""
+    stash: list[str] = []
+
+    def keep(fragment: str) -> str:
+        stash.append(fragment)
+        return _PLACEHOLDER.format(len(stash) - 1)
+
+    text = _CODE_SPAN_RE.sub(lambda m: keep(f"<code>{m.group(1)}</code>"), text)
+    text = _IMAGE_RE.sub(lambda m: m.group(1), text)
+
+    def link(match: re.Match[str]) -> str:
+        label, url = match.group(1), match.group(2)
+        if not _SAFE_URL_RE.match(html.unescape(url)):
+            return label
+        return keep(f'<a href="{url}" rel="nofollow noopener noreferrer">') + label + keep("</a>")
+
+    text = _LINK_RE.sub(link, text)
+    for pattern, tag in _INLINE_RULES:
+        text = pattern.sub(lambda m, tag=tag: f"<{tag}>{m.group(1) or m.group(2)}</{tag}>", text)
+    return re.sub("\x00(\\d+)\x00", lambda m: stash[int(m.group(1))], text)
+
+
+def render_markdown(content: str) -> str:
+    """Sanitized HTML for markdown `content`."""
+    out: list[str] = []
+    paragraph: list[str] = []
+    list_tag: str | None = None
+    quote: list[str] = []
+
+    def flush() -> None:
+        nonlocal list_tag
+        if paragraph:
+            out.append(f"<p>{_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+        if list_tag:
+            out.append(f"</{list_tag}>")
+            list_tag = None
+        if quote:
+            out.append(f"<blockquote><p>{_inline(' '.join(quote))}</p></blockquote>")
+            quote.clear()
+
+    # NUL is reserved for inline placeholders (and never meaningful in a post).
+    lines = content.replace("\x00", "").replace("\r\n", "\n").split("\n")
+    index = 0
+    while index < len(lines):
+        raw = lines[index]
+        index += 1
+        if opening := _FENCE_RE.match(raw):
+            flush()
+            fence = opening.group(1)
+            code: list[str] = []
+            while index < len(lines) and not lines[index].lstrip().startswith(fence):
+                code.append(lines[index])
+                index += 1
+            index += 1  # closing fence (or end of input)
+            out.append(f"<pre><code>{html.escape(chr(10).join(code))}</code></pre>")
+            continue
+
+        line = html.escape(raw)
+        if not line.strip():
+            flush()
+            continue
+        if heading := _HEADING_RE.match(line):
+            flush()
+            level = min(len(heading.group(1)) + 1, 6)  # the post title is the page's heading
+            out.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+            continue
+        if _RULE_RE.match(line):
+            flush()
+            out.append("<hr>")
+            continue
+        item = _BULLET_RE.match(line)
+        tag = "ul"
+        if item is None:
+            item, tag = _ORDERED_RE.match(line), "ol"
+        if item:
+            if list_tag != tag:
+                flush()
+                out.append(f"<{tag}>")
+                list_tag = tag
+            out.append(f"<li>{_inline(item.group(1))}</li>")
+            continue
+        if quoted := _QUOTE_RE.match(line):
+            if not quote:
+                flush()
+            quote.append(quoted.group(1))
+            continue
+        if list_tag or quote:
+            flush()
+        paragraph.append(line.strip())
+    flush()
+    return "\n".join(out)
@@ -0,0 +1,110 @@
+"""Keyset (cursor) pagination for Oracle chat history.
+
+Pages are ordered by `(created_at, id)` and continue from an opaque cursor, so a
+page costs one index seek regardless of how deep into the session it is. The
+same cursor format is used by the HTTP endpoint and the Oracle tool runtime.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import tuple_
+from sqlmodel import Session, col, func, select
+
+from app.models import ChatMessage
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.shared_state import get_store
+
+TOTAL_CACHE_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class HistoryPage:
+    messages: list[dict[str, Any]]
+    next_cursor: str | None
+    has_more: bool
+
+
+def encode_history_cursor(created_at: str, message_id: int) -> str:
+    return encode_cursor(created_at, message_id)
+
+
+def decode_history_cursor(cursor: str) -> tuple[str, int]:
+    created_at, message_id = decode_cursor(cursor, str, int)
+    return created_at, message_id
+
+
+def _message_dict(message_id: int, role: str, text: str, created_at: str) -> dict[str, Any]:
+    return {"id": message_id, "role": role, "text": text, "created_at": created_at}
+
+
+def fetch_history_page(
+    session: Session, *, player_id: int, session_id: str, limit: int, cursor: str | None = None
+) -> HistoryPage:
+    """Return one chronological page of a player's session messages after `cursor`."""
+    statement = select(ChatMessage).where(ChatMessage.player_id == player_id, ChatMessage.session_id == session_id)
+    if cursor:
+        created_at, message_id = decode_history_cursor(cursor)
+        statement = statement.where(tuple_(ChatMessage.created_at, ChatMessage.id) > tuple_(created_at, message_id))
+    rows = session.exec(
+        statement.order_by(col(ChatMessage.created_at).asc(), col(ChatMessage.id).asc()).limit(limit + 1)
+    ).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    messages = [_message_dict(m.id, m.role, m.text, m.created_at) for m in rows]
+    next_cursor = encode_history_cursor(rows[-1].created_at, rows[-1].id) if has_more and rows else None
+    return HistoryPage(messages=messages, next_cursor=next_cursor, has_more=has_more)
+
+
+def paginate_messages(messages: list[dict[str, Any]], *, limit: int, cursor: str | None = None) -> HistoryPage:
+    """Apply the same keyset pagination to an in-memory, chronological message list."""
+    window = [
+        _message_dict(
+            int(message.get("id") or position),
+            str(message.get("role", "user")),
+            str(message.get("text", "")),
+            str(message.get("created_at", "")),
+        )
+        for position, message in enumerate(messages, start=1)
+    ]
+    if cursor:
+        after = decode_history_cursor(cursor)
+        window = [m for m in window if (m["created_at"], m["id"]) > after]
+
+    has_more = len(window) > limit
+    page = window[:limit]
+    next_cursor = encode_history_cursor(page[-1]["created_at"], page[-1]["id"]) if has_more and page else None
+    return HistoryPage(messages=page, next_cursor=next_cursor, has_more=has_more)
+
+
+def _total_key(player_id: int, session_id: str) -> str:
+    return f"oracle:count:{player_id}:{session_id}"
+
+
+def count_session_messages(session: Session, player_id: int, session_id: str) -> int:
+    """Message count for a player's session, cached briefly in the shared store."""
+    store = get_store()
+    key = _total_key(player_id, session_id)
+    cached = store.get(key)
+    if cached is not None:
+        return int(cached)
+
+    total = session.exec(
+        select(func.count(ChatMessage.id)).where(
+            ChatMessage.player_id == player_id, ChatMessage.session_id == session_id
+        )
+    ).one()
+    store.set(key, str(int(total)).encode(), ttl=TOTAL_CACHE_TTL_SECONDS)
+    return int(total)
+
+
+def note_messages_added(player_id: int, session_id: str) -> None:
+    """Drop the cached total after messages are committed.
+
+    Invalidating (rather than incrementing) stays correct when another worker
+    populated the entry; the next read recounts with one index-only query.
+    """
+    get_store().delete(_total_key(player_id, session_id))
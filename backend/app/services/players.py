@@ -0,0 +1,75 @@
+"""Player resolution for multi-profile deployments.
+
+Every per-player endpoint depends on `get_current_player`, which reads the
+`X-Player-Id` header and falls back to the original (lowest id) profile when
+the header is absent, so single-player clients keep working unchanged. A bad
+or unknown id raises one of the errors below, which `app.main` turns into the
+standard error envelope.
+"""
+
+from __future__ import annotations
+
+from fastapi import Depends, Request
+from sqlmodel import Session, func, select
+
+from app.database import get_session
+from app.models import PlayerProfile
+from app.seed import seed_player_state
+from app.services.state_version import bump_version, player_scope
+
+PLAYER_HEADER = "X-Player-Id"
+
+
+class PlayerNotFoundError(LookupError):
+    """Raised when a requested player does not exist."""
+
+
+class InvalidPlayerIdError(ValueError):
+    """Raised when the player header is not a player id."""
+
+
+def default_player_id(session: Session) -> int | None:
+    value = session.exec(select(func.min(PlayerProfile.id))).one()
+    return int(value) if value is not None else None
+
+
+def resolve_player(session: Session, player_id: int | None = None) -> PlayerProfile:
+    """Load `player_id`, or the default player when it is None."""
+    if player_id is None:
+        player_id = default_player_id(session)
+    profile = session.get(PlayerProfile, player_id) if player_id is not None else None
+    if profile is None:
+        raise PlayerNotFoundError("player_not_found")
+    return profile
+
+
+def get_current_player(request: Request, session: Session = Depends(get_session)) -> PlayerProfile:
+    """FastAPI dependency: the player this request acts for."""
+    raw = request.headers.get(PLAYER_HEADER, "").strip()
+    if raw and not raw.isdigit():
+        raise InvalidPlayerIdError("invalid_player_id")
+    return resolve_player(session, int(raw) if raw else None)
+
+
+def create_player(session: Session, *, name: str, title: str, dev_class: str, avatar_initials: str) -> PlayerProfile:
+    """Create a level-1 player with its own skill tree and achievements."""
+    profile = PlayerProfile(
+        name=name,
+        title=title,
+        dev_class=dev_class,
+        avatar_initials=avatar_initials,
+        level=1,
+        xp=0,
+        xp_next_level=1000,
+        strength=50,
+        intelligence=50,
+        dexterity=50,
+        wisdom=50,
+    )
+    session.add(profile)
+    session.flush()
+    seed_player_state(session, profile.id, fresh=True)
+    bump_version(session, player_scope(profile.id))
+    session.commit()
+    session.refresh(profile)
+    return profile
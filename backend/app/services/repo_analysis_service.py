@@ -15,8 +15,6 @@ from pathlib import Path
 from typing import Any
 
 import httpx
-import openai
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field, ValidationError
 
 from app.services.mock_ai import analyze_github_project
@@ -25,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 _ROOT_DIR = Path(__file__).resolve().parents[3]
 _PROMPTS_DIR = _ROOT_DIR / "prompts"
-_GITHUB_API = "https://api.github.com"
+_GITHUB_API = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
 
 MAX_LIST_ITEMS = 5
 MAX_TAG_ITEMS = 6
@@ -428,7 +426,9 @@ async def _analyze_with_llm(*, repo_full_name: str, context: dict[str, Any]) ->
         "</readme_excerpt>"
     )
 
-    client = AsyncOpenAI(api_key=api_key, timeout=timeout_seconds, max_retries=max_retries)
+    import openai  # lazy import keeps the SDK off the startup path
+
+    client = openai.AsyncOpenAI(api_key=api_key, timeout=timeout_seconds, max_retries=max_retries)
 
     started = time.perf_counter()
     try:
@@ -1,14 +1,27 @@
-"""Standard API response envelope helpers for LLM flows."""
+"""Standard API response envelope helpers for LLM flows.
+
+`success` and `failure_response` return a rendered `FastJSONResponse`, so
+FastAPI passes them straight through instead of walking the payload with
+`jsonable_encoder` first. Payloads must be JSON-native (dicts, lists, str,
+numbers, datetimes); anything else falls back to `jsonable_encoder` per value.
+"""
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
 from fastapi import Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment
+    orjson = None
+
 ERROR_CODES = {
     "VALIDATION_ERROR",
     "NOT_FOUND",
@@ -21,6 +34,22 @@ ERROR_CODES = {
 }
 
 
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=jsonable_encoder, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """App-wide default response class; renders with `dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
 def iso_now() -> str:
     """Return timezone-aware ISO timestamp in UTC."""
     return datetime.now(timezone.utc).isoformat()
@@ -69,9 +98,9 @@ def success(
     source: str | None = None,
     reason: str | None = None,
     meta_extra: dict[str, Any] | None = None,
-) -> dict[str, Any]:
-    """Build a success envelope payload."""
-    return {
+) -> FastJSONResponse:
+    """Build a rendered success envelope response."""
+    payload = {
         "ok": True,
         "data": data,
         "meta": build_meta(
@@ -82,6 +111,7 @@ def success(
             extra=meta_extra,
         ),
     }
+    return FastJSONResponse(content=payload)
 
 
 def failure_payload(
@@ -118,8 +148,8 @@ def failure_response(
     status_code: int,
     details: dict[str, Any] | None = None,
     meta_extra: dict[str, Any] | None = None,
-) -> JSONResponse:
-    """Build JSONResponse with error envelope and status code."""
+) -> FastJSONResponse:
+    """Build a rendered error envelope response with status code."""
     payload = failure_payload(
         flow=flow,
         request_id=request_id,
@@ -129,4 +159,4 @@ def failure_response(
         details=details,
         meta_extra=meta_extra,
     )
-    return JSONResponse(status_code=status_code, content=payload)
+    return FastJSONResponse(status_code=status_code, content=payload)
@@ -0,0 +1,185 @@
+"""Full-text search over Tavern Board posts and Oracle history.
+
+Search reads the SQLite FTS5 indexes created by the `full_text_search`
+migration, in two phases. The first is one ranked query that returns only
+(kind, id, score) for the page. The second fetches titles and snippets for
+those few rows. Snippets are therefore never built for matches that are not
+shown.
+
+Results are ordered by relevance and paged with a keyset cursor over
+(score, kind, id). Chat results are limited to the caller's Oracle session,
+the same rows `/oracle/history` exposes.
+
+Rebuild the indexes from their tables (after a bulk import or restore) with:
+
+    python -m app.services.search --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, bindparam, text
+from sqlmodel import Session
+
+from app.services.pagination import decode_cursor, encode_cursor
+
+SEARCH_KINDS = ("blog", "oracle")
+MAX_QUERY_TERMS = 8
+SNIPPET_TOKENS = 16
+
+# Snippet markers that cannot appear in stored text; swapped for <mark> after escaping.
+_MARK_OPEN, _MARK_CLOSE = "\x02", "\x03"
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class InvalidSearchQueryError(ValueError):
+    """Raised when a search query has no searchable terms."""
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    results: list[dict[str, Any]]
+    next_cursor: str | None
+    has_more: bool
+
+
+def search_terms(query: str) -> list[str]:
+    terms = _TERM_RE.findall(query.lower())[:MAX_QUERY_TERMS]
+    if not terms:
+        raise InvalidSearchQueryError("empty_search_query")
+    return terms
+
+
+def _fts_match(scope: str, columns: tuple[str, ...], terms: list[str]) -> str:
+    # Every term is quoted, so user input can never be read as FTS5 syntax; the
+    # last one is a prefix so results keep up with typing.
+    phrases = [f'"{term}"' for term in terms]
+    phrases[-1] += "*"
+    return f'scope : "{scope}" AND {{{" ".join(columns)}}} : ({" ".join(phrases)})'
+
+
+def _highlight(snippet: str) -> str:
+    return html.escape(snippet).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def _ranked(
+    session: Session, *, kinds: tuple[str, ...], params: dict[str, Any], after: tuple[float, str, int] | None
+) -> list[tuple[str, int, float]]:
+    arms = []
+    if "blog" in kinds:
+        arms.append("SELECT 'blog' AS kind, rowid AS id, rank AS score FROM blogpost_fts WHERE blogpost_fts MATCH :blog_match")
+    if "oracle" in kinds:
+        arms.append(
+            "SELECT 'oracle' AS kind, rowid AS id, rank AS score FROM chatmessage_fts "
+            "WHERE chatmessage_fts MATCH :oracle_match"
+        )
+    where = "WHERE (score, kind, id) > (:after_score, :after_kind, :after_id)" if after else ""
+    statement = text(
+        f"SELECT kind, id, score FROM ({' UNION ALL '.join(arms)}) {where} ORDER BY score, kind, id LIMIT :limit"
+    )
+    if after:
+        params = {**params, "after_score": after[0], "after_kind": after[1], "after_id": after[2]}
+    return [(kind, int(row_id), float(score)) for kind, row_id, score in session.connection().execute(statement, params)]
+
+
+def _details(session: Session, kind: str, ids: list[int], match: str) -> dict[int, dict[str, Any]]:
+    if kind == "blog":
+        statement = text(
+            "SELECT b.id, b.title, b.category, b.created_at, "
+            f"snippet(blogpost_fts, 2, :open, :close, '…', {SNIPPET_TOKENS}) "
+            "FROM blogpost_fts JOIN blogpost b ON b.id = blogpost_fts.rowid "
+            "WHERE blogpost_fts MATCH :match AND blogpost_fts.rowid IN :ids"
+        )
+    else:
+        statement = text(
+            "SELECT m.id, m.role, m.context_topic, m.created_at, "
+            f"snippet(chatmessage_fts, 1, :open, :close, '…', {SNIPPET_TOKENS}) "
+            "FROM chatmessage_fts JOIN chatmessage m ON m.id = chatmessage_fts.rowid "
+            "WHERE chatmessage_fts MATCH :match AND chatmessage_fts.rowid IN :ids"
+        )
+    rows = session.connection().execute(
+        statement.bindparams(bindparam("ids", expanding=True)),
+        {"match": match, "ids": ids, "open": _MARK_OPEN, "close": _MARK_CLOSE},
+    )
+    return {int(row[0]): _detail(kind, *row[1:]) for row in rows}
+
+
+def _detail(kind: str, label: str, group: str, created_at: str, snippet: str) -> dict[str, Any]:
+    if kind == "blog":
+        return {"title": label, "category": group, "created_at": created_at, "snippet": _highlight(snippet)}
+    return {"role": label, "topic": group, "created_at": created_at, "snippet": _highlight(snippet)}
+
+
+def search(
+    session: Session,
+    *,
+    player_id: int,
+    session_id: str,
+    query: str,
+    kinds: tuple[str, ...] = SEARCH_KINDS,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> SearchPage:
+    """One relevance-ordered page of the player's posts and Oracle messages matching `query`."""
+    terms = search_terms(query)
+    after = decode_cursor(cursor, float, str, int) if cursor else None
+    matches = {
+        "blog": _fts_match(f"p{player_id}", ("title", "content", "tags"), terms),
+        "oracle": _fts_match(f"p{player_id}s{session_id}", ("text",), terms),
+    }
+    params: dict[str, Any] = {f"{kind}_match": match for kind, match in matches.items() if kind in kinds}
+    ranked = _ranked(session, kinds=kinds, params={**params, "limit": limit + 1}, after=after)
+
+    has_more = len(ranked) > limit
+    ranked = ranked[:limit]
+    details: dict[tuple[str, int], dict[str, Any]] = {}
+    for kind in kinds:
+        ids = [row_id for row_kind, row_id, _ in ranked if row_kind == kind]
+        if not ids:
+            continue
+        found = _details(session, kind, ids, matches[kind])
+        details.update({(kind, row_id): detail for row_id, detail in found.items()})
+
+    results = [
+        {"kind": kind, "id": row_id, "score": round(-score, 6), **details[(kind, row_id)]}
+        for kind, row_id, score in ranked
+        if (kind, row_id) in details
+    ]
+    next_cursor = None
+    if has_more and ranked:
+        last_kind, last_id, last_score = ranked[-1]
+        next_cursor = encode_cursor(last_score, last_kind, last_id)
+    return SearchPage(results=results, next_cursor=next_cursor, has_more=has_more)
+
+
+def rebuild_search_index(engine: Engine) -> None:
+    """Re-read every indexed row from its table into the FTS5 indexes."""
+    with engine.begin() as connection:
+        for table in ("blogpost_fts", "chatmessage_fts"):
+            connection.execute(text(f"INSERT INTO {table} ({table}) VALUES ('rebuild')"))
+            connection.execute(text(f"INSERT INTO {table} ({table}) VALUES ('optimize')"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="DevQuest full-text search index")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the search indexes from their tables.")
+    args = parser.parse_args(argv)
+    if not args.rebuild:
+        parser.print_help()
+        return 1
+
+    from app.database import engine
+
+    rebuild_search_index(engine)
+    print("search_index=rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
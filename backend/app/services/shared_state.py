@@ -0,0 +1,193 @@
+"""Pluggable key/value store for state that must agree across worker processes.
+
+Caches that are only correct when every worker sees the same entries (Oracle
+message counts, rendered RPG CVs) go through `get_store()` instead of module
+dicts. The backend is chosen with `SHARED_STATE_BACKEND`:
+
+- `memory`: in-process LRU; fine for a single worker and for dev.
+- `sqlite`: a WAL-mode SQLite file shared by every worker on the host
+  (`SHARED_STATE_URL` is the file path; default `<DB_PATH>/shared_state.db`).
+  This is the default when `WEB_CONCURRENCY` asks for more than one worker.
+- `redis`: any Redis-protocol server (`SHARED_STATE_URL=redis://...`); needs
+  the optional `redis` package.
+
+Values are bytes with an optional TTL in seconds.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+MEMORY_STORE_MAX_ENTRIES = 1024
+SQLITE_BUSY_TIMEOUT_SECONDS = 5.0
+SQLITE_PRUNE_EVERY_WRITES = 256
+
+
+class SharedStore(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, *, ttl: float | None = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class MemoryStore:
+    """Process-local LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = MEMORY_STORE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, *, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteStore:
+    """Store backed by one SQLite file, shared by every process that opens it.
+
+    Expiry uses wall-clock time so all processes agree on it; expired rows are
+    ignored on read and pruned every few hundred writes.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        self._local = threading.local()
+        self._writes = 0
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS shared_state ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> bytes | None:
+        row = self._connection().execute(
+            "SELECT value FROM shared_state WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, value: bytes, *, ttl: float | None = None) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO shared_state (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+            self._writes += 1
+            if self._writes % SQLITE_PRUNE_EVERY_WRITES == 0:
+                connection.execute("DELETE FROM shared_state WHERE expires_at <= ?", (time.time(),))
+
+    def delete(self, key: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM shared_state WHERE key = ?", (key,))
+
+
+class RedisStore:
+    """Store on a Redis-protocol server; `client` is a `redis.Redis` or compatible."""
+
+    def __init__(self, client: Any, *, prefix: str = "devquest:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> RedisStore:
+        try:
+            import redis
+        except ImportError as exc:  # pragma: no cover - depends on the deployment
+            raise RuntimeError("SHARED_STATE_BACKEND=redis requires the `redis` package") from exc
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> bytes | None:
+        value = self.client.get(self.prefix + key)
+        return bytes(value) if value is not None else None
+
+    def set(self, key: str, value: bytes, *, ttl: float | None = None) -> None:
+        px = max(1, int(ttl * 1000)) if ttl is not None else None
+        self.client.set(self.prefix + key, value, px=px)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+
+def _default_sqlite_path() -> Path:
+    from app.database import DB_DIR
+
+    return DB_DIR / "shared_state.db"
+
+
+def _default_backend() -> str:
+    workers = os.getenv("WEB_CONCURRENCY", "1").strip()
+    return "sqlite" if workers.isdigit() and int(workers) > 1 else "memory"
+
+
+def create_store_from_env() -> SharedStore:
+    backend = os.getenv("SHARED_STATE_BACKEND", "").strip().lower() or _default_backend()
+    url = os.getenv("SHARED_STATE_URL", "").strip()
+    if backend == "memory":
+        return MemoryStore()
+    if backend == "sqlite":
+        return SQLiteStore(url or _default_sqlite_path())
+    if backend == "redis":
+        return RedisStore.from_url(url or "redis://localhost:6379/0")
+    raise RuntimeError(f"unknown SHARED_STATE_BACKEND: {backend}")
+
+
+_store: SharedStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> SharedStore:
+    """The process-wide store, created from the environment on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_store_from_env()
+    return _store
+
+
+def use_store(store: SharedStore | None) -> None:
+    """Replace the process-wide store (None re-reads the environment on next use)."""
+    global _store
+    with _store_lock:
+        _store = store
@@ -0,0 +1,72 @@
+"""Monotonic version stamps for derived data (exports, cached responses).
+
+Writers call `bump_version` inside the same transaction as the change, so the
+stamp is committed (or rolled back) together with the data it describes. Any
+process can then compare stamps to decide whether something cached is stale.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import bindparam, text
+from sqlmodel import Session
+
+# Profile, skills and achievements: everything the RPG CV export renders.
+PLAYER_SCOPE = "player"
+
+
+def player_scope(player_id: int) -> str:
+    """Per-player version scope, so one player's writes never invalidate another's caches."""
+    return f"{PLAYER_SCOPE}:{player_id}"
+
+
+def blog_scope(player_id: int) -> str:
+    """A player's Tavern Board posts."""
+    return f"blog:{player_id}"
+
+
+def cv_scope(player_id: int) -> str:
+    """A player's CV analyses."""
+    return f"cv:{player_id}"
+
+
+def oracle_scope(player_id: int) -> str:
+    """A player's Oracle chat messages (every session)."""
+    return f"oracle:{player_id}"
+
+
+def get_version(session: Session, scope: str) -> int:
+    value = session.connection().execute(
+        text("SELECT version FROM stateversion WHERE scope = :scope"), {"scope": scope}
+    ).scalar()
+    return int(value or 0)
+
+
+def get_versions(session: Session, scopes: list[str]) -> list[int]:
+    """Versions for several scopes in one query, in the order given."""
+    statement = text("SELECT scope, version FROM stateversion WHERE scope IN :scopes").bindparams(
+        bindparam("scopes", expanding=True)
+    )
+    found = dict(session.connection().execute(statement, {"scopes": scopes}).all())
+    return [int(found.get(scope, 0)) for scope in scopes]
+
+
+def bump_version(session: Session, scope: str) -> None:
+    """Increment `scope` as part of the session's current transaction."""
+    session.connection().execute(
+        text(
+            "INSERT INTO stateversion (scope, version) VALUES (:scope, 1) "
+            "ON CONFLICT(scope) DO UPDATE SET version = version + 1"
+        ),
+        {"scope": scope},
+    )
+
+
+def set_version(session: Session, scope: str, version: int) -> None:
+    """Record `version` for `scope` as part of the session's current transaction."""
+    session.connection().execute(
+        text(
+            "INSERT INTO stateversion (scope, version) VALUES (:scope, :version) "
+            "ON CONFLICT(scope) DO UPDATE SET version = excluded.version"
+        ),
+        {"scope": scope, "version": version},
+    )
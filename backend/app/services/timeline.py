@@ -0,0 +1,105 @@
+"""Career timeline served from `app/data/timeline.json`.
+
+The file is parsed once and kept as ready-to-send bytes (plain, gzip and,
+when available, brotli) with a strong ETag per encoding derived from those
+bytes, so a request costs a `stat` and a header compare.
+Every worker notices an edited file by its mtime on the next request; the
+admin reload endpoint forces an immediate re-read and reports the result.
+A file that fails to parse is logged and the previous document keeps serving.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.services.compression import brotli, precompress
+from app.services.response_envelope import dumps
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_PATH = Path(
+    os.getenv("TIMELINE_PATH", "").strip() or Path(__file__).resolve().parents[1] / "data" / "timeline.json"
+)
+# Short browser/edge freshness; after that, revalidation is a cheap 304.
+TIMELINE_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=86400"
+
+
+class TimelineError(ValueError):
+    """Raised when the timeline file is missing or malformed."""
+
+
+@dataclass(frozen=True)
+class TimelineDocument:
+    body: bytes
+    etag: str
+    entries: int
+    mtime_ns: int
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    def variant(self, encoding: str | None) -> tuple[bytes, str]:
+        """Body and ETag for `encoding` (None, or one that was not precompressed, is identity)."""
+        if encoding in self.encoded:
+            return self.encoded[encoding], f'{self.etag[:-1]}-{encoding}"'
+        return self.body, self.etag
+
+
+def load_timeline(path: Path = TIMELINE_PATH) -> TimelineDocument:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+        document = json.loads(path.read_bytes())
+    except (OSError, ValueError) as exc:
+        raise TimelineError(f"timeline_unreadable: {exc.__class__.__name__}") from exc
+    entries = document.get("entries") if isinstance(document, dict) else None
+    if not isinstance(entries, list):
+        raise TimelineError("timeline_missing_entries")
+    body = dumps({"entries": entries})
+    etag = f'"timeline-{hashlib.sha256(body).hexdigest()[:20]}"'
+    encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+    return TimelineDocument(
+        body=body,
+        etag=etag,
+        entries=len(entries),
+        mtime_ns=mtime_ns,
+        encoded={encoding: precompress(body, encoding) for encoding in encodings},
+    )
+
+
+_current: TimelineDocument | None = None
+_failed_mtime_ns: int | None = None  # a broken edit is reported once, not on every request
+_lock = threading.Lock()
+
+
+def reload_timeline(path: Path = TIMELINE_PATH) -> TimelineDocument:
+    """Re-read the file now; raises TimelineError and keeps the old document on failure."""
+    global _current
+    document = load_timeline(path)
+    with _lock:
+        _current = document
+    logger.info("timeline_loaded entries=%s etag=%s", document.entries, document.etag)
+    return document
+
+
+def current_timeline(path: Path = TIMELINE_PATH) -> TimelineDocument:
+    """The loaded document, re-read when the file's mtime has changed."""
+    global _failed_mtime_ns
+    current = _current
+    if current is None:
+        return reload_timeline(path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return current
+    if mtime_ns in (current.mtime_ns, _failed_mtime_ns):
+        return current
+    try:
+        return reload_timeline(path)
+    except TimelineError as exc:
+        _failed_mtime_ns = mtime_ns
+        logger.warning("timeline_reload_failed error=%s", exc)
+    return current
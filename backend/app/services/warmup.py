@@ -0,0 +1,42 @@
+"""Background preload of the heavy SDKs that are kept off the import path.
+
+`openai`, ReportLab, `pypdf` and `python-docx` are imported on first use so a
+cold `import app.main` only pays for the web framework and the ORM. Once the
+server is up, the lifespan imports them on a worker thread so the first Oracle
+call, CV upload or PDF export does not pay that cost on the request path.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+WARMUP_MODULES = (
+    "openai",
+    "reportlab.pdfgen.canvas",
+    "reportlab.pdfbase.pdfmetrics",
+    "pypdf",
+    "docx",
+)
+
+
+def preload_heavy_modules(modules: tuple[str, ...] = WARMUP_MODULES) -> dict[str, int]:
+    """Import `modules` and return each one's import time in ms (missing ones are skipped)."""
+    timings: dict[str, int] = {}
+    for name in modules:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            logger.info("warmup_module_unavailable module=%s", name)
+            continue
+        timings[name] = int((time.perf_counter() - started) * 1000)
+    logger.info(
+        "warmup_done modules=%s total_ms=%s",
+        ",".join(timings),
+        sum(timings.values()),
+    )
+    return timings
@@ -0,0 +1 @@
+"""Performance tooling for the DevQuest backend (benchmarks and stub upstreams)."""
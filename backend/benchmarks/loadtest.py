@@ -0,0 +1,314 @@
+"""Load-test driver: replays chat/upload/analyze mixes against the FastAPI app.
+
+Run from `backend/`:
+
+    python -m benchmarks.loadtest --requests 400 --concurrency 20
+    python -m benchmarks.loadtest --duration 30 --mix chat=6,upload=1,analyze=3 \\
+        --openai-latency-ms 400 --openai-jitter-ms 200 --openai-rate-limit-rate 0.1
+    python -m benchmarks.loadtest --target http://127.0.0.1:8000 --stub-port 8787
+
+Without `--target` the app is served in-process by uvicorn on a free port, backed by
+a throwaway SQLite database and wired to the stub upstreams. With `--target`, start
+the backend yourself with `OPENAI_BASE_URL`/`GITHUB_API_URL` pointing at the stub
+(the URLs are printed on startup). The report lists throughput, p50/p95/p99 per
+scenario, the `meta.source` mix (llm vs fallback) and the faults the stub injected.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.fixtures import SAMPLE_USER_MESSAGES, sample_pdf_bytes
+from benchmarks.stub_upstreams import StubUpstreamServer, add_behavior_arguments, behavior_from_args
+
+DEFAULT_MIX = "chat=6,upload=1,analyze=3"
+_CHAT_MESSAGES = [message for message in SAMPLE_USER_MESSAGES if "ignore" not in message.lower()] + [
+    "Which skill should I unlock next?",
+    "Give me a weekly plan to improve my portfolio.",
+]
+
+
+@dataclass
+class ScenarioStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    status_codes: Counter = field(default_factory=Counter)
+    sources: Counter = field(default_factory=Counter)
+    exceptions: Counter = field(default_factory=Counter)
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def parse_mix(raw: str) -> dict[str, int]:
+    mix: dict[str, int] = {}
+    for part in raw.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"unknown scenario: {name}")
+        mix[name] = int(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("mix must contain at least one positive weight")
+    return mix
+
+
+async def _chat(client: httpx.AsyncClient, rng: random.Random, _ctx: dict[str, Any]) -> httpx.Response:
+    return await client.post("/api/oracle/chat", json={"message": rng.choice(_CHAT_MESSAGES)})
+
+
+async def _upload(client: httpx.AsyncClient, _rng: random.Random, ctx: dict[str, Any]) -> httpx.Response:
+    files = {"file": ("resume.pdf", ctx["pdf"], "application/pdf")}
+    return await client.post("/api/cv/upload", files=files)
+
+
+async def _analyze(client: httpx.AsyncClient, rng: random.Random, _ctx: dict[str, Any]) -> httpx.Response:
+    return await client.post(f"/api/github/repos/stub-owner/stub-repo-{rng.randint(0, 9)}/analyze")
+
+
+async def _history(client: httpx.AsyncClient, _rng: random.Random, _ctx: dict[str, Any]) -> httpx.Response:
+    return await client.get("/api/oracle/history?limit=50")
+
+
+async def _repos(client: httpx.AsyncClient, _rng: random.Random, _ctx: dict[str, Any]) -> httpx.Response:
+    return await client.get("/api/github/repos")
+
+
+SCENARIOS: dict[str, Callable[[httpx.AsyncClient, random.Random, dict[str, Any]], Awaitable[httpx.Response]]] = {
+    "chat": _chat,
+    "upload": _upload,
+    "analyze": _analyze,
+    "history": _history,
+    "repos": _repos,
+}
+
+
+def _response_source(response: httpx.Response) -> str | None:
+    try:
+        payload = response.json()
+    except ValueError:
+        return None
+    if isinstance(payload, dict):
+        meta = payload.get("meta")
+        if isinstance(meta, dict) and meta.get("source"):
+            return str(meta["source"])
+    return None
+
+
+async def drive(
+    base_url: str,
+    *,
+    mix: dict[str, int],
+    concurrency: int,
+    total_requests: int | None,
+    duration_seconds: float | None,
+    timeout_seconds: float,
+    seed: int | None,
+) -> tuple[dict[str, ScenarioStats], float]:
+    """Run virtual users until the request budget or duration is spent."""
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    stats = {name: ScenarioStats() for name in names}
+    ctx = {"pdf": sample_pdf_bytes(pages=2)}
+    issued = 0
+    started = time.perf_counter()
+    deadline = started + duration_seconds if duration_seconds else None
+
+    def next_scenario() -> str | None:
+        nonlocal issued
+        if total_requests is not None and issued >= total_requests:
+            return None
+        if deadline is not None and time.perf_counter() >= deadline:
+            return None
+        issued += 1
+        return rng.choices(names, weights=weights, k=1)[0]
+
+    async def virtual_user(user_index: int) -> None:
+        user_rng = random.Random(None if seed is None else seed + user_index)
+        # One client per virtual user, so each gets its own Oracle session cookie.
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout_seconds) as client:
+            while (name := next_scenario()) is not None:
+                entry = stats[name]
+                request_started = time.perf_counter()
+                try:
+                    response = await SCENARIOS[name](client, user_rng, ctx)
+                except httpx.HTTPError as exc:
+                    entry.exceptions[exc.__class__.__name__] += 1
+                    continue
+                entry.latencies_ms.append((time.perf_counter() - request_started) * 1000)
+                entry.status_codes[response.status_code] += 1
+                source = _response_source(response)
+                if source:
+                    entry.sources[source] += 1
+
+    await asyncio.gather(*(virtual_user(i) for i in range(concurrency)))
+    return stats, time.perf_counter() - started
+
+
+def build_report(
+    stats: dict[str, ScenarioStats], elapsed_seconds: float, stub_counts: dict[str, int]
+) -> dict[str, Any]:
+    scenarios: dict[str, Any] = {}
+    total = 0
+    for name, entry in stats.items():
+        latencies = sorted(entry.latencies_ms)
+        count = len(latencies) + sum(entry.exceptions.values())
+        total += count
+        scenarios[name] = {
+            "requests": count,
+            "throughput_rps": round(count / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+            "status_codes": {str(code): n for code, n in sorted(entry.status_codes.items())},
+            "sources": dict(entry.sources),
+            "exceptions": dict(entry.exceptions),
+        }
+    return {
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "total_requests": total,
+        "throughput_rps": round(total / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+        "scenarios": scenarios,
+        "stub_requests": dict(sorted(stub_counts.items())),
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(
+        f"total_requests={report['total_requests']} elapsed_s={report['elapsed_seconds']} "
+        f"throughput_rps={report['throughput_rps']}"
+    )
+    print(f"{'scenario':<10} {'reqs':>6} {'rps':>8} {'p50_ms':>9} {'p95_ms':>9} {'p99_ms':>9}  status / sources")
+    for name, row in report["scenarios"].items():
+        detail = f"{row['status_codes']} {row['sources']}"
+        if row["exceptions"]:
+            detail += f" exceptions={row['exceptions']}"
+        print(
+            f"{name:<10} {row['requests']:>6} {row['throughput_rps']:>8.2f} {row['p50_ms']:>9.1f} "
+            f"{row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f}  {detail}"
+        )
+    print("stub:", report["stub_requests"])
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class _InProcessServer:
+    """Serve `app.main:app` with uvicorn on a background thread."""
+
+    def __init__(self) -> None:
+        import uvicorn
+
+        from app.main import app
+
+        self.port = _free_port()
+        config = uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning", lifespan="on")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="loadtest-uvicorn", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "_InProcessServer":
+        self._thread.start()
+        deadline = time.monotonic() + 15
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("uvicorn did not start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="DevQuest load-test driver")
+    parser.add_argument("--target", help="Base URL of an already running backend.")
+    parser.add_argument("--stub-port", type=int, default=0)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario weights, e.g. {DEFAULT_MIX}")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, help="Total request budget (default 200 when no --duration).")
+    parser.add_argument("--duration", type=float, help="Run for N seconds instead of a fixed budget.")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    add_behavior_arguments(parser)
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    total_requests = args.requests if args.requests is not None else (None if args.duration else 200)
+
+    stub = StubUpstreamServer(
+        port=args.stub_port,
+        repo_count=30,
+        openai=behavior_from_args(args, "openai"),
+        github=behavior_from_args(args, "github"),
+        seed=args.seed,
+    )
+    with stub, tempfile.TemporaryDirectory(prefix="devquest_load_") as tmp:
+        print(f"OPENAI_BASE_URL={stub.openai_base_url}")
+        print(f"GITHUB_API_URL={stub.github_base_url}")
+
+        async def run(base_url: str) -> tuple[dict[str, ScenarioStats], float]:
+            return await drive(
+                base_url,
+                mix=mix,
+                concurrency=max(1, args.concurrency),
+                total_requests=total_requests,
+                duration_seconds=args.duration,
+                timeout_seconds=args.timeout,
+                seed=args.seed,
+            )
+
+        if args.target:
+            stats, elapsed = asyncio.run(run(args.target.rstrip("/")))
+        else:
+            os.environ["DB_PATH"] = tmp
+            os.environ["OPENAI_API_KEY"] = "sk-loadtest-stub-key-000000"
+            os.environ["OPENAI_BASE_URL"] = stub.openai_base_url
+            os.environ["GITHUB_API_URL"] = stub.github_base_url
+            os.environ.setdefault("LOG_LEVEL", "ERROR")
+            with _InProcessServer() as server:
+                stats, elapsed = asyncio.run(run(server.base_url))
+
+        report = build_report(stats, elapsed, stub.request_counts)
+
+    _print_report(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
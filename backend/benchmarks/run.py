@@ -0,0 +1,395 @@
+"""Standalone benchmark runner for the backend hot paths.
+
+Run from `backend/`:
+
+    python -m benchmarks.run                                   # everything, default scales
+    python -m benchmarks.run --quick                           # small scales, few iterations
+    python -m benchmarks.run --only award_xp --scales 10000,100000
+    python -m benchmarks.run --save benchmarks/baselines/local.json
+    python -m benchmarks.run --compare benchmarks/baselines/local.json --threshold 0.2
+
+Every run uses a throwaway SQLite database and the local stub upstream server, so
+no tokens or GitHub quota are spent. `--compare` exits with status 1 when any
+benchmark's median regresses by more than `--threshold`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SCALES = (10_000, 100_000, 1_000_000)
+QUICK_SCALES = (1_000,)
+DEFAULT_THRESHOLD = 0.2
+BENCH_SESSION_ID = "benchmark-session"
+
+
+@dataclass
+class BenchConfig:
+    scales: tuple[int, ...]
+    iterations: int
+    warmup: int
+    only: tuple[str, ...]
+
+
+def measure(fn: Callable[[], Any], *, iterations: int, warmup: int = 1) -> dict[str, float]:
+    """Time `fn` and return summary statistics in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    samples: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        fn()
+        samples.append((time.perf_counter_ns() - started) / 1_000_000)
+    samples.sort()
+    p95_index = min(len(samples) - 1, max(0, int(round(0.95 * len(samples))) - 1))
+    return {
+        "iterations": len(samples),
+        "min_ms": round(samples[0], 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p95_ms": round(samples[p95_index], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def _scaled_iterations(base: int, rows: int) -> int:
+    """Keep wall time reasonable for the 1M-row runs."""
+    if rows >= 1_000_000:
+        return max(3, base // 10)
+    if rows >= 100_000:
+        return max(5, base // 4)
+    return base
+
+
+def _selected(config: BenchConfig, name: str) -> bool:
+    return not config.only or any(token in name for token in config.only)
+
+
+def _prepare_environment(db_dir: Path, stub: Any) -> None:
+    """Point the app at a throwaway DB and the stub upstreams before it is imported."""
+    os.environ["DB_PATH"] = str(db_dir)
+    os.environ["OPENAI_API_KEY"] = "sk-benchmark-stub-key-000000"
+    os.environ["OPENAI_BASE_URL"] = stub.openai_base_url
+    os.environ["GITHUB_API_URL"] = stub.github_base_url
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    os.environ["OPENAI_ORACLE_BACKOFF_JITTER_MS"] = "0"
+
+
+def _oracle_session_id(client: Any) -> str:
+    """Decode the signed session cookie to learn the Oracle session id."""
+    from itsdangerous import TimestampSigner
+
+    from app.main import session_cookie_name, session_secret_key
+
+    client.get("/api/oracle/stats")
+    cookie = client.cookies.get(session_cookie_name)
+    payload = TimestampSigner(str(session_secret_key)).unsign(cookie)
+    return str(json.loads(base64.b64decode(payload))["oracle_session_id"])
+
+
+def _reset_event_tables() -> None:
+    from sqlalchemy import text
+
+    from app.database import engine
+
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM chatmessage"))
+        connection.execute(text("DELETE FROM activitylog"))
+
+
+def bench_pure_functions(config: BenchConfig, results: dict[str, dict]) -> None:
+    from app.services.log_safety import redact_text
+    from app.services.oracle_service import _detect_malicious_input, _normalize_oracle_output
+    from app.services.response_envelope import failure_response, success
+    from benchmarks.fixtures import SAMPLE_LOG_LINE, SAMPLE_ORACLE_OUTPUT, SAMPLE_USER_MESSAGES
+
+    iterations = config.iterations * 20
+    if _selected(config, "normalize_oracle_output"):
+        results["normalize_oracle_output"] = measure(
+            lambda: _normalize_oracle_output(SAMPLE_ORACLE_OUTPUT), iterations=iterations, warmup=config.warmup
+        )
+    if _selected(config, "detect_malicious_input"):
+        results["detect_malicious_input"] = measure(
+            lambda: [_detect_malicious_input(message) for message in SAMPLE_USER_MESSAGES],
+            iterations=iterations,
+            warmup=config.warmup,
+        )
+    if _selected(config, "redact_text"):
+        results["redact_text"] = measure(
+            lambda: redact_text(SAMPLE_LOG_LINE), iterations=iterations, warmup=config.warmup
+        )
+
+    history_data = {
+        "messages": [
+            {"id": i, "role": "user" if i % 2 else "oracle", "text": f"message {i} " * 8, "created_at": "2026-01-01T00:00:00+00:00"}
+            for i in range(200)
+        ],
+        "total": 200,
+        "has_more": False,
+    }
+    if _selected(config, "envelope_success_200_messages"):
+        results["envelope_success_200_messages"] = measure(
+            lambda: success(flow="oracle", request_id="bench", source="db", data=history_data).body,
+            iterations=iterations,
+            warmup=config.warmup,
+        )
+    if _selected(config, "envelope_failure"):
+        results["envelope_failure"] = measure(
+            lambda: failure_response(
+                flow="cv",
+                request_id="bench",
+                code="VALIDATION_ERROR",
+                message="file_too_large",
+                retryable=False,
+                status_code=413,
+            ).body,
+            iterations=iterations,
+            warmup=config.warmup,
+        )
+
+
+def bench_cv_documents(config: BenchConfig, results: dict[str, dict]) -> None:
+    from sqlmodel import Session
+
+    from app.database import engine
+    from app.services.cv_export_service import generate_rpg_cv_pdf
+    from app.services.cv_service import extract_cv_text
+    from app.services.players import default_player_id
+    from benchmarks.fixtures import sample_docx_bytes, sample_pdf_bytes
+
+    if _selected(config, "extract_cv_text_pdf"):
+        pdf = sample_pdf_bytes(pages=20)
+        results["extract_cv_text_pdf_20_pages"] = measure(
+            lambda: extract_cv_text("resume.pdf", pdf), iterations=config.iterations, warmup=config.warmup
+        )
+    if _selected(config, "extract_cv_text_docx"):
+        docx = sample_docx_bytes(paragraphs=400)
+        results["extract_cv_text_docx_400_paragraphs"] = measure(
+            lambda: extract_cv_text("resume.docx", docx), iterations=config.iterations, warmup=config.warmup
+        )
+    if _selected(config, "generate_rpg_cv_pdf"):
+        with Session(engine) as session:
+            player_id = default_player_id(session)
+            results["generate_rpg_cv_pdf"] = measure(
+                lambda: generate_rpg_cv_pdf(session, player_id), iterations=config.iterations, warmup=config.warmup
+            )
+
+
+def bench_scaled_tables(config: BenchConfig, client: Any, results: dict[str, dict]) -> None:
+    from sqlmodel import Session
+
+    from app.database import engine
+    from app.services.gamification_engine import award_xp
+    from app.services.players import default_player_id
+    from benchmarks.fixtures import bulk_insert_activity_logs, bulk_insert_chat_messages
+
+    wants_award = _selected(config, "award_xp")
+    wants_history = _selected(config, "oracle_history")
+    if not (wants_award or wants_history):
+        return
+
+    session_id = _oracle_session_id(client)
+    with Session(engine) as session:
+        player_id = default_player_id(session)
+    for rows in sorted(config.scales):
+        _reset_event_tables()
+        with Session(engine) as session:
+            bulk_insert_chat_messages(session, count=rows, player_id=player_id, session_id=session_id)
+            bulk_insert_activity_logs(session, count=rows, player_id=player_id)
+
+        iterations = _scaled_iterations(config.iterations, rows)
+        if wants_award:
+            with Session(engine) as session:
+                results[f"award_xp[{rows}]"] = measure(
+                    lambda: award_xp(session, "oracle_chat", "benchmark", 1, player_id=player_id),
+                    iterations=iterations,
+                    warmup=config.warmup,
+                )
+        if wants_history:
+            results[f"oracle_history_first_page[{rows}]"] = measure(
+                lambda: client.get("/api/oracle/history?limit=50"),
+                iterations=iterations,
+                warmup=config.warmup,
+            )
+            deep_cursor = _history_cursor_before_tail(player_id, session_id, tail=50)
+            results[f"oracle_history_deep_page[{rows}]"] = measure(
+                lambda: client.get("/api/oracle/history", params={"limit": 50, "cursor": deep_cursor}),
+                iterations=iterations,
+                warmup=config.warmup,
+            )
+
+
+def _history_cursor_before_tail(player_id: int, session_id: str, *, tail: int) -> str | None:
+    """Cursor that makes the next history page the last `tail` messages of a session."""
+    from sqlmodel import Session, col, select
+
+    from app.database import engine
+    from app.models import ChatMessage
+    from app.services.oracle_history import encode_history_cursor
+
+    with Session(engine) as session:
+        row = session.exec(
+            select(ChatMessage.created_at, ChatMessage.id)
+            .where(ChatMessage.player_id == player_id, ChatMessage.session_id == session_id)
+            .order_by(col(ChatMessage.created_at).desc(), col(ChatMessage.id).desc())
+            .offset(tail)
+            .limit(1)
+        ).first()
+    return encode_history_cursor(row[0], row[1]) if row else None
+
+
+def bench_stubbed_upstreams(config: BenchConfig, client: Any, results: dict[str, dict]) -> None:
+    from benchmarks.fixtures import sample_pdf_bytes
+
+    if _selected(config, "oracle_chat_stub_llm"):
+        results["oracle_chat_stub_llm"] = measure(
+            lambda: client.post("/api/oracle/chat", json={"message": "How do I level up my backend skills?"}),
+            iterations=config.iterations,
+            warmup=config.warmup,
+        )
+    if _selected(config, "repo_analyze_stub"):
+        results["repo_analyze_stub"] = measure(
+            lambda: client.post("/api/github/repos/stub-owner/stub-repo/analyze"),
+            iterations=config.iterations,
+            warmup=config.warmup,
+        )
+    if _selected(config, "github_repos_stub"):
+        results["github_repos_stub"] = measure(
+            lambda: client.get("/api/github/repos"), iterations=config.iterations, warmup=config.warmup
+        )
+    if _selected(config, "cv_upload_stub_llm"):
+        pdf = sample_pdf_bytes(pages=3)
+        results["cv_upload_stub_llm"] = measure(
+            lambda: client.post("/api/cv/upload", files={"file": ("resume.pdf", pdf, "application/pdf")}),
+            iterations=config.iterations,
+            warmup=config.warmup,
+        )
+
+
+def run_benchmarks(config: BenchConfig) -> dict[str, Any]:
+    """Run all selected benchmarks and return a baseline-shaped document."""
+    from benchmarks.stub_upstreams import StubUpstreamServer
+
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="devquest_bench_") as tmp, StubUpstreamServer() as stub:
+        _prepare_environment(Path(tmp), stub)
+
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+
+        with TestClient(app) as client:
+            bench_pure_functions(config, results)
+            bench_cv_documents(config, results)
+            bench_stubbed_upstreams(config, client, results)
+            bench_scaled_tables(config, client, results)
+
+        from app.database import engine
+
+        engine.dispose()
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scales": list(config.scales),
+            "iterations": config.iterations,
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], *, threshold: float = DEFAULT_THRESHOLD
+) -> list[dict[str, Any]]:
+    """Compare median timings; status is `regression`, `improvement`, `ok` or `new`."""
+    base_results = baseline.get("results", {})
+    rows: list[dict[str, Any]] = []
+    for name, stats in current.get("results", {}).items():
+        current_ms = float(stats["median_ms"])
+        base_stats = base_results.get(name)
+        if not base_stats:
+            rows.append({"name": name, "baseline_ms": None, "current_ms": current_ms, "delta": None, "status": "new"})
+            continue
+        baseline_ms = float(base_stats["median_ms"])
+        delta = (current_ms - baseline_ms) / baseline_ms if baseline_ms > 0 else 0.0
+        if delta > threshold:
+            status = "regression"
+        elif delta < -threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            {"name": name, "baseline_ms": baseline_ms, "current_ms": current_ms, "delta": round(delta, 4), "status": status}
+        )
+    return rows
+
+
+def _print_results(document: dict[str, Any]) -> None:
+    print(f"{'benchmark':<48} {'median_ms':>12} {'p95_ms':>12} {'iters':>6}")
+    for name, stats in document["results"].items():
+        print(f"{name:<48} {stats['median_ms']:>12.3f} {stats['p95_ms']:>12.3f} {stats['iterations']:>6}")
+
+
+def _print_comparison(rows: list[dict[str, Any]]) -> None:
+    print(f"{'benchmark':<48} {'baseline_ms':>12} {'current_ms':>12} {'delta':>9}  status")
+    for row in rows:
+        baseline = "-" if row["baseline_ms"] is None else f"{row['baseline_ms']:.3f}"
+        delta = "-" if row["delta"] is None else f"{row['delta'] * 100:+.1f}%"
+        print(f"{row['name']:<48} {baseline:>12} {row['current_ms']:>12.3f} {delta:>9}  {row['status']}")
+
+
+def _parse_scales(raw: str) -> tuple[int, ...]:
+    return tuple(int(part.replace("_", "")) for part in raw.split(",") if part.strip())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="DevQuest backend benchmarks")
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES))
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--only", action="append", default=[], help="Substring filter; repeatable.")
+    parser.add_argument("--quick", action="store_true", help="Small scales and few iterations (smoke run).")
+    parser.add_argument("--save", type=Path, help="Write results as a JSON baseline.")
+    parser.add_argument("--compare", type=Path, help="Compare against a JSON baseline.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    scales = QUICK_SCALES if args.quick else _parse_scales(args.scales)
+    iterations = 3 if args.quick else max(1, args.iterations)
+    config = BenchConfig(scales=scales, iterations=iterations, warmup=max(0, args.warmup), only=tuple(args.only))
+
+    document = run_benchmarks(config)
+    _print_results(document)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nbaseline_saved path={args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        rows = compare_results(baseline, document, threshold=args.threshold)
+        print()
+        _print_comparison(rows)
+        if any(row["status"] == "regression" for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
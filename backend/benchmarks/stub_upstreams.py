@@ -0,0 +1,415 @@
+"""Local stand-ins for the OpenAI Responses API and the GitHub REST endpoints we call.
+
+The server speaks just enough of both protocols for `AsyncOpenAI.responses.create`
+and the httpx calls in `routers/github.py` / `repo_analysis_service.py` to succeed,
+so benchmarks never spend tokens or GitHub quota.
+
+Each upstream has its own `StubBehavior` (latency, jitter, error rate, 429 rate) so
+load tests can exercise `LLMClient` retry/backoff and the mock fallbacks. Run it
+standalone for an externally started backend:
+
+    python -m benchmarks.stub_upstreams --port 8787 --openai-latency-ms 400 --openai-rate-limit-rate 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from uuid import uuid4
+
+STUB_ORACLE_TEXT = (
+    "Your backend branch is ready for the next quest.\n"
+    "- Ship one endpoint with a contract test this week\n"
+    "- Profile the slowest query and add the missing index\n"
+    "- Write a short post about what you learned\n"
+    "Want a 7-day plan for it?"
+)
+
+STUB_CV_ANALYSIS: dict[str, Any] = {
+    "score": 78,
+    "sections": [
+        {"name": "Formatting", "score": 80, "feedback": "Clear structure and ATS-friendly layout."},
+        {"name": "Experience", "score": 74, "feedback": "Add measurable outcomes to recent roles."},
+        {"name": "Skills", "score": 82, "feedback": "Strong backend and data stack."},
+    ],
+    "strengths": ["Consistent backend focus", "Relevant AI residency"],
+    "weaknesses": ["Few quantified results"],
+    "tips": ["Lead bullets with impact metrics", "Tailor keywords to the target role"],
+}
+
+STUB_REPO_ANALYSIS: dict[str, Any] = {
+    "repo": "stub/repo",
+    "score": 84,
+    "strengths": ["Readable module boundaries", "Typed service layer"],
+    "improvements": ["Increase automated test coverage"],
+    "summary": "Well-structured repository with a clear service layer and room for more tests.",
+    "metrics": {
+        "code_quality": 86,
+        "documentation": 80,
+        "testing": 62,
+        "architecture": 85,
+        "security": 78,
+    },
+    "category_tags": ["fastapi", "well-structured"],
+}
+
+
+@dataclass
+class StubBehavior:
+    """Fault and latency profile applied to every request of one upstream."""
+
+    latency_ms: int = 0
+    jitter_ms: int = 0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: int = 1
+
+
+_README_TEXT = "# Stub Repository\n\nGenerated by the DevQuest benchmark stub server.\n" * 20
+
+
+def _repo_payload(owner: str, name: str, index: int = 0) -> dict[str, Any]:
+    return {
+        "name": name,
+        "full_name": f"{owner}/{name}",
+        "description": f"Stub repository #{index}",
+        "language": ("Python", "TypeScript", "Go")[index % 3],
+        "stargazers_count": (index * 7) % 60,
+        "forks_count": index % 9,
+        "has_wiki": bool(index % 2),
+        "fork": False,
+        "archived": False,
+        "html_url": f"https://github.com/{owner}/{name}",
+        "homepage": "",
+        "topics": ["stub", "benchmark"],
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "pushed_at": "2026-01-01T00:00:00Z",
+        "size": 1000 + index,
+        "open_issues_count": index % 4,
+        "has_pages": False,
+        "default_branch": "main",
+        "license": {"spdx_id": "MIT"},
+        "owner": {"login": owner},
+    }
+
+
+def _responses_payload(model: str, text: str) -> dict[str, Any]:
+    return {
+        "id": f"resp_{uuid4().hex}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": model,
+        "output": [
+            {
+                "type": "message",
+                "id": f"msg_{uuid4().hex}",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": 0,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": 0,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": 0,
+        },
+    }
+
+
+def _responses_text_for(body: dict[str, Any]) -> str:
+    format_name = ((body.get("text") or {}).get("format") or {}).get("name")
+    if format_name == "cv_analysis":
+        return json.dumps(STUB_CV_ANALYSIS)
+    if format_name == "repo_analysis":
+        return json.dumps(STUB_REPO_ANALYSIS)
+    return STUB_ORACLE_TEXT
+
+
+def _github_route(parts: list[str]) -> str:
+    """Collapse owner/repo path segments so request counts group by endpoint."""
+    if len(parts) >= 2 and parts[0] == "users":
+        return "/users/{user}" + "".join(f"/{p}" for p in parts[2:])
+    if len(parts) >= 3 and parts[0] == "repos":
+        return "/repos/{owner}/{repo}" + "".join(f"/{p}" for p in parts[3:])
+    return "/" + "/".join(parts)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        return
+
+    def _send_json(self, status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        # The app creates a fresh SDK/httpx client per call and never closes it; one
+        # request per connection keeps stale keep-alive sockets out of the picture.
+        self.send_header("Connection", "close")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = True
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b"{}"
+        try:
+            parsed = json.loads(raw or b"{}")
+        except json.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    def _inject_faults(self, upstream: str) -> bool:
+        """Apply latency and maybe answer with an injected 429/500; True when answered."""
+        behavior = self.server.behaviors[upstream]
+        delay_ms = behavior.latency_ms + (self.server.draw_int(behavior.jitter_ms) if behavior.jitter_ms else 0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        roll = self.server.draw()
+        if roll < behavior.rate_limit_rate:
+            self.server.record(f"{upstream}:injected_429")
+            headers = {"Retry-After": str(behavior.retry_after_seconds)}
+            if upstream == "openai":
+                payload = {"error": {"message": "Rate limit reached (stub)", "type": "requests", "code": "rate_limit_exceeded"}}
+            else:
+                headers["X-RateLimit-Remaining"] = "0"
+                payload = {"message": "API rate limit exceeded (stub)"}
+            self._send_json(429, payload, headers)
+            return True
+        if roll < behavior.rate_limit_rate + behavior.error_rate:
+            self.server.record(f"{upstream}:injected_500")
+            if upstream == "openai":
+                payload = {"error": {"message": "Internal server error (stub)", "type": "server_error", "code": None}}
+            else:
+                payload = {"message": "Server Error (stub)"}
+            self._send_json(500, payload)
+            return True
+        return False
+
+    def do_POST(self) -> None:  # noqa: N802
+        path = self.path.split("?", 1)[0].rstrip("/")
+        body = self._read_json()
+        self.server.record(f"POST {path}")
+        if self._inject_faults("openai"):
+            return
+        if path in {"/v1/responses", "/responses"}:
+            model = str(body.get("model") or "stub-model")
+            self._send_json(200, _responses_payload(model, _responses_text_for(body)))
+            return
+        self._send_json(404, {"message": "Not Found"})
+
+    def do_GET(self) -> None:  # noqa: N802
+        path = self.path.split("?", 1)[0].rstrip("/")
+        parts = [part for part in path.split("/") if part]
+        self.server.record(f"GET {_github_route(parts)}")
+        if self._inject_faults("github"):
+            return
+
+        if len(parts) == 3 and parts[0] == "users" and parts[2] == "repos":
+            owner = parts[1]
+            repos = [_repo_payload(owner, f"stub-repo-{i}", i) for i in range(self.server.repo_count)]
+            self._send_json(200, repos)
+            return
+        if len(parts) == 2 and parts[0] == "users":
+            self._send_json(
+                200,
+                {
+                    "login": parts[1],
+                    "name": "Stub Player",
+                    "avatar_url": "",
+                    "bio": "Benchmark profile",
+                    "public_repos": self.server.repo_count,
+                    "followers": 10,
+                    "following": 5,
+                    "html_url": f"https://github.com/{parts[1]}",
+                },
+            )
+            return
+        if len(parts) >= 3 and parts[0] == "repos":
+            owner, name = parts[1], parts[2]
+            tail = parts[3] if len(parts) > 3 else ""
+            if tail == "languages":
+                self._send_json(200, {"Python": 52000, "TypeScript": 31000, "CSS": 4000})
+                return
+            if tail == "readme":
+                encoded = base64.b64encode(_README_TEXT.encode("utf-8")).decode("ascii")
+                self._send_json(200, {"content": encoded, "encoding": "base64"})
+                return
+            if not tail:
+                self._send_json(200, _repo_payload(owner, name))
+                return
+        self._send_json(404, {"message": "Not Found"})
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        *,
+        repo_count: int,
+        behaviors: dict[str, StubBehavior],
+        seed: int | None,
+    ) -> None:
+        super().__init__(address, _StubHandler)
+        self.repo_count = repo_count
+        self.behaviors = behaviors
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self.request_counts: dict[str, int] = {}
+
+    def record(self, key: str) -> None:
+        with self._lock:
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def draw(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def draw_int(self, upper: int) -> int:
+        with self._lock:
+            return self._random.randint(0, upper)
+
+
+class StubUpstreamServer:
+    """Threaded HTTP server that answers OpenAI Responses and GitHub REST calls.
+
+    Usage::
+
+        with StubUpstreamServer() as stub:
+            os.environ["OPENAI_BASE_URL"] = stub.openai_base_url
+            os.environ["GITHUB_API_URL"] = stub.github_base_url
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        repo_count: int = 30,
+        openai: StubBehavior | None = None,
+        github: StubBehavior | None = None,
+        seed: int | None = None,
+    ) -> None:
+        behaviors = {"openai": openai or StubBehavior(), "github": github or StubBehavior()}
+        self._httpd = _StubHTTPServer((host, port), repo_count=repo_count, behaviors=behaviors, seed=seed)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.base_url}/v1"
+
+    @property
+    def github_base_url(self) -> str:
+        return self.base_url
+
+    @property
+    def request_counts(self) -> dict[str, int]:
+        with self._httpd._lock:
+            return dict(self._httpd.request_counts)
+
+    @property
+    def behaviors(self) -> dict[str, StubBehavior]:
+        """Live behaviors; mutate fields to change latency/faults mid-run."""
+        return self._httpd.behaviors
+
+    def start(self) -> "StubUpstreamServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-upstreams", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubUpstreamServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def _behavior_args(parser: argparse.ArgumentParser, upstream: str) -> None:
+    parser.add_argument(f"--{upstream}-latency-ms", type=int, default=0)
+    parser.add_argument(f"--{upstream}-jitter-ms", type=int, default=0)
+    parser.add_argument(f"--{upstream}-error-rate", type=float, default=0.0)
+    parser.add_argument(f"--{upstream}-rate-limit-rate", type=float, default=0.0)
+    parser.add_argument(f"--{upstream}-retry-after", type=int, default=1)
+
+
+def behavior_from_args(args: argparse.Namespace, upstream: str) -> StubBehavior:
+    return StubBehavior(
+        latency_ms=getattr(args, f"{upstream}_latency_ms"),
+        jitter_ms=getattr(args, f"{upstream}_jitter_ms"),
+        error_rate=getattr(args, f"{upstream}_error_rate"),
+        rate_limit_rate=getattr(args, f"{upstream}_rate_limit_rate"),
+        retry_after_seconds=getattr(args, f"{upstream}_retry_after"),
+    )
+
+
+def add_behavior_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register `--openai-*` and `--github-*` behavior flags on a parser."""
+    _behavior_args(parser, "openai")
+    _behavior_args(parser, "github")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Stub OpenAI/GitHub upstreams for local load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--repo-count", type=int, default=30)
+    parser.add_argument("--seed", type=int)
+    add_behavior_arguments(parser)
+    args = parser.parse_args(argv)
+
+    stub = StubUpstreamServer(
+        host=args.host,
+        port=args.port,
+        repo_count=args.repo_count,
+        openai=behavior_from_args(args, "openai"),
+        github=behavior_from_args(args, "github"),
+        seed=args.seed,
+    )
+    print(f"OPENAI_BASE_URL={stub.openai_base_url}")
+    print(f"GITHUB_API_URL={stub.github_base_url}")
+    with stub:
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import base64
+import json
 import os
 import shutil
 import sys
@@ -20,7 +22,7 @@ os.environ["DB_PATH"] = str(_TEST_DB_DIR)
 os.environ.setdefault("OPENAI_API_KEY", "")
 os.environ.setdefault("LOG_LEVEL", "WARNING")
 
-from app.main import app  # noqa: E402
+from app.main import app, session_cookie_name, session_secret_key  # noqa: E402
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -33,3 +35,13 @@ def cleanup_test_db() -> Generator[None, None, None]:
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as test_client:
         yield test_client
+
+
+@pytest.fixture()
+def oracle_session_id(client: TestClient) -> str:
+    """The Oracle session id stored in the client's signed session cookie."""
+    from itsdangerous import TimestampSigner
+
+    client.get("/api/oracle/stats")
+    payload = TimestampSigner(str(session_secret_key)).unsign(client.cookies.get(session_cookie_name))
+    return str(json.loads(base64.b64decode(payload))["oracle_session_id"])
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, select
+
+import app.services.achievement_rules as rules
+from app.migrations import migrate
+from app.models import Achievement, BlogPost, PlayerProfile
+from app.services.oracle_service import OracleServiceResult
+
+
+def _player_with(engine, achievements: list[str]) -> int:
+    with Session(engine) as session:
+        player = PlayerProfile(name="Rules", title="", dev_class="", avatar_initials="R")
+        session.add(player)
+        session.flush()
+        session.add_all(Achievement(player_id=player.id, name=name) for name in achievements)
+        session.add_all(
+            BlogPost(player_id=player.id, title=f"p{i}", content="", created_at="x", updated_at="x") for i in range(3)
+        )
+        session.commit()
+        return player.id
+
+
+def _statements(engine, player_id: int, action: str) -> tuple[list[dict], int]:
+    statements: list[str] = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        with Session(engine) as session:
+            unlocked = rules.evaluate_event(session, player_id, action)
+            session.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return unlocked, len(statements)
+
+
+def test_only_rules_subscribed_to_the_event_run(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rules.db'}")
+    migrate(engine)
+    player_id = _player_with(engine, ["Scroll Keeper", "Oracle Initiate"])
+
+    assert _statements(engine, player_id, "profile_view") == ([], 0)
+    unlocked, cost = _statements(engine, player_id, "blog_create")
+    assert [a["name"] for a in unlocked] == ["Scroll Keeper"]
+    assert cost == 3  # locked lookup, one count, one update
+    # Already unlocked: a single lookup.
+    assert _statements(engine, player_id, "blog_create") == ([], 1)
+
+    with Session(engine) as session:
+        states = dict(session.exec(select(Achievement.name, Achievement.unlocked)).all())
+    assert states == {"Scroll Keeper": True, "Oracle Initiate": False}
+
+
+def test_unlock_updates_achievements_loaded_in_the_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rules.db'}")
+    migrate(engine)
+    player_id = _player_with(engine, ["Scroll Keeper"])
+
+    with Session(engine) as session:
+        loaded = session.exec(select(Achievement).where(Achievement.player_id == player_id)).one()
+        assert loaded.unlocked is False
+        rules.evaluate_event(session, player_id, "blog_create")
+        assert loaded.unlocked is True and loaded.unlock_date
+
+
+def test_cost_stays_flat_as_rules_grow(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rules.db'}")
+    migrate(engine)
+    names = [f"Scribe {n}" for n in range(1, 51)]
+    player_id = _player_with(engine, names)
+    many = tuple(rules.AchievementRule(name, "blog_posts", n) for n, name in enumerate(names, start=1))
+    monkeypatch.setattr(rules, "_RULES_BY_EVENT", rules.index_rules(many, rules.COUNTERS))
+
+    unlocked, cost = _statements(engine, player_id, "blog_create")
+    assert [a["name"] for a in unlocked] == names[:3]
+    assert cost == 3
+
+
+def test_oracle_chat_unlocks_oracle_achievements(client, monkeypatch):
+    from app.routers import oracle
+
+    async def fake_reply(**_kwargs):
+        return OracleServiceResult(text="Seek and you shall find.", topic="career", source="fallback_mock")
+
+    monkeypatch.setattr(oracle, "generate_oracle_reply", fake_reply)
+    player_id = client.post("/api/gamification/players", json={"name": "Seeker"}).json()["id"]
+    headers = {"X-Player-Id": str(player_id)}
+    strength = client.get("/api/gamification/profile", headers=headers).json()["stats"]["STR"]["value"]
+
+    first = client.post("/api/oracle/chat", headers=headers, json={"message": "hello"}).json()["data"]
+    assert [a["name"] for a in first["gamification"]["new_achievements"]] == ["Oracle Initiate"]
+    assert first["gamification"]["xp_gained"] == 0
+    second = client.post("/api/oracle/chat", headers=headers, json={"message": "again"}).json()["data"]
+    assert second["gamification"] is None
+
+    achievements = client.get("/api/gamification/achievements", headers=headers).json()["achievements"]
+    assert [a["name"] for a in achievements if a["unlocked"]] == ["Oracle Initiate"]
+    # STR counts unlocked achievements, so the unlock raised it.
+    profile = client.get("/api/gamification/profile", headers=headers).json()
+    assert profile["stats"]["STR"]["value"] == strength + 2
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from benchmarks.loadtest import parse_mix, percentile
+from benchmarks.run import compare_results, measure
+from benchmarks.stub_upstreams import STUB_ORACLE_TEXT, StubBehavior, StubUpstreamServer
+
+
+def test_compare_results_flags_regressions_and_new_entries():
+    baseline = {"results": {"fast": {"median_ms": 10.0}, "slow": {"median_ms": 10.0}}}
+    current = {
+        "results": {
+            "fast": {"median_ms": 7.0},
+            "slow": {"median_ms": 13.0},
+            "added": {"median_ms": 1.0},
+        }
+    }
+    rows = {row["name"]: row for row in compare_results(baseline, current, threshold=0.2)}
+    assert rows["fast"]["status"] == "improvement"
+    assert rows["slow"]["status"] == "regression"
+    assert rows["added"]["status"] == "new"
+
+
+def test_measure_reports_summary_stats():
+    stats = measure(lambda: sum(range(100)), iterations=5, warmup=0)
+    assert stats["iterations"] == 5
+    assert stats["min_ms"] <= stats["median_ms"] <= stats["max_ms"]
+
+
+def test_stub_server_answers_openai_responses(monkeypatch):
+    from app.services.llm_client import LLMClient
+
+    with StubUpstreamServer() as stub:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test-stub-key-000000")
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.openai_base_url)
+        client = LLMClient()
+        text = asyncio.run(client.generate_oracle_text(instructions="Be brief.", input_text="hello"))
+        assert text == STUB_ORACLE_TEXT.strip()
+        assert stub.request_counts.get("POST /v1/responses") == 1
+
+
+def test_stub_rate_limits_exhaust_llm_client_retries(monkeypatch):
+    from app.services.llm_client import LLMClient, LLMRetryExhaustedError
+
+    with StubUpstreamServer(openai=StubBehavior(rate_limit_rate=1.0)) as stub:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test-stub-key-000000")
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.openai_base_url)
+        monkeypatch.setenv("OPENAI_ORACLE_APP_RETRIES", "1")
+        monkeypatch.setenv("OPENAI_ORACLE_BACKOFF_BASE_MS", "50")
+        monkeypatch.setenv("OPENAI_ORACLE_BACKOFF_JITTER_MS", "0")
+        client = LLMClient()
+        with pytest.raises(LLMRetryExhaustedError):
+            asyncio.run(client.generate_oracle_text(instructions="Be brief.", input_text="hello"))
+        assert stub.request_counts.get("openai:injected_429") == 2
+
+
+def test_loadtest_helpers():
+    assert parse_mix("chat=3,upload=1") == {"chat": 3, "upload": 1}
+    with pytest.raises(ValueError):
+        parse_mix("unknown=1")
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 99) == 4.0
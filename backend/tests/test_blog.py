@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import app.services.blog_posts as blog_posts
+from app.services.blog_posts import make_excerpt
+
+
+def _player(client):
+    player_id = client.post("/api/gamification/players", json={"name": "Board Keeper"}).json()["id"]
+    return {"X-Player-Id": str(player_id)}
+
+
+def test_posts_page_with_stable_order_and_excerpts(client):
+    headers = _player(client)
+    created = []
+    for index in range(5):
+        body = {
+            "title": f"Post {index}",
+            "content": f"# Post {index}\n\n" + "word " * 100,
+            "category": "project" if index % 2 else "update",
+            "tags": "Python, fastapi" if index % 2 else "python",
+            "pinned": index == 1,
+        }
+        created.append(client.post("/api/blog/posts", headers=headers, json=body).json()["id"])
+
+    first = client.get("/api/blog/posts", params={"limit": 2}, headers=headers).json()
+    assert first["total"] == 5 and first["has_more"] is True
+    assert first["posts"][0]["id"] == created[1]  # pinned first
+    assert "content" not in first["posts"][0] and "content_html" not in first["posts"][0]
+    assert first["posts"][0]["excerpt"].startswith("Post 1 word") and first["posts"][0]["excerpt"].endswith("…")
+
+    seen = [post["id"] for post in first["posts"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get("/api/blog/posts", params={"limit": 2, "cursor": cursor}, headers=headers).json()
+        assert page["total"] is None
+        seen += [post["id"] for post in page["posts"]]
+        cursor = page["next_cursor"]
+    assert seen == [created[1], created[4], created[3], created[2], created[0]]
+
+    full = client.get("/api/blog/posts", params={"view": "full", "limit": 1}, headers=headers).json()
+    assert full["posts"][0]["content"].startswith("# Post 1")
+
+
+def test_tag_and_category_filters(client):
+    headers = _player(client)
+    client.post("/api/blog/posts", headers=headers, json={"title": "A", "content": "a", "tags": "Rust, WASM"})
+    post = client.post("/api/blog/posts", headers=headers, json={"title": "B", "content": "b", "tags": "rust"}).json()
+    client.post("/api/blog/posts", headers=headers, json={"title": "C", "content": "c", "category": "thought"})
+
+    assert [p["title"] for p in client.get("/api/blog/posts?tag=Rust", headers=headers).json()["posts"]] == ["B", "A"]
+    assert client.get("/api/blog/posts?tag=wasm", headers=headers).json()["total"] == 1
+    assert [p["title"] for p in client.get("/api/blog/posts?category=thought", headers=headers).json()["posts"]] == ["C"]
+    assert client.get("/api/blog/tags", headers=headers).json()["tags"] == [
+        {"tag": "rust", "count": 2},
+        {"tag": "wasm", "count": 1},
+    ]
+
+    client.put(f"/api/blog/posts/{post['id']}", headers=headers, json={"title": "B", "content": "b", "tags": "go"})
+    assert client.get("/api/blog/posts?tag=rust", headers=headers).json()["total"] == 1
+    client.delete(f"/api/blog/posts/{post['id']}", headers=headers)
+    assert client.get("/api/blog/posts?tag=go", headers=headers).json()["posts"] == []
+
+
+def test_bad_listing_parameters_are_rejected(client):
+    assert client.get("/api/blog/posts?limit=0").status_code == 400
+    assert client.get("/api/blog/posts?view=everything").status_code == 400
+    assert client.get("/api/blog/posts?cursor=nope").status_code == 400
+
+
+def test_excerpt_strips_markdown():
+    assert make_excerpt("## Title\n\n- **one** and `two`\n\n```py\ncode\n```\n[link](http://x) ![img](y.png)") == (
+        "Title one and two link img"
+    )
+    assert make_excerpt("word " * 10, limit=12) == "word word…"
+
+
+def test_rendering_is_stored_and_only_redone_when_content_changes(client, monkeypatch):
+    headers = _player(client)
+    calls = []
+    render = blog_posts.render_markdown
+    monkeypatch.setattr(blog_posts, "render_markdown", lambda content: calls.append(content) or render(content))
+
+    body = {"title": "Rendered", "content": "## Hi\n\n**there** <script>"}
+    post = client.post("/api/blog/posts", headers=headers, json=body).json()
+    assert post["content_html"] == "<h3>Hi</h3>\n<p><strong>there</strong> &lt;script&gt;</p>"
+    assert client.get(f"/api/blog/posts/{post['id']}", headers=headers).json()["content_html"] == post["content_html"]
+
+    client.put(f"/api/blog/posts/{post['id']}", headers=headers, json={**body, "title": "Renamed"})
+    assert len(calls) == 1
+    updated = client.put(f"/api/blog/posts/{post['id']}", headers=headers, json={**body, "content": "_new_"}).json()
+    assert len(calls) == 2
+    assert updated["content_html"] == "<p><em>new</em></p>" and updated["excerpt"] == "new"
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.services.compression import CompressionMiddleware, negotiate_encoding
+
+
+def test_negotiation_honours_quality_values():
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("*") in {"br", "gzip"}
+
+
+def test_large_json_is_compressed_and_small_is_not(client):
+    posts = client.get("/api/blog/posts", headers={"Accept-Encoding": "gzip"})
+    assert posts.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in posts.headers["vary"]
+    assert posts.json()["total"] >= 1
+
+    health = client.get("/api/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in health.headers
+
+
+def test_timeline_serves_precompressed_variant(client):
+    response = client.get("/api/gamification/timeline", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    etag = response.headers["etag"]
+    assert etag.endswith('-gzip"')
+    assert len(response.json()["entries"]) == 15
+
+    revalidated = client.get(
+        "/api/gamification/timeline", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert revalidated.status_code == 304
+
+    identity = client.get("/api/gamification/timeline", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] != etag
+
+
+def _streaming_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=16)
+
+    async def chunks():
+        for index in range(3):
+            yield f"data: {'x' * 64} {index}\n\n"
+
+    @app.get("/events")
+    async def events():
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def test_streams_are_compressed_per_chunk_and_event_streams_pass_through():
+    client = TestClient(_streaming_app())
+
+    with client.stream("GET", "/events", headers={"Accept-Encoding": "gzip"}) as events:
+        assert "content-encoding" not in events.headers
+        assert events.read().count(b"data:") == 3
+
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as stream:
+        assert stream.headers["content-encoding"] == "gzip"
+        raw = b"".join(stream.iter_raw())
+    assert gzip.decompress(raw).count(b"data:") == 3
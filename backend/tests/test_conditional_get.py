@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/gamification/profile",
+        "/api/gamification/achievements",
+        "/api/gamification/skills",
+        "/api/blog/posts",
+        "/api/cv/analysis",
+        "/api/oracle/stats",
+    ],
+)
+def test_unchanged_resource_revalidates_with_304(client, path):
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert "no-cache" in first.headers["cache-control"]
+    assert "X-Player-Id" in first.headers["vary"]
+
+    again = client.get(path, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+
+def test_writes_change_the_tag(client):
+    posts_tag = client.get("/api/blog/posts").headers["etag"]
+    profile_tag = client.get("/api/gamification/profile").headers["etag"]
+
+    created = client.post("/api/blog/posts", json={"title": "Fresh scroll", "content": "New"}).json()
+
+    posts = client.get("/api/blog/posts", headers={"If-None-Match": posts_tag})
+    assert posts.status_code == 200
+    assert created["id"] in [post["id"] for post in posts.json()["posts"]]
+    # The post awarded XP, so the profile changed too.
+    assert client.get("/api/gamification/profile", headers={"If-None-Match": profile_tag}).status_code == 200
+
+    client.delete(f"/api/blog/posts/{created['id']}")
+    assert client.get("/api/blog/posts").headers["etag"] != posts.headers["etag"]
+
+
+def test_oracle_stats_are_private_to_the_session(client):
+    response = client.get("/api/oracle/stats")
+    assert response.headers["cache-control"].startswith("private")
+    etag = response.headers["etag"]
+
+    client.cookies.clear()
+    other_session = client.get("/api/oracle/stats", headers={"If-None-Match": etag})
+    assert other_session.status_code == 200
+    assert other_session.headers["etag"] != etag
@@ -50,3 +50,157 @@ def test_cv_get_latest_analysis_envelope(client):
     payload = response.json()
     _assert_cv_envelope(payload)
     assert isinstance(payload["data"], dict)
+
+
+def test_cv_section_scores_aggregate_json_sections(client):
+    from sqlmodel import Session
+
+    from app.database import engine
+    from app.models import CVAnalysis
+    from app.services.players import default_player_id
+
+    with Session(engine) as session:
+        player_id = default_player_id(session)
+        for score in (60, 80):
+            session.add(
+                CVAnalysis(
+                    player_id=player_id,
+                    filename="aggregate.pdf",
+                    file_size=10,
+                    score=score,
+                    sections=[{"name": "Zeta Section", "score": score, "feedback": "ok"}],
+                    created_at="2026-01-01T00:00:00+00:00",
+                )
+            )
+        session.commit()
+
+    response = client.get("/api/cv/section-scores")
+    assert response.status_code == 200
+    payload = response.json()
+    _assert_cv_envelope(payload)
+    zeta = next(row for row in payload["data"]["sections"] if row["name"] == "Zeta Section")
+    assert zeta == {"name": "Zeta Section", "avg_score": 70.0, "analyses": 2}
+
+    analyses = client.get("/api/cv/analyses", params={"view": "full"}).json()["data"]["analyses"]
+    assert analyses[0]["sections"][0]["name"] == "Zeta Section"
+
+
+def test_cv_analyses_cursor_pages_and_detail(client):
+    from sqlmodel import Session, select
+
+    from app.database import engine
+    from app.models import CVAnalysis
+    from app.services.players import default_player_id
+
+    with Session(engine) as session:
+        player_id = default_player_id(session)
+        for i in range(3):
+            session.add(
+                CVAnalysis(
+                    player_id=player_id,
+                    filename=f"page-{i}.pdf",
+                    file_size=10,
+                    score=70,
+                    strengths=["clear"],
+                    created_at="2026-01-01T00:00:00+00:00",
+                )
+            )
+        session.commit()
+        stored = len(session.exec(select(CVAnalysis.id).where(CVAnalysis.player_id == player_id)).all())
+
+    first = client.get("/api/cv/analyses", params={"limit": 2, "include_total": "true"}).json()["data"]
+    assert set(first["analyses"][0]) == {"id", "filename", "score", "created_at"}
+    assert first["has_more"] is True
+    assert first["total"] == stored
+
+    second = client.get("/api/cv/analyses", params={"limit": 2, "cursor": first["next_cursor"]}).json()["data"]
+    ids = [row["id"] for row in first["analyses"] + second["analyses"]]
+    assert second["total"] is None
+    assert ids == sorted(ids, reverse=True)
+    assert len(set(ids)) == len(ids)
+
+    full = client.get("/api/cv/analyses", params={"limit": 1, "view": "full"}).json()["data"]
+    assert full["analyses"][0]["strengths"] == ["clear"]
+
+    detail = client.get(f"/api/cv/analyses/{ids[0]}").json()
+    _assert_cv_envelope(detail)
+    assert detail["data"]["filename"] == "page-2.pdf"
+
+    missing = client.get("/api/cv/analyses/999999")
+    assert missing.status_code == 404
+    assert missing.json()["error"]["code"] == "NOT_FOUND"
+
+    bad = client.get("/api/cv/analyses", params={"cursor": "nope"})
+    assert bad.status_code == 400
+
+
+def test_cv_upload_rejects_content_that_does_not_match_extension(client):
+    files = {"file": ("resume.pdf", b"PK\x03\x04 not really a pdf", "application/pdf")}
+    response = client.post("/api/cv/upload", files=files)
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "content_type_mismatch"
+
+
+def test_cv_upload_over_cap_is_cut_off_while_streaming(client):
+    from app.routers.cv import MAX_UPLOAD_BYTES
+
+    boundary = "capboundary"
+    head = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="big.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n%PDF-1.4\n"
+    ).encode()
+
+    def body():
+        yield head
+        for _ in range(MAX_UPLOAD_BYTES // 65536 + 8):
+            yield b"0" * 65536
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    # A generator body is sent chunked, so only the streaming byte count can stop it.
+    response = client.post(
+        "/api/cv/upload",
+        content=body(),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+    assert response.status_code == 413
+    payload = response.json()
+    assert payload["ok"] is False
+    assert payload["error"]["message"] == "file_too_large"
+
+
+def test_rpg_cv_download_is_cached_by_player_version(client, monkeypatch):
+    from sqlmodel import Session
+
+    from app.database import engine
+    from app.services import cv_export_service
+    from app.services.gamification_engine import award_xp
+    from app.services.players import default_player_id
+
+    renders = {"count": 0}
+    real_generate = cv_export_service.generate_rpg_cv
+
+    def counting_generate(session, player_id, fmt="pdf"):
+        renders["count"] += 1
+        return real_generate(session, player_id, fmt)
+
+    monkeypatch.setattr(cv_export_service, "generate_rpg_cv", counting_generate)
+
+    first = client.get("/api/cv/download-rpg")
+    assert first.status_code == 200
+    assert first.content.startswith(b"%PDF")
+    etag = first.headers["etag"]
+
+    second = client.get("/api/cv/download-rpg")
+    assert second.headers["etag"] == etag
+    assert renders["count"] <= 1
+
+    not_modified = client.get("/api/cv/download-rpg", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    with Session(engine) as session:
+        award_xp(session, "test", "version bump", 1, player_id=default_player_id(session))
+
+    changed = client.get("/api/cv/download-rpg", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+
+from app.services import cv_export_service, cv_export_templates
+
+
+def _slow_render(renders: dict[str, int]):
+    def render(data, fmt="pdf"):
+        renders["count"] += 1
+        time.sleep(0.2)
+        return b"%PDF-fake", "player-rpg-cv.pdf"
+
+    return render
+
+
+def test_rpg_cv_render_runs_off_loop_and_coalesces_misses(monkeypatch):
+    renders = {"count": 0}
+    monkeypatch.setattr(cv_export_service, "load_rpg_cv_data", lambda session, player_id: _sample_data())
+    monkeypatch.setattr(cv_export_service, "render_rpg_cv", _slow_render(renders))
+    version = 987_654_321  # not used by any real player state
+
+    async def scenario() -> tuple[list[cv_export_service.RenderedCV], int]:
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        results = await asyncio.gather(
+            *(cv_export_service.get_rpg_cv_async(None, player_id=1, version=version) for _ in range(3)),  # type: ignore[arg-type]
+            heartbeat(),
+        )
+        return list(results[:3]), ticks
+
+    rendered, ticks = asyncio.run(scenario())
+
+    assert renders["count"] == 1
+    assert {r.etag for r in rendered} == {cv_export_service.rpg_cv_etag(1, version)}
+    # The loop kept running while the render slept on a worker thread.
+    assert ticks == 10
+
+
+def test_cancelled_waiter_does_not_cancel_shared_render(monkeypatch):
+    renders = {"count": 0}
+    monkeypatch.setattr(cv_export_service, "load_rpg_cv_data", lambda session, player_id: _sample_data())
+    monkeypatch.setattr(cv_export_service, "render_rpg_cv", _slow_render(renders))
+    version = 987_654_322
+
+    async def scenario() -> cv_export_service.RenderedCV:
+        first = asyncio.ensure_future(cv_export_service.get_rpg_cv_async(None, player_id=1, version=version))  # type: ignore[arg-type]
+        await asyncio.sleep(0.05)
+        second = asyncio.ensure_future(cv_export_service.get_rpg_cv_async(None, player_id=1, version=version))  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    rendered = asyncio.run(scenario())
+
+    assert renders["count"] == 1
+    assert rendered.content == b"%PDF-fake"
+    # The render finished into the cache even though its first waiter left.
+    assert cv_export_service._cached_render(cv_export_service._render_cache_key(1, version, "pdf")) == rendered
+
+
+def _sample_data(achievements: int = 2) -> cv_export_templates.CVExportData:
+    return cv_export_templates.CVExportData(
+        name="Ada <Dev>",
+        title="Full-Stack Mage",
+        dev_class="Full-Stack Mage",
+        level=3,
+        xp=120,
+        xp_next_level=3000,
+        stats=[("STR", 70, "Problem Solving")],
+        branches=[cv_export_templates.SkillBranch("Backend Sorcery", [("FastAPI", 4, 5)])],
+        achievements=[(f"Title {i}", "Earned by shipping " * 12) for i in range(achievements)],
+        generated_at="2026-01-01T00:00:00+00:00",
+    )
+
+
+def test_pdf_wrapping_uses_font_metrics():
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    text = "W" * 30 + " " + "i" * 30 + " " + "W" * 30
+    lines = cv_export_templates.wrap_to_width(text, font="Helvetica", size=10, max_width=200)
+    assert len(lines) == 3
+    assert all(stringWidth(line, "Helvetica", 10) <= 200 for line in lines if " " in line)
+    # Narrow glyphs share a line that the same number of wide glyphs could not.
+    narrow = cv_export_templates.wrap_to_width("i" * 30 + " " + "i" * 30, font="Helvetica", size=10, max_width=200)
+    assert len(narrow) == 1
+
+
+def test_all_formats_render_from_one_document():
+    data = _sample_data()
+    pdf, pdf_name = cv_export_service.render_rpg_cv(data, "pdf")
+    html_doc, html_name = cv_export_service.render_rpg_cv(data, "html")
+    markdown, md_name = cv_export_service.render_rpg_cv(data, "markdown")
+
+    assert pdf.startswith(b"%PDF") and pdf_name == "ada-dev-rpg-cv.pdf"
+    assert html_name.endswith(".html") and md_name.endswith(".md")
+    assert b"<h3>Backend Sorcery</h3>" in html_doc
+    assert b"Ada &lt;Dev&gt;" in html_doc
+    assert "## Earned Titles" in markdown.decode()
+    assert "  - FastAPI: Lv.4/5" in markdown.decode()
+
+    from pypdf import PdfReader
+
+    long_pdf, _ = cv_export_service.render_rpg_cv(_sample_data(achievements=80), "pdf")
+    assert len(PdfReader(io.BytesIO(long_pdf)).pages) > 1
+
+
+def test_bulk_export_streams_zip_with_manifest(client):
+    import json
+    import zipfile
+
+    response = client.get("/api/cv/export/bulk", params=[("format", "pdf"), ("format", "markdown")])
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert "content-length" not in response.headers
+
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    names = archive.namelist()
+    assert names[-1] == "manifest.json"
+    manifest = json.loads(archive.read("manifest.json"))
+    rpg_entries = [entry for entry in manifest["entries"] if entry["kind"] == "rpg_cv"]
+    assert {entry["format"] for entry in rpg_entries} == {"pdf", "markdown"}
+    for entry in manifest["entries"]:
+        assert archive.getinfo(entry["path"]).file_size == entry["size"]
+    pdf_entry = next(entry for entry in rpg_entries if entry["format"] == "pdf")
+    assert archive.read(pdf_entry["path"]).startswith(b"%PDF")
+
+    assert client.get("/api/cv/export/bulk", params={"format": "docx"}).status_code == 400
+    assert client.get("/api/cv/export/bulk", params={"profile_id": 999_999}).status_code == 404
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import io
+
+from app.services.cv_service import MAX_CV_TEXT_CHARS, _sanitize_cv_text, extract_cv_text_detailed
+from benchmarks.fixtures import sample_docx_bytes, sample_pdf_bytes
+
+
+def test_pdf_extraction_stops_once_budget_is_filled():
+    result = extract_cv_text_detailed("resume.pdf", sample_pdf_bytes(pages=20))
+    assert result.source == "pdf_parser"
+    assert result.truncated is True
+    assert result.units_processed < 20
+    assert len(_sanitize_cv_text(result.text)) == MAX_CV_TEXT_CHARS
+
+
+def test_pdf_image_only_pages_are_skipped_without_parsing():
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    pdf.showPage()  # blank page: no fonts in its resources
+    pdf.setFont("Helvetica", 10)
+    pdf.drawString(42, 700, "Senior backend engineer")
+    pdf.showPage()
+    pdf.save()
+
+    result = extract_cv_text_detailed("resume.pdf", io.BytesIO(buffer.getvalue()))
+    assert result.text == "Senior backend engineer"
+    assert result.units_processed == 2
+    assert result.truncated is False
+
+
+def test_docx_extraction_streams_paragraphs_with_early_stop():
+    short = extract_cv_text_detailed("resume.docx", sample_docx_bytes(paragraphs=3))
+    assert short.truncated is False
+    assert short.text.splitlines()[0] == "Curriculum Vitae"
+
+    long = extract_cv_text_detailed("resume.docx", sample_docx_bytes(paragraphs=400))
+    assert long.truncated is True
+    assert long.units_processed < 400
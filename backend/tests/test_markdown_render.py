@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from app.services.markdown_render import content_hash, render_markdown
+
+
+def test_renders_the_board_subset():
+    html = render_markdown(
+        "## Title\n\nSome **bold**, *soft* and `co<de>`\nwrapped\n\n- one\n- two\n\n1. first\n\n> quoted\n\n"
+        "```\n<b>raw</b>\n```\n[docs](https://example.com/a_(b)?x=1&y=2)"
+    )
+    assert html.split("\n") == [
+        "<h3>Title</h3>",
+        "<p>Some <strong>bold</strong>, <em>soft</em> and <code>co&lt;de&gt;</code> wrapped</p>",
+        "<ul>",
+        "<li>one</li>",
+        "<li>two</li>",
+        "</ul>",
+        "<ol>",
+        "<li>first</li>",
+        "</ol>",
+        "<blockquote><p>quoted</p></blockquote>",
+        "<pre><code>&lt;b&gt;raw&lt;/b&gt;</code></pre>",
+        '<p><a href="https://example.com/a_(b)?x=1&amp;y=2" rel="nofollow noopener noreferrer">docs</a></p>',
+    ]
+
+
+def test_output_is_sanitized():
+    html = render_markdown(
+        '<script>alert(1)</script> <img src=x onerror=alert(1)>\n\n'
+        '[a](javascript:alert(1)) [b](JAVASCRIPT:x) [c](//evil.example) [d](https://x"onclick="y) '
+        "![tracker](https://evil.example/p.gif) \x000\x00"
+    )
+    assert "<script" not in html and "<img" not in html
+    assert "javascript" not in html.lower() and "evil.example" not in html
+    assert 'href="https://x&quot;onclick=&quot;y"' in html
+    assert "tracker" in html
+
+
+def test_backslash_after_slash_is_not_a_relative_link():
+    # Browsers read "/\host" as the protocol-relative "//host".
+    html = render_markdown(r"[a](/\evil.example) [b](/\/evil.example) [ok](/blog/1)")
+    assert "evil.example" not in html
+    assert '<a href="/blog/1"' in html
+
+
+def test_hash_tracks_content():
+    assert content_hash("a") == content_hash("a")
+    assert content_hash("a") != content_hash("b")
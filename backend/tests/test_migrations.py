@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine, select
+
+from app.migrations import LATEST_VERSION, backfill, current_version, migrate, pending_migrations
+from app.models import CVAnalysis
+from app.services.blog_posts import ensure_posts_rendered
+
+
+def _engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+
+
+def _index_names(engine, table: str) -> set[str]:
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"PRAGMA index_list({table})")).fetchall()
+    return {str(row[1]) for row in rows}
+
+
+def test_fresh_database_migrates_to_latest(tmp_path):
+    engine = _engine(tmp_path)
+    assert current_version(engine) == 0
+
+    assert migrate(engine) == LATEST_VERSION
+    assert pending_migrations(engine) == []
+    assert "ix_chatmessage_player_session_created_id" in _index_names(engine, "chatmessage")
+    # Second run is a no-op.
+    assert migrate(engine) == LATEST_VERSION
+
+
+def test_legacy_database_gains_session_column_and_indexes(tmp_path):
+    engine = _engine(tmp_path)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE chatmessage (id INTEGER PRIMARY KEY, role TEXT NOT NULL, text TEXT NOT NULL, "
+                "context_topic TEXT NOT NULL, created_at TEXT NOT NULL)"
+            )
+        )
+        connection.execute(
+            text("INSERT INTO chatmessage (role, text, context_topic, created_at) VALUES ('user', 'hi', '', 'x')")
+        )
+
+    migrate(engine)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT session_id FROM chatmessage")).scalar() == ""
+        # Pre-multi-profile rows belong to the original player.
+        assert connection.execute(text("SELECT player_id FROM chatmessage")).scalar() == 1
+    assert {
+        "ix_chatmessage_player_session_created_id",
+        "ix_chatmessage_player_session_role_topic",
+        "ix_chatmessage_player_role",
+    } <= _index_names(engine, "chatmessage")
+    assert "ix_chatmessage_session_created_id" not in _index_names(engine, "chatmessage")
+
+
+def test_backfill_updates_in_batches(tmp_path):
+    engine = _engine(tmp_path)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)"))
+        connection.execute(text("INSERT INTO t (v) SELECT NULL FROM (SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3)"))
+        connection.execute(text("INSERT INTO t (v) SELECT v FROM t"))
+
+    backfill("t", set_clause="v = 'done'", where="v IS NULL", batch_rows=4)(engine)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM t WHERE v = 'done'")).scalar() == 6
+
+
+def test_cv_text_blobs_become_json(tmp_path):
+    engine = _engine(tmp_path)
+    migrate(engine)
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM schema_version WHERE version >= 4"))
+        connection.execute(
+            text(
+                "INSERT INTO cvanalysis (player_id, filename, file_size, score, strengths, weaknesses, tips, sections, "
+                "created_at) "
+                """VALUES (1, 'a.pdf', 1, 50, '["clear"]', '', '', '[{"name": "Skills", "score": 50}]', 'x')"""
+            )
+        )
+
+    migrate(engine)
+
+    with Session(engine) as session:
+        record = session.exec(select(CVAnalysis)).one()
+    assert record.strengths == ["clear"]
+    assert record.weaknesses == []
+    assert record.sections == [{"name": "Skills", "score": 50}]
+
+
+def test_existing_posts_get_excerpts_and_tag_rows(tmp_path):
+    engine = _engine(tmp_path)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE blogpost (id INTEGER PRIMARY KEY, title TEXT NOT NULL, content TEXT NOT NULL, "
+                "category TEXT NOT NULL, tags TEXT NOT NULL, color TEXT NOT NULL, pinned BOOLEAN NOT NULL, "
+                "created_at TEXT NOT NULL, updated_at TEXT NOT NULL)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO blogpost (title, content, category, tags, color, pinned, created_at, updated_at) "
+                "VALUES ('Old', '## Heading\n\nSome **bold** [link](http://x)', 'update', 'AI, ml,ai,', '#fff', 0, "
+                "'x', 'x')"
+            )
+        )
+
+    migrate(engine)
+    # Rendering is not a migration step; startup renders once per renderer version.
+    assert ensure_posts_rendered(engine) is True
+    assert ensure_posts_rendered(engine) is False
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT excerpt, tags FROM blogpost")).one() == ("Heading Some bold link", "ai,ml")
+        assert connection.execute(text("SELECT content_html FROM blogpost")).scalar() == (
+            '<h3>Heading</h3>\n<p>Some <strong>bold</strong> <a href="http://x" rel="nofollow noopener noreferrer">'
+            "link</a></p>"
+        )
+        assert connection.execute(text("SELECT tag FROM posttag ORDER BY tag")).scalars().all() == ["ai", "ml"]
+    assert "ix_blogpost_player_pinned_created_id" in _index_names(engine, "blogpost")
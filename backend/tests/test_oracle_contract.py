@@ -27,13 +27,53 @@ def test_oracle_chat_validation_error(client):
 
 
 def test_oracle_history_validation_error(client):
-    response = client.get("/api/oracle/history?limit=0&offset=-1")
+    response = client.get("/api/oracle/history?limit=0")
     assert response.status_code == 400
     payload = response.json()
     _assert_error_envelope(payload)
     assert payload["error"]["code"] == "VALIDATION_ERROR"
 
 
+def test_oracle_history_cursor_pagination(client, oracle_session_id):
+    from sqlmodel import Session
+
+    from app.database import engine
+    from app.models import ChatMessage
+    from app.services.players import default_player_id
+
+    with Session(engine) as session:
+        player_id = default_player_id(session)
+        # Identical timestamps: ordering must fall back to id without skipping rows.
+        for i in range(5):
+            session.add(
+                ChatMessage(
+                    player_id=player_id,
+                    session_id=oracle_session_id,
+                    role="user",
+                    text=f"m{i}",
+                    created_at="2026-01-01T00:00:00+00:00",
+                )
+            )
+        session.commit()
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        payload = client.get("/api/oracle/history", params=params).json()
+        _assert_success_envelope(payload)
+        seen.extend(message["text"] for message in payload["data"]["messages"])
+        cursor = payload["data"]["next_cursor"]
+        assert payload["data"]["has_more"] is (cursor is not None)
+        if cursor is None:
+            break
+    assert seen == [f"m{i}" for i in range(5)]
+
+    response = client.get("/api/oracle/history", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "invalid_cursor"
+
+
 def test_oracle_chat_success_envelope_with_tool_runtime(client, monkeypatch):
     from app.services import oracle_service
 
@@ -28,9 +28,15 @@ def test_oracle_tools_runtime_contract_and_execution():
     assert profile_result["ok"] is True
     assert profile_result["data"]["name"] == "Renan"
 
-    history_result = runtime.execute(name="oracle_get_oracle_history", arguments_json='{"limit":1,"offset":0}')
+    history_result = runtime.execute(name="oracle_get_oracle_history", arguments_json='{"limit":1,"cursor":null}')
     assert history_result["ok"] is True
-    assert history_result["data"]["total"] == 1
+    assert len(history_result["data"]["messages"]) == 1
+    assert history_result["data"]["has_more"] is False
+    assert history_result["data"]["next_cursor"] is None
+
+    bad_cursor = runtime.execute(name="oracle_get_oracle_history", arguments_json='{"limit":1,"cursor":"%%%"}')
+    assert bad_cursor["ok"] is False
+    assert bad_cursor["error"]["message"] == "invalid_cursor"
 
     invalid_result = runtime.execute(name="oracle_get_player_skills", arguments_json="{}")
     assert invalid_result["ok"] is False
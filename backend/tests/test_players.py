@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+
+def test_players_are_isolated_by_header(client):
+    created = client.post("/api/gamification/players", json={"name": "Ada Lovelace"})
+    assert created.status_code == 200
+    player_id = created.json()["id"]
+    as_new = {"X-Player-Id": str(player_id)}
+
+    profile = client.get("/api/gamification/profile", headers=as_new).json()
+    assert profile["name"] == "Ada Lovelace"
+    assert profile["level"] == 1
+    assert profile["avatar_initials"] == "AL"
+
+    post = client.post(
+        "/api/blog/posts", headers=as_new, json={"title": "Ada's first scroll", "content": "Hello"}
+    ).json()
+    assert post["player_id"] == player_id
+    assert post["gamification"]["xp_gained"] == 75
+
+    own_titles = [p["title"] for p in client.get("/api/blog/posts", headers=as_new).json()["posts"]]
+    default_titles = [p["title"] for p in client.get("/api/blog/posts").json()["posts"]]
+    assert own_titles == ["Ada's first scroll"]
+    assert "Ada's first scroll" not in default_titles
+    assert client.get(f"/api/blog/posts/{post['id']}").status_code == 404
+
+    achievements = client.get("/api/gamification/achievements", headers=as_new).json()["achievements"]
+    assert achievements and not any(a["unlocked"] for a in achievements)
+    activity = client.get("/api/gamification/activity-log", headers=as_new).json()["activities"]
+    assert [a["action"] for a in activity] == ["blog_create"]
+
+    invalid = client.get("/api/gamification/profile", headers={"X-Player-Id": "abc"})
+    assert invalid.status_code == 400
+    assert invalid.json()["error"]["code"] == "VALIDATION_ERROR"
+    unknown = client.get("/api/gamification/profile", headers={"X-Player-Id": "999999"})
+    assert unknown.status_code == 404
+    assert unknown.json()["ok"] is False and unknown.json()["error"]["code"] == "NOT_FOUND"
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+def _plan(sql: str, params: dict) -> str:
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).fetchall()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def test_history_page_and_count_use_session_index(client):
+    page_plan = _plan(
+        "SELECT id, role, text, created_at FROM chatmessage WHERE player_id = :pid AND session_id = :sid "
+        "ORDER BY created_at, id LIMIT 51",
+        {"pid": 1, "sid": "s"},
+    )
+    assert "ix_chatmessage_player_session_created_id" in page_plan
+    assert "TEMP B-TREE" not in page_plan
+
+    cursor_plan = _plan(
+        "SELECT id, role, text, created_at FROM chatmessage WHERE player_id = :pid AND session_id = :sid "
+        "AND (created_at, id) > (:c, :i) ORDER BY created_at, id LIMIT 51",
+        {"pid": 1, "sid": "s", "c": "2026-01-01T00:00:00+00:00", "i": 10},
+    )
+    assert "ix_chatmessage_player_session_created_id (player_id=? AND session_id=? AND created_at" in cursor_plan
+    assert "TEMP B-TREE" not in cursor_plan
+
+    count_plan = _plan(
+        "SELECT count(id) FROM chatmessage WHERE player_id = :pid AND session_id = :sid", {"pid": 1, "sid": "s"}
+    )
+    assert "COVERING INDEX" in count_plan
+
+
+def test_stats_topics_use_covering_index(client):
+    plan = _plan(
+        "SELECT count(DISTINCT context_topic) FROM chatmessage "
+        "WHERE player_id = :pid AND session_id = :sid AND role = 'oracle' AND context_topic != ''",
+        {"pid": 1, "sid": "s"},
+    )
+    assert "COVERING INDEX ix_chatmessage_player_session_role_topic" in plan
+
+
+def test_activity_created_at_range_uses_index(client):
+    plan = _plan(
+        "SELECT count(id), sum(xp_gained) FROM activitylog WHERE player_id = :pid AND created_at >= :since",
+        {"pid": 1, "since": "2026-01-01T00:00:00+00:00"},
+    )
+    assert "ix_activitylog_player_created_at" in plan
+
+
+def test_per_player_counters_stay_within_one_player(client):
+    plan = _plan("SELECT count(id) FROM chatmessage WHERE player_id = :pid AND role = 'user'", {"pid": 1})
+    assert "COVERING INDEX ix_chatmessage_player_role (player_id=? AND role=?)" in plan
+
+    plan = _plan("SELECT count(id) FROM cvanalysis WHERE player_id = :pid", {"pid": 1})
+    assert "ix_cvanalysis_player_id (player_id=?)" in plan
+
+
+def test_blog_pages_and_tag_filters_use_indexes(client):
+    plan = _plan(
+        "SELECT id FROM blogpost WHERE player_id = :pid AND (pinned, created_at, id) < (:p, :c, :i) "
+        "ORDER BY pinned DESC, created_at DESC, id DESC LIMIT 21",
+        {"pid": 1, "p": 0, "c": "2026-01-01T00:00:00", "i": 10},
+    )
+    assert "ix_blogpost_player_pinned_created_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+    plan = _plan(
+        "SELECT id FROM blogpost WHERE player_id = :pid AND category = :cat "
+        "ORDER BY pinned DESC, created_at DESC, id DESC LIMIT 21",
+        {"pid": 1, "cat": "project"},
+    )
+    assert "ix_blogpost_player_category_pinned_created_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+    plan = _plan("SELECT post_id FROM posttag WHERE player_id = :pid AND tag = :tag", {"pid": 1, "tag": "ai"})
+    assert "COVERING INDEX ix_posttag_player_tag_post" in plan
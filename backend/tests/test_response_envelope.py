@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+
+from app.services.response_envelope import FastJSONResponse, failure_response, success
+
+
+class _Item(BaseModel):
+    name: str
+
+
+def test_success_is_rendered_once_with_non_native_fallback():
+    at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    response = success(flow="oracle", request_id="r1", source="db", data={"at": at, "item": _Item(name="x")})
+
+    assert isinstance(response, FastJSONResponse)
+    payload = json.loads(response.body)
+    assert payload["ok"] is True
+    assert payload["data"] == {"at": "2026-01-02T03:04:05+00:00", "item": {"name": "x"}}
+    assert payload["meta"]["request_id"] == "r1"
+
+
+def test_failure_response_keeps_status_and_envelope():
+    response = failure_response(
+        flow="cv", request_id="r2", code="NOPE", message="bad", retryable=False, status_code=400
+    )
+
+    assert response.status_code == 400
+    assert json.loads(response.body)["error"]["code"] == "INTERNAL_ERROR"
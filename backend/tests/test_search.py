@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from sqlmodel import Session, create_engine
+
+from app.migrations import migrate
+from app.models import ChatMessage, PlayerProfile
+from app.services.search import rebuild_search_index, search
+
+
+def _player(client, name):
+    player_id = client.post("/api/gamification/players", json={"name": name}).json()["id"]
+    return {"X-Player-Id": str(player_id)}
+
+
+def test_blog_results_are_ranked_highlighted_and_paged(client):
+    headers = _player(client, "Grace Hopper")
+    titles = ["Compiler notes", "Debugging moths", "On compilers & <b>tags</b>"]
+    for title in titles:
+        client.post(
+            "/api/blog/posts",
+            headers=headers,
+            json={"title": title, "content": f"{title}: the compiler turns <code> into machines.", "tags": "cobol"},
+        )
+    client.post("/api/blog/posts", headers=headers, json={"title": "Unrelated", "content": "Nothing to see"})
+
+    response = client.get("/api/search", params={"q": "compil", "type": "blog", "limit": 2}, headers=headers)
+    assert response.status_code == 200
+    page = response.json()["data"]
+    assert len(page["results"]) == 2 and page["has_more"] is True
+    first = page["results"][0]
+    assert first["kind"] == "blog"
+    assert first["score"] >= page["results"][1]["score"]
+    assert "<mark>compiler</mark>" in first["snippet"]
+    assert "&lt;code&gt;" in first["snippet"]
+
+    rest = client.get(
+        "/api/search", params={"q": "compil", "type": "blog", "cursor": page["next_cursor"]}, headers=headers
+    ).json()["data"]
+    seen = [r["title"] for r in page["results"] + rest["results"]]
+    assert sorted(seen) == sorted(titles)
+    assert rest["has_more"] is False
+
+    # Other players never see these posts.
+    other = _player(client, "Someone Else")
+    assert client.get("/api/search", params={"q": "compiler"}, headers=other).json()["data"]["results"] == []
+
+
+def test_index_follows_updates_and_deletes(client):
+    headers = _player(client, "Index Keeper")
+    post = client.post("/api/blog/posts", headers=headers, json={"title": "Quasar", "content": "Bright"}).json()
+    assert [r["id"] for r in client.get("/api/search", params={"q": "quasar"}, headers=headers).json()["data"]["results"]] == [
+        post["id"]
+    ]
+
+    client.put(f"/api/blog/posts/{post['id']}", headers=headers, json={"title": "Pulsar", "content": "Bright"})
+    assert client.get("/api/search", params={"q": "quasar"}, headers=headers).json()["data"]["results"] == []
+    assert len(client.get("/api/search", params={"q": "pulsar"}, headers=headers).json()["data"]["results"]) == 1
+
+    client.delete(f"/api/blog/posts/{post['id']}", headers=headers)
+    assert client.get("/api/search", params={"q": "pulsar"}, headers=headers).json()["data"]["results"] == []
+
+
+def test_rejects_queries_without_terms(client):
+    for params in ({"q": "  \"*() "}, {"q": "ok", "type": "files"}, {"q": "ok", "cursor": "bogus"}):
+        response = client.get("/api/search", params=params)
+        assert response.status_code == 400
+        assert response.json()["ok"] is False
+
+
+def test_oracle_results_are_scoped_to_the_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    migrate(engine)
+    with Session(engine) as session:
+        player = PlayerProfile(name="Oracle", title="", dev_class="", avatar_initials="O")
+        session.add(player)
+        session.commit()
+        for session_id, text in [("a", "tell me about kubernetes"), ("b", "kubernetes again"), ("a", "and docker")]:
+            session.add(
+                ChatMessage(player_id=player.id, session_id=session_id, role="user", text=text, created_at="2026-01-01")
+            )
+        session.commit()
+
+        rebuild_search_index(engine)
+        page = search(session, player_id=player.id, session_id="a", query="kubernetes")
+        assert [r["snippet"] for r in page.results] == ["tell me about <mark>kubernetes</mark>"]
+        assert page.results[0]["kind"] == "oracle"
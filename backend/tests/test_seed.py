@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from sqlalchemy import event, text
+from sqlmodel import Session, create_engine, select
+
+import app.seed as seed
+from app.migrations import migrate
+from app.models import Achievement, PlayerProfile
+
+
+def _engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    migrate(engine)
+    return engine
+
+
+def test_current_stamp_costs_one_statement(tmp_path):
+    engine = _engine(tmp_path)
+    with Session(engine) as session:
+        assert seed.seed_database(session) is True
+
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with Session(engine) as session:
+        assert seed.seed_database(session) is False
+    assert len(statements) == 1
+    assert "stateversion" in statements[0]
+
+
+def test_catalog_change_is_upserted_for_every_player(tmp_path, monkeypatch):
+    engine = _engine(tmp_path)
+    with Session(engine) as session:
+        seed.seed_database(session)
+        session.connection().execute(text("UPDATE achievement SET unlocked = 1 WHERE name = 'Oracle Sage'"))
+        second = PlayerProfile(name="Second", title="", dev_class="", avatar_initials="S")
+        session.add(second)
+        session.commit()
+        second_id = second.id
+
+    monkeypatch.setattr(seed, "SEED_VERSION", seed.SEED_VERSION + 1)
+    monkeypatch.setattr(
+        seed,
+        "_LOCKABLE_ACHIEVEMENTS",
+        [
+            ("Oracle Sage", "Sent 50+ messages to the Oracle", "brain", "oracle", "#8b5cf6"),
+            ("Night Owl", "Posted after midnight", "moon", "writing", "#22c55e"),
+        ],
+    )
+    with Session(engine) as session:
+        assert seed.seed_database(session) is True
+        players = session.exec(select(PlayerProfile.id)).all()
+        night_owls = session.exec(select(Achievement).where(Achievement.name == "Night Owl")).all()
+        sages = session.exec(select(Achievement).where(Achievement.name == "Oracle Sage")).all()
+
+    assert sorted(a.player_id for a in night_owls) == sorted(players)
+    assert not any(a.unlocked for a in night_owls)
+    # Metadata follows the catalog; the original player keeps their unlock.
+    assert {a.description for a in sages} == {"Sent 50+ messages to the Oracle"}
+    assert {a.player_id: a.unlocked for a in sages} == {players[0]: True, second_id: False}
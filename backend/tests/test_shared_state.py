@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services.shared_state import MemoryStore, RedisStore, SQLiteStore
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+class RedisStandIn:
+    """The slice of the redis-py client API that RedisStore uses."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, tuple[float | None, bytes]] = {}
+
+    def get(self, key: str) -> bytes | None:
+        expires_at, value = self.data.get(key, (None, None))
+        if value is None or (expires_at is not None and expires_at <= time.time()):
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, px: int | None = None) -> bool:
+        self.data[key] = (time.time() + px / 1000 if px else None, value)
+        return True
+
+    def delete(self, key: str) -> int:
+        return 1 if self.data.pop(key, None) else 0
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryStore()
+    if request.param == "sqlite":
+        return SQLiteStore(tmp_path / "shared.db")
+    return RedisStore(RedisStandIn())
+
+
+def test_store_get_set_delete_and_expiry(store):
+    assert store.get("k") is None
+    store.set("k", b"v1")
+    store.set("k", b"v2")
+    assert store.get("k") == b"v2"
+    store.delete("k")
+    assert store.get("k") is None
+
+    store.set("short", b"x", ttl=0.05)
+    assert store.get("short") == b"x"
+    time.sleep(0.1)
+    assert store.get("short") is None
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    first, second = SQLiteStore(tmp_path / "shared.db"), SQLiteStore(tmp_path / "shared.db")
+    first.set("count", b"3", ttl=60)
+    assert second.get("count") == b"3"
+    second.delete("count")
+    assert first.get("count") is None
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_multiple_workers_share_state(tmp_path):
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DB_PATH": str(tmp_path),
+        "WEB_CONCURRENCY": "2",
+        "SHARED_STATE_BACKEND": "",
+        "OPENAI_API_KEY": "",
+        "LOG_LEVEL": "WARNING",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--workers", "2"],
+        cwd=BACKEND_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{port}/api"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                if httpx.get(f"{base}/health").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            assert time.monotonic() < deadline, "workers did not start"
+            time.sleep(0.2)
+
+        # Both workers ran startup; the lock lets only the first one seed.
+        assert len(httpx.get(f"{base}/gamification/players").json()["players"]) == 1
+
+        # A fresh connection per request spreads calls over the workers; the cached
+        # total must still follow every write, whichever worker served it.
+        cookies = httpx.Cookies()
+        for expected in (2, 4, 6):
+            with httpx.Client(cookies=cookies, headers={"Connection": "close"}) as client:
+                assert client.post(f"{base}/oracle/chat", json={"message": "hello"}).status_code == 200
+                cookies = client.cookies
+            for _ in range(3):
+                with httpx.Client(cookies=cookies, headers={"Connection": "close"}) as client:
+                    history = client.get(f"{base}/oracle/history", params={"include_total": "true"}).json()
+                assert history["data"]["total"] == expected
+    finally:
+        server.terminate()
+        server.wait(timeout=15)
+
+    assert (tmp_path / "shared_state.db").exists()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from app.services.warmup import preload_heavy_modules
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+# Imported on first use (or by the background warmup), never by `import app.main`.
+LAZY_MODULES = ("openai", "reportlab", "pypdf", "docx")
+
+
+def _import_profile(tmp_path: Path) -> dict[str, int]:
+    """Cumulative import time (us) per module for a cold `import app.main`."""
+    env = {**os.environ, "DB_PATH": str(tmp_path), "PYTHONPATH": str(BACKEND_ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$", line)
+        if match:
+            profile[match.group(2)] = int(match.group(1))
+    return profile
+
+
+def test_cold_import_skips_heavy_sdks(tmp_path):
+    profile = _import_profile(tmp_path)
+
+    assert "app.main" in profile
+    loaded = {name.split(".")[0] for name in profile}
+    assert loaded.isdisjoint(LAZY_MODULES), sorted(loaded.intersection(LAZY_MODULES))
+
+
+def test_warmup_preloads_available_modules():
+    timings = preload_heavy_modules(("reportlab.pdfgen.canvas", "not_a_real_module_xyz"))
+
+    assert list(timings) == ["reportlab.pdfgen.canvas"]
+    assert "reportlab.pdfgen.canvas" in sys.modules
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import os
+
+from app.routers import gamification
+from app.services import timeline
+
+
+def test_timeline_is_cacheable(client):
+    response = client.get("/api/gamification/timeline")
+    assert response.status_code == 200
+    assert len(response.json()["entries"]) == 15
+    etag = response.headers["etag"]
+    assert not etag.startswith("W/")
+    assert "max-age" in response.headers["cache-control"]
+
+    revalidated = client.get("/api/gamification/timeline", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+
+
+def test_timeline_reload_requires_admin_token(client, monkeypatch):
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert client.post("/api/gamification/timeline/reload").status_code == 404
+
+    monkeypatch.setenv("ADMIN_TOKEN", "s3cret")
+    assert client.post("/api/gamification/timeline/reload", headers={"X-Admin-Token": "nope"}).status_code == 403
+    reloaded = client.post("/api/gamification/timeline/reload", headers={"X-Admin-Token": "s3cret"})
+    assert reloaded.status_code == 200
+    assert reloaded.json()["entries"] == 15
+
+
+def test_edited_file_is_picked_up_and_bad_edits_are_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(timeline, "_current", None)
+    monkeypatch.setattr(timeline, "_failed_mtime_ns", None)
+    path = tmp_path / "timeline.json"
+    path.write_text(json.dumps({"entries": [{"id": "a"}]}), encoding="utf-8")
+    first = timeline.current_timeline(path)
+
+    path.write_text(json.dumps({"entries": [{"id": "a"}, {"id": "b"}]}), encoding="utf-8")
+    os.utime(path, ns=(first.mtime_ns + 1_000_000, first.mtime_ns + 1_000_000))
+    second = timeline.current_timeline(path)
+    assert second.entries == 2
+    assert second.etag != first.etag
+
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, ns=(first.mtime_ns + 2_000_000, first.mtime_ns + 2_000_000))
+    assert timeline.current_timeline(path) is second
+
+
+def test_unloadable_timeline_is_reported_unavailable(client, monkeypatch):
+    def broken() -> timeline.TimelineDocument:
+        raise timeline.TimelineError("timeline_unreadable: FileNotFoundError")
+
+    monkeypatch.setattr(gamification, "current_timeline", broken)
+    response = client.get("/api/gamification/timeline")
+    assert response.status_code == 503
+    assert response.json()["error"]["code"] == "UNAVAILABLE"
@@ -236,8 +236,8 @@ export function GamificationProvider({ children }: { children: ReactNode }) {
   }, [])
 
   const showXPGain = useCallback((event: GamificationEvent) => {
-    // XP toast
-    addToast({ id: Date.now(), type: 'xp', xp: event.xp_gained }, 4000)
+    // XP toast (achievement-only events award no XP)
+    if (event.xp_gained > 0) addToast({ id: Date.now(), type: 'xp', xp: event.xp_gained }, 4000)
 
     // Achievement toasts (staggered)
     event.new_achievements.forEach((ach, i) => {
@@ -0,0 +1,96 @@
+import { useEffect, useRef, useState } from 'react'
+
+export interface CursorPage {
+  next_cursor: string | null
+  has_more: boolean
+}
+
+interface Feed<P, I> {
+  key: string
+  first: P
+  items: I[]
+  cursor: string | null
+  hasMore: boolean
+  error: boolean
+}
+
+/**
+ * A cursor-paginated list with "load more".
+ *
+ * The first page is fetched whenever `key` changes (e.g. a filter), and
+ * `loadMore` appends the page after the last one. When the first page cannot be
+ * loaded, `fallback` is shown with `error` set.
+ */
+export function useCursorFeed<P extends CursorPage, I>(
+  key: string,
+  fetchPage: (cursor: string | null) => Promise<P | null>,
+  itemsOf: (page: P) => I[],
+  fallback: P,
+): {
+  items: I[]
+  first: P
+  loading: boolean
+  error: boolean
+  hasMore: boolean
+  loadingMore: boolean
+  loadMore: () => void
+} {
+  const [feed, setFeed] = useState<Feed<P, I> | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const argsRef = useRef({ fetchPage, itemsOf, fallback })
+
+  useEffect(() => {
+    argsRef.current = { fetchPage, itemsOf, fallback }
+  })
+
+  useEffect(() => {
+    let cancelled = false
+    const show = (page: P, error: boolean) => {
+      if (cancelled) return
+      const items = argsRef.current.itemsOf(page)
+      setFeed({ key, first: page, items, cursor: page.next_cursor, hasMore: page.has_more, error })
+    }
+
+    argsRef.current
+      .fetchPage(null)
+      .then((page) => (page !== null ? show(page, false) : show(argsRef.current.fallback, true)))
+      .catch(() => show(argsRef.current.fallback, true))
+
+    return () => {
+      cancelled = true
+    }
+  }, [key])
+
+  // Until the first page for `key` arrives, nothing from another key is shown.
+  const current = feed !== null && feed.key === key ? feed : null
+
+  const loadMore = () => {
+    if (current === null || !current.hasMore || current.cursor === null || loadingMore) return
+    const { key: requestedKey, cursor } = current
+    setLoadingMore(true)
+    argsRef.current
+      .fetchPage(cursor)
+      .then((page) => {
+        if (page === null) return
+        const items = argsRef.current.itemsOf(page)
+        // Ignore a page that arrives after the filter changed or was already appended.
+        setFeed((prev) =>
+          prev !== null && prev.key === requestedKey && prev.cursor === cursor
+            ? { ...prev, items: [...prev.items, ...items], cursor: page.next_cursor, hasMore: page.has_more }
+            : prev,
+        )
+      })
+      .catch(() => undefined)
+      .finally(() => setLoadingMore(false))
+  }
+
+  return {
+    items: current?.items ?? [],
+    first: current?.first ?? fallback,
+    loading: current === null,
+    error: current?.error ?? false,
+    hasMore: current?.hasMore ?? false,
+    loadingMore,
+    loadMore,
+  }
+}
@@ -108,6 +108,7 @@ const en = {
       weaknesses: 'Weaknesses',
       proTips: 'Pro Tips',
       history: 'Analysis History ({{count}})',
+      loadMore: 'Load older analyses',
     },
     download: {
       button: 'Download RPG CV',
@@ -199,6 +200,7 @@ const en = {
     collapse: 'Collapse',
     loadingPosts: 'Loading posts...',
     noPostsCategory: 'No posts in this category yet.',
+    loadMore: 'Load more posts',
   },
   skillTree: {
     title: 'Skill Tree',
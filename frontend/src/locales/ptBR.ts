@@ -108,6 +108,7 @@ const ptBR = {
       weaknesses: 'Pontos Fracos',
       proTips: 'Dicas Pro',
       history: 'Historico de Analises ({{count}})',
+      loadMore: 'Carregar analises anteriores',
     },
     download: {
       button: 'Baixar RPG CV',
@@ -199,6 +200,7 @@ const ptBR = {
     collapse: 'Recolher',
     loadingPosts: 'Carregando posts...',
     noPostsCategory: 'Ainda nao ha posts nesta categoria.',
+    loadMore: 'Carregar mais posts',
   },
   skillTree: {
     title: 'Arvore de Skills',
@@ -16,8 +16,10 @@ import {
   type AchievementsResponse,
   type CVAnalysisResponse,
   type CVAnalysesResponse,
+  type CVAnalysisSummary,
 } from '../services/api'
 import { useAPI } from '../hooks/useAPI'
+import { useCursorFeed } from '../hooks/useCursorFeed'
 import { useGamification } from '../contexts/GamificationContext'
 import i18n from '../i18n'
 
@@ -93,7 +95,12 @@ const FALLBACK_SKILLS: SkillsResponse = {
   ],
 }
 
-const FALLBACK_ANALYSES: CVAnalysesResponse = { analyses: [] }
+const FALLBACK_ANALYSES: CVAnalysesResponse = { analyses: [], next_cursor: null, has_more: false }
+const ANALYSES_PAGE_SIZE = 20
+
+// The first page also counts every analysis, so the history header shows the full total.
+const fetchAnalysesPage = (cursor: string | null) => api.getCVAnalyses(ANALYSES_PAGE_SIZE, cursor, cursor === null)
+const analysesOf = (page: CVAnalysesResponse) => page.analyses
 
 /* ═══════════════════════════════════════════
    CUSTOM SVG STAT ICONS
@@ -325,7 +332,7 @@ function fileExtension(name: string): string {
 function toCVMessage(raw: string): string {
   const key = raw.trim().toLowerCase()
   if (!key) return i18n.t('guild.errors.unexpected')
-  if (key.includes('unsupported_file_type')) return i18n.t('guild.errors.unsupportedFileType')
+  if (key.includes('unsupported_file_type') || key.includes('content_type_mismatch')) return i18n.t('guild.errors.unsupportedFileType')
   if (key.includes('file_too_large')) return i18n.t('guild.errors.fileTooLarge')
   if (key.includes('empty_file')) return i18n.t('guild.errors.emptyFile')
   if (key.includes('network')) return i18n.t('guild.errors.network')
@@ -395,7 +402,7 @@ export default function GuildHall() {
   const { data: profile } = useAPI(() => api.getProfile(), FALLBACK_PROFILE)
   const { data: achievementsData } = useAPI(() => api.getAchievements(), FALLBACK_ACHIEVEMENTS)
   const { data: skillsData } = useAPI(() => api.getSkills(), FALLBACK_SKILLS)
-  const { data: analysesData, loading: analysesLoading } = useAPI(() => api.getCVAnalyses(), FALLBACK_ANALYSES)
+  const history = useCursorFeed('analyses', fetchAnalysesPage, analysesOf, FALLBACK_ANALYSES)
 
   /* ─── Local state ─── */
   const [currentFile, setCurrentFile] = useState<File | null>(null)
@@ -409,14 +416,14 @@ export default function GuildHall() {
 
   /* ─── Derived data ─── */
   const allAnalyses = useMemo(() => {
-    const combined = [...analyses]
-    if (analysesData.analyses) {
-      for (const a of analysesData.analyses) {
-        if (!combined.some(c => c.id === a.id)) combined.push(a)
-      }
+    const combined: CVAnalysisSummary[] = [...analyses]
+    for (const a of history.items) {
+      if (!combined.some(c => c.id === a.id)) combined.push(a)
     }
     return combined.sort((a, b) => b.id - a.id)
-  }, [analyses, analysesData])
+  }, [analyses, history.items])
+  // Uploads made on this page are newer than the counted first page.
+  const historyCount = (history.first.total ?? history.items.length) + analyses.length
 
   const latestScore = currentAnalysis?.score ?? (allAnalyses.length > 0 ? allAnalyses[0].score : null)
 
@@ -892,14 +899,14 @@ export default function GuildHall() {
           </AnimatePresence>
 
           {/* Analysis History */}
-          {!analysesLoading && allAnalyses.length > 0 && (
+          {!history.loading && allAnalyses.length > 0 && (
             <motion.div variants={item}>
               <button
                 onClick={() => setShowHistory(!showHistory)}
                 className="mb-2 flex w-full items-center justify-between text-left"
               >
                 <p className="font-heading text-[10px] tracking-[0.3em] text-text-muted uppercase">
-                  {t('guild.analysis.history', { count: allAnalyses.length })}
+                  {t('guild.analysis.history', { count: historyCount })}
                 </p>
                 <motion.div
                   animate={{ rotate: showHistory ? 180 : 0 }}
@@ -937,6 +944,15 @@ export default function GuildHall() {
                         )
                       })}
                     </div>
+                    {history.hasMore && (
+                      <button
+                        onClick={history.loadMore}
+                        disabled={history.loadingMore}
+                        className="mt-2 w-full rounded-lg border border-border-subtle/20 px-3 py-2 text-[10px] tracking-widest text-text-muted uppercase transition-colors hover:text-accent-gold disabled:opacity-40"
+                      >
+                        {t('guild.analysis.loadMore')}
+                      </button>
+                    )}
                   </motion.div>
                 )}
               </AnimatePresence>
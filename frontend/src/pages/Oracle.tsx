@@ -67,7 +67,7 @@ const FALLBACK_STATS: OracleStatsResponse = {
 }
 
 const FALLBACK_HISTORY: OracleHistoryResponse = {
-  messages: [], total: 0, has_more: false,
+  messages: [], next_cursor: null, has_more: false, total: null,
 }
 
 const FALLBACK_WEEKLY: OracleWeeklySummaryResponse = {
@@ -200,7 +200,7 @@ export default function Oracle() {
     () => api.getOracleStats(), FALLBACK_STATS,
   )
   const { data: history } = useAPI<OracleHistoryResponse>(
-    () => api.getOracleHistory(100, 0), FALLBACK_HISTORY,
+    () => api.getOracleHistory(100), FALLBACK_HISTORY,
   )
   const { data: weekly } = useAPI<OracleWeeklySummaryResponse>(
     () => api.getOracleWeeklySummary(), FALLBACK_WEEKLY,
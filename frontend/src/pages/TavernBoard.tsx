@@ -15,8 +15,9 @@ import {
 import PageHeader from '../components/ui/PageHeader'
 import GlassCard from '../components/ui/GlassCard'
 import AnimatedCounter from '../components/ui/AnimatedCounter'
-import { api, type BlogPostData } from '../services/api'
+import { api, type BlogPostData, type BlogPostSummary, type BlogPostsResponse } from '../services/api'
 import { useAPI } from '../hooks/useAPI'
+import { useCursorFeed } from '../hooks/useCursorFeed'
 import { SOCIAL_LINKS, type SocialLinkName } from '../config/socialLinks'
 
 // ─── Fallback Data ──────────────────────────────────────────────────────
@@ -67,6 +68,20 @@ const FALLBACK_POSTS: BlogPostData[] = [
   },
 ]
 
+// The list endpoint sends excerpts; full content is fetched when a post is expanded.
+const FALLBACK_SUMMARIES: BlogPostSummary[] = FALLBACK_POSTS.map(({ content, ...post }) => {
+  const text = content.replace(/[#*\-[\]]/g, '').replace(/\s+/g, ' ').trim()
+  return { ...post, excerpt: text.length > 200 ? `${text.slice(0, 200).trimEnd()}…` : text }
+})
+
+const POSTS_PAGE_SIZE = 20
+
+function fallbackPage(posts: BlogPostSummary[]): BlogPostsResponse {
+  return { posts, total: posts.length, next_cursor: null, has_more: false }
+}
+
+const postsOf = (page: BlogPostsResponse) => page.posts
+
 // ─── Animation Variants ─────────────────────────────────────────────────
 const containerVariants = {
   hidden: { opacity: 0 },
@@ -132,6 +147,14 @@ function renderMarkdown(text: string): string {
     .replace(/\n/g, '<br/>')
 }
 
+// Styles the server-rendered post HTML like renderMarkdown's output.
+const POST_BODY_CLASSES = [
+  '[&_h3]:mt-4 [&_h3]:mb-2 [&_h3]:font-heading [&_h3]:text-base [&_h3]:text-text-primary',
+  '[&_h4]:mt-3 [&_h4]:mb-1 [&_h4]:font-heading [&_h4]:text-sm [&_h4]:text-text-primary',
+  '[&_strong]:font-semibold [&_strong]:text-text-primary [&_p]:mb-2 [&_a]:text-accent-purple',
+  '[&_ul]:ml-4 [&_ul]:list-disc [&_ol]:ml-4 [&_ol]:list-decimal [&_code]:text-accent-gold',
+].join(' ')
+
 // ─── SVG Icons ──────────────────────────────────────────────────────────
 function IconPosts({ color = '#f0c040' }: { color?: string }) {
   return (
@@ -172,12 +195,12 @@ function IconLatest({ color = '#22c55e' }: { color?: string }) {
 
 // ─── Stats Bar ──────────────────────────────────────────────────────────
 
-function TavernStatsBar({ posts }: { posts: BlogPostData[] }) {
+function TavernStatsBar({ posts, total }: { posts: BlogPostSummary[]; total: number }) {
   const ref = useRef<HTMLDivElement>(null)
   const isInView = useInView(ref, { once: true })
   const { t, i18n } = useTranslation()
 
-  const totalPosts = posts.length
+  const totalPosts = total
   const pinnedCount = posts.filter((p) => p.pinned).length
   const categories = new Set(posts.map((p) => p.category)).size
   const latestDate = posts.length > 0
@@ -297,12 +320,26 @@ function CategoryFilters({
 function PostCard({
   post,
 }: {
-  post: BlogPostData
+  post: BlogPostSummary
 }) {
   const { t } = useTranslation()
   const ref = useRef<HTMLDivElement>(null)
   const isInView = useInView(ref, { once: true, margin: '-40px' })
   const [expanded, setExpanded] = useState(false)
+  const [bodyHtml, setBodyHtml] = useState<string | null>(null)
+
+  const expand = () => {
+    setExpanded(true)
+    if (bodyHtml !== null) return
+    api.getBlogPost(post.id).then((full) => {
+      if (full?.content_html) {
+        setBodyHtml(full.content_html)
+        return
+      }
+      const content = full?.content ?? FALLBACK_POSTS.find((p) => p.id === post.id)?.content ?? post.excerpt
+      setBodyHtml(renderMarkdown(content))
+    })
+  }
 
   const tags = post.tags ? post.tags.split(',').map((t) => t.trim()).filter(Boolean) : []
   const date = new Date(post.created_at).toLocaleDateString('en-US', {
@@ -353,22 +390,22 @@ function PostCard({
         {/* Title */}
         <h3
           className="mb-2 cursor-pointer font-heading text-base tracking-wide text-text-primary transition-colors hover:text-accent-gold"
-          onClick={() => setExpanded(!expanded)}
+          onClick={() => (expanded ? setExpanded(false) : expand())}
         >
           {post.title}
         </h3>
 
         {/* Content */}
         <div
-          className={`text-xs leading-relaxed text-text-secondary ${!expanded ? 'line-clamp-3' : ''}`}
-          onClick={() => !expanded && setExpanded(true)}
+          className={`text-xs leading-relaxed text-text-secondary ${POST_BODY_CLASSES} ${!expanded ? 'line-clamp-3' : ''}`}
+          onClick={() => !expanded && expand()}
           style={{ cursor: !expanded ? 'pointer' : undefined }}
-          dangerouslySetInnerHTML={{ __html: renderMarkdown(expanded ? post.content : post.content.slice(0, 200)) }}
+          dangerouslySetInnerHTML={{ __html: expanded && bodyHtml !== null ? bodyHtml : renderMarkdown(post.excerpt) }}
         />
 
-        {!expanded && post.content.length > 200 && (
+        {!expanded && post.excerpt.endsWith('…') && (
           <button
-            onClick={() => setExpanded(true)}
+            onClick={expand}
             className="mt-1 text-[11px] font-medium text-accent-purple hover:text-accent-purple/80"
           >
             {t('tavern.readMore')}
@@ -458,7 +495,7 @@ function SocialLinksPanel() {
 
 // ─── Tag Cloud ──────────────────────────────────────────────────────────
 
-function TagCloud({ posts }: { posts: BlogPostData[] }) {
+function TagCloud({ posts }: { posts: BlogPostSummary[] }) {
   const { t } = useTranslation()
   const ref = useRef<HTMLDivElement>(null)
   const isInView = useInView(ref, { once: true, margin: '-30px' })
@@ -513,7 +550,7 @@ function TagCloud({ posts }: { posts: BlogPostData[] }) {
 
 // ─── Pinned Post Highlight ──────────────────────────────────────────────
 
-function PinnedHighlight({ post }: { post: BlogPostData | undefined }) {
+function PinnedHighlight({ post }: { post: BlogPostSummary | undefined }) {
   const { t } = useTranslation()
   const ref = useRef<HTMLDivElement>(null)
   const isInView = useInView(ref, { once: true, margin: '-30px' })
@@ -548,7 +585,7 @@ function PinnedHighlight({ post }: { post: BlogPostData | undefined }) {
         </div>
         <h4 className="mb-2 font-heading text-sm tracking-wide text-text-primary">{post.title}</h4>
         <p className="line-clamp-4 text-xs leading-relaxed text-text-secondary">
-          {post.content.replace(/[#*\-[\]]/g, '').slice(0, 150)}...
+          {post.excerpt}
         </p>
         <p className="mt-2 text-[10px] text-text-muted">
           {new Date(post.created_at).toLocaleDateString('en-US', { month: 'long', day: 'numeric', year: 'numeric' })}
@@ -562,24 +599,27 @@ function PinnedHighlight({ post }: { post: BlogPostData | undefined }) {
 
 export default function TavernBoard() {
   const { t } = useTranslation()
-  const { data, loading } = useAPI(
-    () => api.getBlogPosts(),
-    { posts: FALLBACK_POSTS, total: FALLBACK_POSTS.length }
-  )
+  // Unfiltered first page: the stats bar and sidebar summarize the whole board.
+  const { data } = useAPI(() => api.getBlogPosts(POSTS_PAGE_SIZE), fallbackPage(FALLBACK_SUMMARIES))
 
   const [activeCategory, setActiveCategory] = useState<CategoryKey>('all')
   const posts = data.posts
 
-  const filteredPosts = useMemo(() => {
-    let result = posts
-    if (activeCategory !== 'all') {
-      result = result.filter((p) => p.category === activeCategory)
-    }
-    return [...result].sort((a, b) => {
-      if (a.pinned !== b.pinned) return a.pinned ? -1 : 1
-      return b.created_at.localeCompare(a.created_at)
-    })
-  }, [posts, activeCategory])
+  // The feed is filtered by the server and arrives pinned first, then newest.
+  const feedFallback = useMemo(
+    () => fallbackPage(
+      activeCategory === 'all' ? FALLBACK_SUMMARIES : FALLBACK_SUMMARIES.filter((p) => p.category === activeCategory),
+    ),
+    [activeCategory],
+  )
+  const feed = useCursorFeed(
+    activeCategory,
+    (cursor) => api.getBlogPosts(POSTS_PAGE_SIZE, cursor, activeCategory === 'all' ? undefined : activeCategory),
+    postsOf,
+    feedFallback,
+  )
+  const feedPosts = feed.items
+  const loading = feed.loading
 
   const pinnedPost = useMemo(() => posts.find((p) => p.pinned), [posts])
 
@@ -593,7 +633,7 @@ export default function TavernBoard() {
       />
 
       {/* Stats Bar */}
-      <TavernStatsBar posts={posts} />
+      <TavernStatsBar posts={posts} total={data.total ?? posts.length} />
 
       {/* Category Filters */}
       <motion.div variants={itemVariants} className="mb-6 flex flex-wrap items-center gap-3">
@@ -604,7 +644,7 @@ export default function TavernBoard() {
       <div className="grid gap-6 md:gap-8 md:grid-cols-3 lg:grid-cols-5">
         {/* Posts feed */}
         <div className="space-y-4 md:col-span-2 lg:col-span-3">
-          {loading && posts.length === 0 && (
+          {loading && (
             <div className="py-16 text-center">
               <div className="mx-auto mb-3 h-8 w-8 animate-spin rounded-full border-2 border-accent-purple/30 border-t-accent-purple" />
               <p className="text-sm text-text-muted">{t('tavern.loadingPosts')}</p>
@@ -612,7 +652,7 @@ export default function TavernBoard() {
           )}
 
           <AnimatePresence mode="popLayout">
-            {filteredPosts.map((post) => (
+            {feedPosts.map((post) => (
               <PostCard
                 key={post.id}
                 post={post}
@@ -620,7 +660,7 @@ export default function TavernBoard() {
             ))}
           </AnimatePresence>
 
-          {filteredPosts.length === 0 && !loading && (
+          {feedPosts.length === 0 && !loading && (
             <motion.div
               initial={{ opacity: 0 }}
               animate={{ opacity: 1 }}
@@ -630,6 +670,16 @@ export default function TavernBoard() {
               <p className="text-sm text-text-muted">{t('tavern.noPostsCategory')}</p>
             </motion.div>
           )}
+
+          {feed.hasMore && (
+            <button
+              onClick={feed.loadMore}
+              disabled={feed.loadingMore}
+              className="w-full rounded-full border border-accent-purple/30 px-4 py-2 text-xs font-medium tracking-wide text-text-secondary transition-colors hover:border-accent-purple/60 hover:text-accent-purple disabled:opacity-40"
+            >
+              {feed.loadingMore ? t('tavern.loadingPosts') : t('tavern.loadMore')}
+            </button>
+          )}
         </div>
 
         {/* Sidebar */}
@@ -204,14 +204,27 @@ export interface CVAnalysisResponse {
   gamification?: GamificationEvent
 }
 
+export interface CVAnalysisSummary {
+  id: number
+  filename: string
+  score: number
+  created_at: string
+}
+
 export interface CVAnalysesResponse {
-  analyses: CVAnalysisResponse[]
+  analyses: CVAnalysisSummary[]
+  next_cursor: string | null
+  has_more: boolean
+  /** All of the player's analyses; only sent when requested with `includeTotal`. */
+  total?: number | null
 }
 
 export type UploadCVResult =
   | { ok: true; data: CVAnalysisResponse }
   | { ok: false; message: string; status?: number }
 
+export type RPGCVExportFormat = 'pdf' | 'html' | 'markdown'
+
 export type DownloadRPGCVResult =
   | { ok: true; blob: Blob; filename: string }
   | { ok: false; message: string; status?: number }
@@ -262,11 +275,19 @@ export interface BlogPostData {
   pinned: boolean
   created_at: string
   updated_at: string
+  /** Sanitized HTML rendered by the server when the post was saved. */
+  content_html?: string
+}
+
+export type BlogPostSummary = Omit<BlogPostData, 'content' | 'content_html'> & {
+  excerpt: string
 }
 
 export interface BlogPostsResponse {
-  posts: BlogPostData[]
-  total: number
+  posts: BlogPostSummary[]
+  total: number | null
+  next_cursor: string | null
+  has_more: boolean
 }
 
 export interface BlogPostCreate {
@@ -287,8 +308,9 @@ export interface OracleMessage {
 
 export interface OracleHistoryResponse {
   messages: OracleMessage[]
-  total: number
+  next_cursor: string | null
   has_more: boolean
+  total: number | null
 }
 
 export interface OracleStatsResponse {
@@ -365,9 +387,9 @@ export const api = {
       return { ok: false, message: 'Network error while uploading CV.' }
     }
   },
-  downloadRPGCV: async (): Promise<DownloadRPGCVResult> => {
+  downloadRPGCV: async (format: RPGCVExportFormat = 'pdf'): Promise<DownloadRPGCVResult> => {
     try {
-      const resp = await fetch(`${API_BASE}/cv/download-rpg`, {
+      const resp = await fetch(`${API_BASE}/cv/download-rpg?format=${format}`, {
         method: 'GET',
         credentials: 'include',
       })
@@ -379,14 +401,18 @@ export const api = {
         }
       }
       const blob = await resp.blob()
-      const filename = extractFilename(resp.headers.get('Content-Disposition'), 'rpg-cv.pdf')
+      const filename = extractFilename(resp.headers.get('Content-Disposition'), `rpg-cv.${format === 'markdown' ? 'md' : format}`)
       return { ok: true, blob, filename }
     } catch {
       return { ok: false, message: 'Network error while downloading RPG CV.' }
     }
   },
   getAnalysis: () => fetchAPI<CVAnalysisResponse>('/cv/analysis'),
-  getCVAnalyses: () => fetchAPI<CVAnalysesResponse>('/cv/analyses'),
+  getCVAnalyses: (limit = 20, cursor?: string | null, includeTotal = false) =>
+    fetchAPI<CVAnalysesResponse>(
+      `/cv/analyses?limit=${limit}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}${includeTotal ? '&include_total=true' : ''}`,
+    ),
+  getCVAnalysis: (id: number) => fetchAPI<CVAnalysisResponse>(`/cv/analyses/${id}`),
 
   // Oracle
   chat: (message: string) =>
@@ -394,13 +420,18 @@ export const api = {
       method: 'POST',
       body: JSON.stringify({ message }),
     }),
-  getOracleHistory: (limit = 50, offset = 0) =>
-    fetchAPI<OracleHistoryResponse>(`/oracle/history?limit=${limit}&offset=${offset}`),
+  getOracleHistory: (limit = 50, cursor?: string | null) =>
+    fetchAPI<OracleHistoryResponse>(
+      `/oracle/history?limit=${limit}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`,
+    ),
   getOracleStats: () => fetchAPI<OracleStatsResponse>('/oracle/stats'),
   getOracleWeeklySummary: () => fetchAPI<OracleWeeklySummaryResponse>('/oracle/weekly-summary'),
 
   // Blog
-  getBlogPosts: () => fetchAPI<BlogPostsResponse>('/blog/posts'),
+  getBlogPosts: (limit = 20, cursor?: string | null, category?: string) =>
+    fetchAPI<BlogPostsResponse>(
+      `/blog/posts?limit=${limit}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}${category ? `&category=${encodeURIComponent(category)}` : ''}`,
+    ),
   getBlogPost: (id: number) => fetchAPI<BlogPostData>(`/blog/posts/${id}`),
   createBlogPost: (data: BlogPostCreate) =>
     fetchAPI<BlogPostData>('/blog/posts', { method: 'POST', body: JSON.stringify(data) }),